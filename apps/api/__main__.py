@@ -0,0 +1,76 @@
+"""Production entry point: `python -m apps.api`.
+
+Codifies how the API should be served:
+- one worker process per CPU core (async workers don't need the 2n+1 rule
+  used for sync servers; each one already multiplexes many connections)
+- uvloop event loop and httptools HTTP parser (both C, both installed
+  with the API) instead of the pure-Python asyncio loop and h11
+- each worker has its own connection pool, so DB_POOL_SIZE and
+  DB_MAX_OVERFLOW are scaled down until all workers together fit in
+  DB_MAX_CONNECTIONS
+
+For local development keep using `uvicorn apps.api.main:app --reload`.
+"""
+
+import logging
+import os
+
+import uvicorn
+
+from apps.api.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_pool_limits(workers: int) -> tuple[int, int]:
+    """Per-worker (pool_size, max_overflow) that keep `workers` pools within the budget.
+
+    Both are shrunk in proportion, but each worker keeps at least one
+    persistent connection.
+    """
+    pool_size, max_overflow = settings.db_pool_size, settings.db_max_overflow
+    per_worker = settings.db_max_connections // workers
+    if pool_size + max_overflow <= per_worker:
+        return pool_size, max_overflow
+    scaled_pool = max(1, per_worker * pool_size // (pool_size + max_overflow))
+    return scaled_pool, max(0, per_worker - scaled_pool)
+
+
+def main() -> None:
+    workers = settings.workers or os.cpu_count() or 1
+    if workers == 1 and not settings.debug:
+        logger.warning(
+            "Serving with a single worker process — requests won't scale past one core. "
+            "Set WORKERS to the number of cores available to this container."
+        )
+
+    # Every worker has its own pool, so the database sees them all at once.
+    # Workers are spawned processes that read settings from the environment.
+    pool_size, max_overflow = _worker_pool_limits(workers)
+    if (pool_size, max_overflow) != (settings.db_pool_size, settings.db_max_overflow):
+        logger.info(
+            "%d workers within DB_MAX_CONNECTIONS %d: pool_size %d + max_overflow %d per worker",
+            workers, settings.db_max_connections, pool_size, max_overflow,
+        )
+    if workers > settings.db_max_connections:
+        logger.warning(
+            "%d workers need at least one connection each, more than DB_MAX_CONNECTIONS %d; "
+            "lower WORKERS or put PgBouncer in front of Postgres.",
+            workers, settings.db_max_connections,
+        )
+    os.environ["DB_POOL_SIZE"] = str(pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(max_overflow)
+
+    uvicorn.run(
+        "apps.api.main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=5,
+    )
+
+
+if __name__ == "__main__":
+    main()
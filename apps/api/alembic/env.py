@@ -4,15 +4,18 @@ This file tells Alembic:
 1. How to connect to the database
 2. Where to find your models (so it can auto-detect changes)
 3. How to run migrations (sync vs async)
+
+The app talks to Postgres through asyncpg, but migrations don't need an
+event loop: running them through asyncpg only adds asyncio plumbing and
+asyncpg's type-introspection queries on connect. So migrations use the
+sync psycopg driver against the same database.
 """
 
-import asyncio
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import engine_from_config, pool
 from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import async_engine_from_config
 
 # Import our app config to get the database URL
 from apps.api.config import settings
@@ -47,8 +50,11 @@ target_metadata = Base.metadata
 
 
 def get_url() -> str:
-    """Get database URL from our app settings."""
-    return settings.database_url
+    """Get database URL from our app settings, rewritten for the sync psycopg driver.
+
+    "postgresql+asyncpg://..." → "postgresql+psycopg://..."
+    """
+    return settings.database_url.replace("+asyncpg", "+psycopg", 1)
 
 
 def run_migrations_offline() -> None:
@@ -80,30 +86,25 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
-async def run_async_migrations() -> None:
-    """Run migrations in 'online' mode with async engine.
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode with a sync psycopg engine.
 
-    We use asyncpg (async Postgres driver), so we need an async
-    engine here. This connects to the real database and applies changes.
+    This connects to the real database and applies changes.
     """
     configuration = config.get_section(config.config_ini_section, {})
     configuration["sqlalchemy.url"] = get_url()
 
-    connectable = async_engine_from_config(
+    connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,  # Don't use connection pooling for migrations
+        connect_args={"options": "-c jit=off"},  # DDL gains nothing from JIT
     )
 
-    async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
+    with connectable.connect() as connection:
+        do_run_migrations(connection)
 
-    await connectable.dispose()
-
-
-def run_migrations_online() -> None:
-    """Entry point for online migrations — wraps the async function."""
-    asyncio.run(run_async_migrations())
+    connectable.dispose()
 
 
 # Decide which mode to run based on whether we're generating SQL or applying it
@@ -10,6 +10,7 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID, JSONB
+from pgvector.sqlalchemy import HALFVEC
 
 
 # revision identifiers, used by Alembic.
@@ -29,7 +30,7 @@ def upgrade() -> None:
         "embeddings",
         sa.Column("id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
         
         # Content metadata
         sa.Column("content", sa.Text, nullable=False),
@@ -38,17 +39,17 @@ def upgrade() -> None:
         sa.Column("metadata", JSONB, nullable=True),  # Additional context
         
         # Embedding vector (1536 dimensions for OpenAI text-embedding-3-small)
-        # Using pgvector's 'vector' type
-        sa.Column("embedding", sa.Text, nullable=False),  # Will be cast to vector(1536) via raw SQL
+        # Using pgvector's 'halfvec' type (FP16) — half the bytes of 'vector' per row.
+        # Similarity search is memory-bound, so storing FP16 halves the bytes read per
+        # distance computation with negligible recall loss at 1536 dims. Requires
+        # pgvector >= 0.7.0. Declared directly so no table rewrite is needed afterwards.
+        sa.Column("embedding", HALFVEC(1536), nullable=False),
         
         # Optional foreign keys
         sa.Column("project_id", UUID(as_uuid=True), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=True),
         sa.Column("incident_id", UUID(as_uuid=True), sa.ForeignKey("incidents.id", ondelete="CASCADE"), nullable=True),
     )
     
-    # Manually set the embedding column to vector type (Alembic doesn't support it directly)
-    op.execute("ALTER TABLE embeddings ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)")
-    
     # Create indexes for efficient similarity search
     op.create_index(
         "ix_embeddings_content_type",
@@ -62,10 +63,16 @@ def upgrade() -> None:
     )
     
     # Create HNSW index for fast approximate nearest neighbor search
-    # HNSW (Hierarchical Navigable Small World) is faster than IVFFlat for most use cases
+    # HNSW (Hierarchical Navigable Small World) is faster than IVFFlat for most use cases.
+    # pgvector defaults (m=16, ef_construction=64) are tuned for small corpora; a denser
+    # graph gives better recall/QPS once RAG corpora reach 100K+ chunks.
+    # SET LOCAL keeps the build settings scoped to this migration's transaction.
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 7")
     op.execute(
         "CREATE INDEX embeddings_embedding_idx ON embeddings "
-        "USING hnsw (embedding vector_cosine_ops)"
+        "USING hnsw (embedding halfvec_cosine_ops) "
+        "WITH (m = 24, ef_construction = 128)"
     )
 
 
@@ -0,0 +1,58 @@
+"""set updated_at with a trigger
+
+Revision ID: 7c2e5d1a9b30
+Revises: d0d85b4df7e2
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e5d1a9b30"
+down_revision: Union[str, Sequence[str], None] = "d0d85b4df7e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every table built on BaseModel (they all carry updated_at)
+TABLES = (
+    "users",
+    "audit_logs",
+    "projects",
+    "deployments",
+    "incidents",
+    "sandboxes",
+    "chat_sessions",
+    "diagnoses",
+    "remediations",
+    "chat_messages",
+    "embeddings",
+)
+
+
+def upgrade() -> None:
+    """Keep updated_at current on the server instead of in every ORM UPDATE."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    """Drop the updated_at triggers and their function."""
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,37 @@
+"""add audit log indexes
+
+Revision ID: a41e6c0d8f12
+Revises: 7c2e5d1a9b30
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a41e6c0d8f12"
+down_revision: Union[str, Sequence[str], None] = "7c2e5d1a9b30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index audit logs by resource and by user, both ordered by time."""
+    op.create_index(
+        "ix_audit_logs_resource",
+        "audit_logs",
+        ["resource_type", "resource_id", "created_at"],
+    )
+    op.create_index(
+        "ix_audit_logs_user_created",
+        "audit_logs",
+        ["user_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the audit log indexes."""
+    op.drop_index("ix_audit_logs_user_created", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_resource", table_name="audit_logs")
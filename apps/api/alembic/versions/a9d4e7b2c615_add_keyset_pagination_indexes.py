@@ -0,0 +1,43 @@
+"""add keyset pagination indexes
+
+Revision ID: a9d4e7b2c615
+Revises: f2c8d6e0b384
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9d4e7b2c615"
+down_revision: Union[str, Sequence[str], None] = "f2c8d6e0b384"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index each list endpoint's filter + (created_at, id) keyset."""
+    op.create_index(
+        "ix_projects_owner_keyset",
+        "projects",
+        ["owner_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_incidents_project_keyset",
+        "incidents",
+        ["project_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_remediations_status_keyset",
+        "remediations",
+        ["status", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    op.drop_index("ix_remediations_status_keyset", table_name="remediations")
+    op.drop_index("ix_incidents_project_keyset", table_name="incidents")
+    op.drop_index("ix_projects_owner_keyset", table_name="projects")
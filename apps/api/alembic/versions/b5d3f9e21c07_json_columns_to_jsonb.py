@@ -0,0 +1,56 @@
+"""json columns to jsonb
+
+Revision ID: b5d3f9e21c07
+Revises: a41e6c0d8f12
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d3f9e21c07"
+down_revision: Union[str, Sequence[str], None] = "a41e6c0d8f12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table → JSON columns stored as binary JSONB from now on
+COLUMNS = {
+    "audit_logs": ["details"],
+    "chat_messages": ["tool_calls", "files_modified"],
+    "deployments": ["resource_usage"],
+    "incidents": ["alert_data"],
+    "diagnoses": ["evidence", "affected_components", "suggested_actions"],
+    "remediations": ["files_changed"],
+    "projects": ["monitoring_config"],
+}
+
+
+def upgrade() -> None:
+    """Convert JSON columns to JSONB and index incident alerts for containment."""
+    for table, columns in COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb" for column in columns
+        )
+        # One ALTER per table so each table is rewritten once
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+    op.create_index(
+        "ix_incidents_alert_gin",
+        "incidents",
+        ["alert_data"],
+        postgresql_using="gin",
+        postgresql_ops={"alert_data": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Convert the JSONB columns back to JSON."""
+    op.drop_index("ix_incidents_alert_gin", table_name="incidents")
+    for table, columns in COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {column} TYPE json USING {column}::json" for column in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
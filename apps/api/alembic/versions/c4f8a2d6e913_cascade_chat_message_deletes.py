@@ -0,0 +1,42 @@
+"""cascade chat message deletes
+
+Revision ID: c4f8a2d6e913
+Revises: a9d4e7b2c615
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f8a2d6e913"
+down_revision: Union[str, Sequence[str], None] = "a9d4e7b2c615"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Delete a session's messages in the same statement as the session."""
+    op.drop_constraint("chat_messages_session_id_fkey", "chat_messages", type_="foreignkey")
+    op.create_foreign_key(
+        "chat_messages_session_id_fkey",
+        "chat_messages",
+        "chat_sessions",
+        ["session_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    """Restore the plain session_id foreign key."""
+    op.drop_constraint("chat_messages_session_id_fkey", "chat_messages", type_="foreignkey")
+    op.create_foreign_key(
+        "chat_messages_session_id_fkey",
+        "chat_messages",
+        "chat_sessions",
+        ["session_id"],
+        ["id"],
+    )
@@ -0,0 +1,35 @@
+"""add knowledge hnsw index
+
+Revision ID: c8e2a4b6d913
+Revises: b5d3f9e21c07
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e2a4b6d913"
+down_revision: Union[str, Sequence[str], None] = "b5d3f9e21c07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Partial HNSW index for the runbook + incident searches made during RCA."""
+    # Same build settings as the full index (see 626926e59353)
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 7")
+    op.execute(
+        "CREATE INDEX ix_embeddings_knowledge_hnsw ON embeddings "
+        "USING hnsw (embedding halfvec_cosine_ops) "
+        "WITH (m = 24, ef_construction = 128) "
+        "WHERE content_type IN ('runbook', 'incident')"
+    )
+
+
+def downgrade() -> None:
+    """Drop the partial HNSW index."""
+    op.drop_index("ix_embeddings_knowledge_hnsw", table_name="embeddings")
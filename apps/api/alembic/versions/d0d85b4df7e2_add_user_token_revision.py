@@ -0,0 +1,31 @@
+"""add user token revision
+
+Revision ID: d0d85b4df7e2
+Revises: 6b8a1f7f1d2b
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d0d85b4df7e2"
+down_revision: Union[str, Sequence[str], None] = "6b8a1f7f1d2b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the token revision embedded in JWTs (bumped to revoke tokens)."""
+    op.add_column(
+        "users",
+        sa.Column("token_revision", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Remove the token revision column."""
+    op.drop_column("users", "token_revision")
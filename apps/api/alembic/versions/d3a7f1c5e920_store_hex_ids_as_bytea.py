@@ -0,0 +1,39 @@
+"""store hex ids as bytea
+
+Revision ID: d3a7f1c5e920
+Revises: c8e2a4b6d913
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a7f1c5e920"
+down_revision: Union[str, Sequence[str], None] = "c8e2a4b6d913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store commit SHAs and container IDs as raw bytes instead of hex text."""
+    op.execute(
+        "ALTER TABLE deployments ALTER COLUMN commit_sha TYPE bytea USING decode(commit_sha, 'hex')"
+    )
+    op.execute(
+        "ALTER TABLE sandboxes ALTER COLUMN container_id TYPE bytea USING decode(container_id, 'hex')"
+    )
+    op.create_index("ix_deployments_commit_sha", "deployments", ["commit_sha"])
+
+
+def downgrade() -> None:
+    """Store commit SHAs and container IDs as hex text again."""
+    op.drop_index("ix_deployments_commit_sha", table_name="deployments")
+    op.execute(
+        "ALTER TABLE sandboxes ALTER COLUMN container_id TYPE varchar(100) USING encode(container_id, 'hex')"
+    )
+    op.execute(
+        "ALTER TABLE deployments ALTER COLUMN commit_sha TYPE varchar(40) USING encode(commit_sha, 'hex')"
+    )
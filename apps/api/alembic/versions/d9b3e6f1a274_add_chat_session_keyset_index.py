@@ -0,0 +1,31 @@
+"""add chat session keyset index
+
+Revision ID: d9b3e6f1a274
+Revises: c4f8a2d6e913
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d9b3e6f1a274"
+down_revision: Union[str, Sequence[str], None] = "c4f8a2d6e913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index a sandbox's chat sessions by the (created_at, id) keyset."""
+    op.create_index(
+        "ix_chat_sessions_sandbox_keyset",
+        "chat_sessions",
+        ["sandbox_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the chat session keyset index."""
+    op.drop_index("ix_chat_sessions_sandbox_keyset", table_name="chat_sessions")
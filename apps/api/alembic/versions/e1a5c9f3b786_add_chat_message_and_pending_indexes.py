@@ -0,0 +1,45 @@
+"""add chat message and pending remediation indexes
+
+Revision ID: e1a5c9f3b786
+Revises: d9b3e6f1a274
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a5c9f3b786"
+down_revision: Union[str, Sequence[str], None] = "d9b3e6f1a274"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index chat history reads and narrow the remediation keyset to pending rows."""
+    op.create_index(
+        "ix_chat_messages_session_created",
+        "chat_messages",
+        ["session_id", "created_at"],
+    )
+    op.create_index(
+        "ix_remediations_pending_keyset",
+        "remediations",
+        ["created_at", "id"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+    op.drop_index("ix_remediations_status_keyset", table_name="remediations")
+
+
+def downgrade() -> None:
+    """Restore the full remediation keyset index and drop the new ones."""
+    op.create_index(
+        "ix_remediations_status_keyset",
+        "remediations",
+        ["status", "created_at", "id"],
+    )
+    op.drop_index("ix_remediations_pending_keyset", table_name="remediations")
+    op.drop_index("ix_chat_messages_session_created", table_name="chat_messages")
@@ -0,0 +1,43 @@
+"""drop redundant id indexes
+
+Revision ID: e6b9c2d4a157
+Revises: d3a7f1c5e920
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b9c2d4a157"
+down_revision: Union[str, Sequence[str], None] = "d3a7f1c5e920"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose id had a plain index on top of the primary key's unique index
+TABLES = (
+    "users",
+    "audit_logs",
+    "projects",
+    "deployments",
+    "incidents",
+    "sandboxes",
+    "chat_sessions",
+    "diagnoses",
+    "remediations",
+    "chat_messages",
+)
+
+
+def upgrade() -> None:
+    """Drop the ix_<table>_id indexes that duplicate each <table>_pkey."""
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_id", table_name=table)
+
+
+def downgrade() -> None:
+    """Recreate the duplicate id indexes."""
+    for table in TABLES:
+        op.create_index(f"ix_{table}_id", table, ["id"], unique=False)
@@ -0,0 +1,52 @@
+"""add created_at brin indexes
+
+Revision ID: f2c8d6e0b384
+Revises: e6b9c2d4a157
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c8d6e0b384"
+down_revision: Union[str, Sequence[str], None] = "e6b9c2d4a157"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every table built on BaseModel
+TABLES = (
+    "users",
+    "audit_logs",
+    "projects",
+    "deployments",
+    "incidents",
+    "sandboxes",
+    "chat_sessions",
+    "diagnoses",
+    "remediations",
+    "chat_messages",
+    "embeddings",
+)
+
+
+def upgrade() -> None:
+    """BRIN-index created_at and stamp it per statement instead of per transaction."""
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT statement_timestamp()")
+        op.create_index(
+            f"ix_{table}_created_brin",
+            table,
+            ["created_at"],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        )
+
+
+def downgrade() -> None:
+    """Drop the BRIN indexes and restore the now() default."""
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_created_brin", table_name=table)
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT now()")
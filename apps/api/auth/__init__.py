@@ -5,15 +5,17 @@ Exports the key auth utilities so other modules can import cleanly:
 """
 
 from apps.api.auth.passwords import hash_password, verify_password
-from apps.api.auth.jwt import create_access_token, decode_access_token
-from apps.api.auth.dependencies import get_current_user, require_role, require_operator_or_admin, oauth2_scheme
+from apps.api.auth.jwt import TokenClaims, create_access_token, decode_access_token
+from apps.api.auth.dependencies import get_current_user, get_token_claims, require_role, require_operator_or_admin, oauth2_scheme
 
 __all__ = [
     "hash_password",
     "verify_password",
     "create_access_token",
     "decode_access_token",
+    "TokenClaims",
     "get_current_user",
+    "get_token_claims",
     "require_role",
     "require_operator_or_admin",
     "oauth2_scheme",
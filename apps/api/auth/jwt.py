@@ -9,21 +9,88 @@ How JWT auth works:
 
 The token contains the user's ID (encoded, not encrypted — anyone can
 read it, but they can't MODIFY it without the secret key).
+
+It also carries the user's role and token revision. The role lets role
+checks refuse other roles without a database lookup (see require_role).
+Every authenticated request compares the revision with the user's row,
+so bumping a user's token_revision invalidates every token issued before
+the bump. On each worker this takes effect once its cached user snapshot
+expires, or at once after POST /auth/cache/clear.
+
+Decoded tokens are cached in-process, keyed by the signature segment,
+so a client hammering the API with the same token pays for HMAC
+verification + JSON parsing once rather than on every request.
 """
 
-from datetime import datetime, timedelta, timezone
+import base64
+import hashlib
+import hmac
+import time
+from dataclasses import dataclass
 from uuid import UUID
 
-from jose import JWTError, jwt
+from cachetools import TTLCache
+import jwt
+import orjson
+from jwt import InvalidTokenError as JWTError
 
 from apps.api.config import settings
+from apps.api.models.user import User
+
+# Settings are fixed for the life of the process, so resolve them once
+# instead of on every token issued/verified.
+_SECRET_KEY = settings.jwt_secret_key
+_ALGORITHM = settings.jwt_algorithm
+_ALGORITHMS = [_ALGORITHM]
+_EXPIRES_IN = settings.jwt_expire_minutes * 60  # Convert minutes to seconds
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# HMAC algorithms are signed here directly: the header never changes, so
+# it's serialized once, and the keyed MAC state is built once and copied
+# per token — no per-call algorithm lookup, header JSON or key setup as
+# in jwt.encode(). Other algorithms still go through PyJWT.
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_SIGNING_MAC = (
+    hmac.new(_SECRET_KEY.encode(), digestmod=_HMAC_DIGESTS[_ALGORITHM])
+    if _ALGORITHM in _HMAC_DIGESTS
+    else None
+)
+_HEADER_B64 = _b64url(orjson.dumps({"alg": _ALGORITHM, "typ": "JWT"}))
+
+# We're the only issuer and audience, and never set nbf — skip those
+# validators, and refuse tokens that lack the claims we rely on.
+_DECODE_OPTIONS = {
+    "require": ["exp", "sub"],
+    "verify_aud": False,
+    "verify_iss": False,
+    "verify_nbf": False,
+}
 
 
-def create_access_token(user_id: UUID) -> tuple[str, int]:
+@dataclass(frozen=True, slots=True)
+class TokenClaims:
+    """The verified contents of an access token."""
+
+    user_id: UUID
+    role: str | None    # None for tokens issued before roles were embedded
+    revision: int       # Must match users.token_revision to be accepted
+    exp: float          # Expiry as a UNIX timestamp
+
+
+# signature segment → TokenClaims. The TTL bounds how long a cached entry
+# lives; the stored exp makes sure we never outlive the token.
+_decode_cache: TTLCache[str, TokenClaims] = TTLCache(maxsize=10_000, ttl=60)
+
+
+def create_access_token(user: User) -> tuple[str, int]:
     """Create a JWT token for a user.
 
     Args:
-        user_id: The user's UUID from the database
+        user: The User from the database
 
     Returns:
         Tuple of (token_string, expires_in_seconds)
@@ -31,41 +98,73 @@ def create_access_token(user_id: UUID) -> tuple[str, int]:
     The token payload looks like:
         {
             "sub": "550e8400-e29b-41d4-a716-446655440000",  # user ID
+            "role": "operator",                               # user role at issue time
+            "rev": 0,                                         # user's token revision
             "exp": 1700000000,                                # expiry timestamp
             "iat": 1699996400,                                # issued at
         }
     """
-    expires_in = settings.jwt_expire_minutes * 60  # Convert minutes to seconds
-    expire_at = datetime.now(timezone.utc) + timedelta(minutes=settings.jwt_expire_minutes)
+    # One clock read, as integer seconds — JWT's NumericDate format, so
+    # PyJWT doesn't have to convert datetimes on the way out.
+    now = int(time.time())
 
     payload = {
-        "sub": str(user_id),     # Subject — who this token belongs to
-        "exp": expire_at,        # Expiry — when this token becomes invalid
-        "iat": datetime.now(timezone.utc),  # Issued At — when this token was created
+        "sub": str(user.id),           # Subject — who this token belongs to
+        "role": getattr(user.role, "value", user.role),
+        "rev": user.token_revision or 0,
+        "exp": now + _EXPIRES_IN,      # Expiry — when this token becomes invalid
+        "iat": now,                    # Issued At — when this token was created
     }
 
-    token = jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
-    return token, expires_in
+    if _SIGNING_MAC is None:
+        return jwt.encode(payload, _SECRET_KEY, algorithm=_ALGORITHM), _EXPIRES_IN
+
+    signing_input = _HEADER_B64 + b"." + _b64url(orjson.dumps(payload))
+    mac = _SIGNING_MAC.copy()
+    mac.update(signing_input)
+    token = signing_input + b"." + _b64url(mac.digest())
+    return token.decode(), _EXPIRES_IN
 
 
-def decode_access_token(token: str) -> UUID | None:
-    """Decode a JWT token and extract the user ID.
+def decode_access_token(token: str) -> TokenClaims | None:
+    """Decode a JWT token and extract its claims.
 
     Args:
         token: The JWT string from the Authorization header
 
     Returns:
-        The user's UUID if valid, None if token is invalid/expired
+        The token's claims if valid, None if token is invalid/expired
 
     This is called on EVERY authenticated request to figure out
     who is making the request.
     """
+    # The signature covers header + payload, so it uniquely identifies the token
+    signature = token.rsplit(".", 1)[-1]
+    cached = _decode_cache.get(signature)
+    if cached is not None:
+        if cached.exp > time.time():
+            return cached
+        _decode_cache.pop(signature, None)
+        return None
+
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        user_id_str: str | None = payload.get("sub")
-        if user_id_str is None:
-            return None
-        return UUID(user_id_str)
-    except JWTError:
-        # Token is invalid, expired, or tampered with
-        return None
\ No newline at end of file
+        payload = jwt.decode(
+            token, _SECRET_KEY, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS, leeway=0
+        )
+        claims = TokenClaims(
+            user_id=UUID(payload["sub"]),
+            role=payload.get("role"),
+            revision=int(payload.get("rev", 0)),
+            exp=float(payload["exp"]),
+        )
+    except (JWTError, ValueError, TypeError):
+        # Token is invalid, expired, tampered with, or missing exp/sub
+        return None
+
+    _decode_cache[signature] = claims
+    return claims
+
+
+def clear_token_cache() -> None:
+    """Forget every cached decode, so each token is verified again on next use."""
+    _decode_cache.clear()
@@ -9,37 +9,64 @@ NEVER store plain-text passwords. Always hash them.
 
 Note: We use the 'bcrypt' library directly instead of 'passlib' because
 passlib is unmaintained and incompatible with bcrypt >= 4.1.
+
+Both functions are async: a 12-round bcrypt call burns ~250ms of CPU,
+which would stall every other request on the event loop. They run on a
+dedicated pool with one worker per CPU core — bcrypt's C extension
+releases the GIL, so the workers hash in parallel, and a burst of
+signups queues on this pool instead of starving the shared default
+executor that other asyncio.to_thread() callers rely on.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+# bcrypt work factor, pinned rather than left to the library default:
+# each +1 doubles the cost of every register/login
+_ROUNDS = 12
 
-def hash_password(plain_password: str) -> str:
-    """Hash a plain-text password.
+_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
 
-    Input:  "MySecret123"
-    Output: "$2b$12$LJ3m4ks..." (60-character hash string)
 
-    Used during: user registration
-    """
+def _hash_password_sync(plain_password: str) -> str:
     # bcrypt works with bytes, so we encode the string to UTF-8
     password_bytes = plain_password.encode("utf-8")
-    # gensalt() creates a random salt with 12 rounds (default)
+    # gensalt() creates a random salt with _ROUNDS rounds
     # More rounds = slower hashing = harder to brute-force
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     # Return as string for storage in the database
     return hashed.decode("utf-8")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Check if a plain-text password matches a stored hash.
+def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    password_bytes = plain_password.encode("utf-8")
+    hashed_bytes = hashed_password.encode("utf-8")
+    return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+
+async def hash_password(plain_password: str) -> str:
+    """Hash a plain-text password (off the event loop).
+
+    Input:  "MySecret123"
+    Output: "$2b$12$LJ3m4ks..." (60-character hash string)
+
+    Used during: user registration
+    """
+    return await asyncio.get_running_loop().run_in_executor(_POOL, _hash_password_sync, plain_password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Check if a plain-text password matches a stored hash (off the event loop).
 
     Input:  "MySecret123", "$2b$12$LJ3m4ks..."
     Output: True or False
 
     Used during: user login
     """
-    password_bytes = plain_password.encode("utf-8")
-    hashed_bytes = hashed_password.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
\ No newline at end of file
+    return await asyncio.get_running_loop().run_in_executor(
+        _POOL, _verify_password_sync, plain_password, hashed_password
+    )
@@ -0,0 +1,120 @@
+"""Batched, cached user lookups for authentication.
+
+get_current_user runs on every authenticated request, and every run used
+to cost a `SELECT ... FROM users WHERE id = :id`. Two things cut that down:
+
+1. A short-lived cross-request cache (UUID → detached User snapshot).
+   Hits are copied into the request's session with merge(load=False),
+   which emits no SQL, so each request still gets its own session-bound
+   User it can safely modify and commit.
+2. A per-session UserLoader that coalesces lookups issued in the same
+   event-loop tick into one `WHERE id IN (...)` query. get_db hands each
+   request one session, and UserLoader.for_session keeps one loader on
+   it, so every lookup a request makes goes through the same loader.
+
+Routes that change a user's row must call invalidate_user() so the next
+request doesn't see the stale snapshot.
+
+Combined with the JWT decode cache (keyed by token signature, bounded by
+the token's exp), a hot client authenticates with no SQL at all. The user
+cache is disabled in debug mode so local edits to users show up at once.
+"""
+
+import asyncio
+import uuid
+
+from cachetools import TTLCache
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from apps.api.config import settings
+from apps.api.models.user import User
+
+_CACHE_ENABLED = settings.auth_user_cache_seconds > 0 and not settings.debug
+
+# user_id → detached User snapshot (never attached to a request session)
+_user_cache: TTLCache[uuid.UUID, User] = TTLCache(
+    maxsize=50_000, ttl=max(settings.auth_user_cache_seconds, 1)
+)
+
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+
+def _snapshot(user: User) -> User:
+    """Copy a loaded User into a fresh detached instance for the cache."""
+    snapshot = User(**{key: getattr(user, key) for key in _USER_COLUMNS})
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def invalidate_user(user_id: uuid.UUID) -> None:
+    """Drop a user's cached snapshot (call after updating the user row)."""
+    _user_cache.pop(user_id, None)
+
+
+def clear_user_cache() -> None:
+    """Drop every cached user snapshot."""
+    _user_cache.clear()
+
+
+class UserLoader:
+    """Loads users for one session, batching lookups made in the same tick.
+
+    Usage:
+        loader = UserLoader.for_session(db)
+        user = await loader.load(user_id)
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._pending: dict[uuid.UUID, asyncio.Future[User | None]] = {}
+        self._dispatch_scheduled = False
+        # The event loop only keeps weak references to tasks
+        self._dispatch_tasks: set[asyncio.Task[None]] = set()
+
+    @classmethod
+    def for_session(cls, db: AsyncSession) -> "UserLoader":
+        """The session's loader, created on first use and kept in `db.info`."""
+        loader = db.info.get("user_loader")
+        if loader is None:
+            loader = db.info["user_loader"] = cls(db)
+        return loader
+
+    async def load(self, user_id: uuid.UUID) -> User | None:
+        cached = _user_cache.get(user_id) if _CACHE_ENABLED else None
+        if cached is not None:
+            return await self.db.merge(cached, load=False)
+
+        future = self._pending.get(user_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[user_id] = future
+            if not self._dispatch_scheduled:
+                # The task's first step runs on the next loop iteration, after
+                # every load() issued in this tick has registered its future
+                self._dispatch_scheduled = True
+                task = asyncio.get_running_loop().create_task(self._dispatch())
+                self._dispatch_tasks.add(task)
+                task.add_done_callback(self._dispatch_tasks.discard)
+        return await future
+
+    async def _dispatch(self) -> None:
+        """Resolve every pending lookup with a single query."""
+        pending, self._pending = self._pending, {}
+        self._dispatch_scheduled = False
+        try:
+            result = await self.db.execute(select(User).where(User.id.in_(pending.keys())))
+            users = {user.id: user for user in result.scalars().all()}
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for user_id, future in pending.items():
+            user = users.get(user_id)
+            if user is not None and _CACHE_ENABLED:
+                _user_cache[user_id] = _snapshot(user)
+            if not future.done():
+                future.set_result(user)
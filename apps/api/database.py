@@ -1,5 +1,6 @@
 from collections.abc import AsyncGenerator
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -8,11 +9,30 @@ from apps.api.config import settings
 # The engine manages the connection pool to the database.
 # A "pool" keeps multiple connections open and reuses them,
 # so we don't have to reconnect for every single request (slow).
+#
+# pool_pre_ping checks a connection is alive before handing it out, so a
+# connection dropped by an idle timeout doesn't surface as a request error.
+# pool_recycle replaces connections before those timeouts kick in.
+# pool_timeout bounds how long a request waits for a free connection, so
+# an exhausted pool surfaces as a fast error instead of a pile-up.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,  # When True, prints all SQL queries (useful for debugging)
-    pool_size=20,          # Keep 20 connections open
-    max_overflow=10,       # Allow up to 10 extra connections during spikes
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout_seconds,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    connect_args={
+        # Our queries are short OLTP lookups; JIT compilation only adds latency.
+        # application_name tags our sessions in pg_stat_activity / pg_stat_statements.
+        "server_settings": {"jit": "off", "application_name": "comio-api"},
+        # asyncpg's own statement cache + SQLAlchemy's prepared statement cache.
+        # Set DB_STATEMENT_CACHE_SIZE=0 behind PgBouncer in transaction mode,
+        # where a prepared statement may not exist on the next server connection.
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    },
 )
 
 # Session factory — creates new database sessions.
@@ -24,6 +44,19 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Read-only sessions share the same pool but run in autocommit mode.
+# A normal session opens a transaction on first query and issues a ROLLBACK
+# when it closes — pure overhead for a GET that never writes. In autocommit
+# mode there is no BEGIN/ROLLBACK round-trip at all.
+readonly_session_factory = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# HTTP methods that never write through the session
+READONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 
 class Base(DeclarativeBase):
     """Base class for all database models.
@@ -34,7 +67,7 @@ class Base(DeclarativeBase):
     pass
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request = None) -> AsyncGenerator[AsyncSession, None]:
     """Dependency that provides a database session per request.
 
     Usage in FastAPI:
@@ -42,10 +75,23 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         async def get_users(db: AsyncSession = Depends(get_db)):
             ...
 
+    GET/HEAD/OPTIONS requests get an autocommit (read-only) session; every
+    other method gets a regular transactional session. Outside a request
+    (e.g. background subscribers calling get_db() directly) the session is
+    always transactional.
+
+    FastAPI resolves this dependency once per request, so the route and
+    every dependency that asks for it (get_current_user included) share one
+    session — and its identity map, which answers repeated primary-key
+    lookups (BaseRepository.get_by_id) within the request without SQL.
+
     The session is automatically closed when the request finishes,
     even if an error occurs (thanks to the 'finally' block).
     """
-    session = async_session_factory()
+    if request is not None and request.method in READONLY_METHODS:
+        session = readonly_session_factory()
+    else:
+        session = async_session_factory()
     try:
         yield session
     finally:
@@ -1,5 +1,6 @@
 from fastapi import Request
-from fastapi.responses import JSONResponse
+
+from apps.api.responses import ORJSONResponse
 
 class ComioException(Exception):
     """Base exception for Comio API errors."""
@@ -36,9 +37,9 @@ class ForbiddenException(ComioException):
         super().__init__(message=message, status_code=403)
 
 
-async def comio_exception_handler(request: Request, exc: ComioException) -> JSONResponse:
+async def comio_exception_handler(request: Request, exc: ComioException) -> ORJSONResponse:
     """Converts our custom exceptions into clean JSON error responses."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
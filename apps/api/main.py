@@ -1,4 +1,6 @@
+import functools
 import logging
+import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -11,11 +13,14 @@ from apps.api.config import settings
 from apps.api.exceptions import ComioException, comio_exception_handler
 from apps.api.routes import auth, health, incidents, projects, sandbox, chat, webhooks, remediations
 from apps.api.middleware import RequestIDMiddleware
-from apps.api.database import engine
+from apps.api.responses import ORJSONResponse
+from apps.api.database import engine, async_session_factory
 from anomaly_detector import AnomalyWorker
 from events.bus import create_event_bus
 from apps.api.services.event_service import event_service
+from apps.api.services.http_client import get_http_client, close_http_client
 from apps.api.services.rca_service import rca_service
+from apps.api.services.vector_tuning import refresh_hnsw_params
 
 logging.basicConfig(
     level=logging.DEBUG if settings.debug else logging.INFO,
@@ -23,11 +28,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Manages application startup and shutdown lifecycle."""
-
-    BANNER = """
+# Startup banner — a module constant, so it's built once per process
+_BANNER = """
       \033[38;5;208m   ██████╗\033[36m ██████╗ ███╗   ███╗██╗ ██████╗
       \033[38;5;208m  ██╔════╝\033[36m██╔═══██╗████╗ ████║██║██╔═══██╗
       \033[38;5;208m  ██║     \033[36m██║   ██║██╔████╔██║██║██║   ██║
@@ -36,12 +38,28 @@ async def lifespan(app: FastAPI):
       \033[38;5;208m   ╚═════╝\033[36m ╚═════╝ ╚═╝     ╚═╝╚═╝ ╚═════╝
       \033[0m\033[90m  Create · Edit · Deploy · Monitor · Fix
        ─────────────────────────────────────────\033[0m
-    """
+"""
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manages application startup and shutdown lifecycle."""
 
     # --- Startup ---
-    print(BANNER)
+    sys.stdout.write(_BANNER)
     logger.info("Comio API v%s starting up...", settings.app_version)
+
+    # Size HNSW query params to the current embeddings corpus
+    try:
+        async with async_session_factory() as db:
+            await refresh_hnsw_params(db)
+    except Exception as e:
+        logger.warning("Could not size HNSW params (using defaults): %s", e)
+    logger.info("Database pool: %s", engine.pool.status())
     
+    # Shared outbound HTTP client (keep-alive pool reused across requests)
+    get_http_client()
+
     # Initialize event bus
     event_bus = create_event_bus("redis", redis_url=settings.redis_url)
     event_service.set_event_bus(event_bus)
@@ -76,6 +94,7 @@ async def lifespan(app: FastAPI):
     # Close event bus
     await event_bus.close()
     await event_service.close()
+    await close_http_client()
     
     # Close database connections
     await engine.dispose()
@@ -96,6 +115,7 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
         docs_url="/docs",   # Swagger UI endpoint
         redoc_url="/redoc", # Swagger UI alternative
+        default_response_class=ORJSONResponse,  # orjson instead of stdlib json for every route
     )
 
     # --- Middleware ---
@@ -105,8 +125,11 @@ def create_app() -> FastAPI:
         CORSMiddleware,
         allow_origins=settings.cors_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        # Explicit lists let Starlette precompute the preflight response
+        # instead of reflecting each request's Access-Control-Request-Headers
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
+        expose_headers=["X-Next-Cursor"],
     )
     application.add_middleware(RequestIDMiddleware) # Add request ID middleware to every request
     
@@ -155,5 +178,17 @@ def create_app() -> FastAPI:
 
     return application
 
+@functools.lru_cache(maxsize=1)
+def get_app() -> FastAPI:
+    """The process-wide app, built once.
+
+    create_app() re-registers every route (path regex compilation,
+    dependency-graph flattening) on each call — use it when you need a
+    fresh app (e.g. a test that mutates routes or overrides); use
+    get_app() everywhere else.
+    """
+    return create_app()
+
+
 # Create the app instance — this is what uvicorn runs
-app = create_app()
\ No newline at end of file
+app = get_app()
\ No newline at end of file
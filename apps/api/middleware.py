@@ -4,18 +4,105 @@ Middleware runs on EVERY request — before and after your route code.
 Unlike Depends() (which is per-route), middleware is global.
 """
 
-import uuid
+import binascii
+import os
 import time
 import logging
+from collections import OrderedDict
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from apps.api.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Bound once: the access-log check below runs on every request
+_INFO = logging.INFO
+_log_enabled = logger.isEnabledFor
+
+
+class _IDPool:
+    """Hands out 8-hex-char request IDs from a batch of random bytes.
+
+    One os.urandom() call fills the buffer for 1024 IDs, instead of a
+    uuid4() (one syscall + a 36-char string) per request.
+    """
+
+    __slots__ = ("buf", "i")
+
+    _BATCH_BYTES = 4096
+
+    def __init__(self):
+        self.buf = os.urandom(self._BATCH_BYTES)
+        self.i = 0
+
+    def next(self) -> str:
+        if self.i >= len(self.buf):
+            self.buf = os.urandom(self._BATCH_BYTES)
+            self.i = 0
+        start = self.i
+        self.i = start + 4
+        return binascii.hexlify(self.buf[start:start + 4]).decode()
+
+
+_id_pool = _IDPool()
+
+
+class _AccessLogSampler:
+    """Decides which requests get an access-log line.
+
+    Requests are bucketed by (method, route, status). Errors (status >= 400)
+    always log. Each bucket logs its first few requests, then 1 in
+    `sample_every`; every `summary_ns` it also logs how many requests were
+    skipped and a running median latency, so steady-state traffic stays
+    visible without a line per request. Buckets live in a bounded LRU.
+    """
+
+    WARMUP = 10          # Requests logged in full before sampling kicks in
+    MAX_BUCKETS = 4096
+
+    def __init__(self, sample_every: int, summary_seconds: int):
+        self.sample_every = max(sample_every, 1)
+        self.summary_ns = summary_seconds * 1_000_000_000
+        # key → [seen, skipped since last summary, next summary time, median estimate (us)]
+        self._buckets: OrderedDict[tuple[str, str, int], list[int]] = OrderedDict()
+
+    def should_log(self, method: str, path: str, status: int, duration_us: int) -> bool:
+        if status >= 400 or self.sample_every == 1:
+            return True
+
+        key = (method, path, status)
+        now_ns = time.perf_counter_ns()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [0, 0, now_ns + self.summary_ns, duration_us]
+            if len(self._buckets) > self.MAX_BUCKETS:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            # Frugal streaming median: nudge the estimate toward each sample
+            step = max(bucket[3] >> 4, 1)
+            bucket[3] += step if duration_us > bucket[3] else -step
+
+        bucket[0] += 1
+        if bucket[0] <= self.WARMUP or bucket[0] % self.sample_every == 0:
+            return True
+
+        bucket[1] += 1
+        if now_ns >= bucket[2]:
+            logger.info(
+                "[sampled] %s %s → %s: %d requests not logged, p50 ~%dus",
+                method, path, status, bucket[1], bucket[3],
+            )
+            bucket[1] = 0
+            bucket[2] = now_ns + self.summary_ns
+        return False
+
+
+_sampler = _AccessLogSampler(settings.access_log_sample_every, settings.access_log_summary_seconds)
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+
+class RequestIDMiddleware:
     """Adds a unique request ID to every request and response.
 
     Why this matters:
@@ -27,33 +114,66 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - Generated if not provided by the client
     - Added to the response headers (so the frontend can see it)
     - Logged with every log message for this request
+
+    Written as plain ASGI rather than BaseHTTPMiddleware: that wrapper runs
+    each request in its own task group with memory streams and builds extra
+    Request/Response objects, which is a lot of overhead for adding headers.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Use client-provided ID (for tracing across services) or generate one
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4())[:8])
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if not request_id:
+            request_id = _id_pool.next()
 
         # Record start time for request duration logging
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+        duration_us = 0
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code, duration_us
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Calculate how long the request took (time to first byte)
+                # Integer microseconds — formatted only for the header below
+                duration_us = (time.perf_counter_ns() - start_ns) // 1000
+
+                # Add request ID and timing to response headers
+                headers = list(message.get("headers", ()))
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                headers.append((b"x-response-time", f"{duration_us / 1000:.2f}ms".encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
 
         # Process the request (runs your route code)
-        response = await call_next(request)
-
-        # Calculate how long the request took
-        duration_ms = round((time.time() - start_time) * 1000, 2)
-
-        # Add request ID and timing to response headers
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Response-Time"] = f"{duration_ms}ms"
-
-        # Log every request (method, path, status, duration)
-        logger.info(
-            "[%s] %s %s → %s (%sms)",
-            request_id,
-            request.method,
-            request.url.path,
-            response.status_code,
-            duration_ms,
-        )
-
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send_with_headers)
+
+        # Log the request (method, path, status, duration) — skipped
+        # entirely, LogRecord and all, when INFO is filtered out, and
+        # sampled for steady-state successes (see _AccessLogSampler)
+        if _log_enabled(_INFO):
+            method = scope["method"]
+            # Bucket by route template so /projects/{id} doesn't get one bucket per id
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or scope["path"]
+            if _sampler.should_log(method, route_path, status_code, duration_us):
+                logger.info(
+                    "[%s] %s %s → %s (%dus)",
+                    request_id,
+                    method,
+                    scope["path"],
+                    status_code,
+                    duration_us,
+                )
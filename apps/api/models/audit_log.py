@@ -1,7 +1,7 @@
 import uuid
 
-from sqlalchemy import String, Text, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Text, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from apps.api.models.base import BaseModel
@@ -17,11 +17,17 @@ class AuditLog(BaseModel):
     - Project was created/deleted
     """
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # "What happened to this remediation?" — newest first via a backward index scan
+        Index("ix_audit_logs_resource", "resource_type", "resource_id", "created_at"),
+        # "What did this user do recently?"
+        Index("ix_audit_logs_user_created", "user_id", "created_at"),
+    )
 
     action: Mapped[str] = mapped_column(String(100), nullable=False)  # e.g. "remediation.approved"
     resource_type: Mapped[str] = mapped_column(String(50), nullable=False)  # e.g. "remediation", "sandbox", "project"
     resource_id: Mapped[str] = mapped_column(String(100), nullable=False)  # UUID of the affected resource
-    details: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # Extra context
+    details: Mapped[dict | None] = mapped_column(JSONB, nullable=True)  # Extra context
 
     # Who did it (null for system actions)
     user_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
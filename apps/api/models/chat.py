@@ -1,7 +1,7 @@
 import uuid
 
-from sqlalchemy import String, Text, ForeignKey, Enum as SAEnum, JSON, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Text, ForeignKey, Enum as SAEnum, Boolean, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum
 
@@ -18,6 +18,10 @@ class MessageRole(str, Enum):
 
 class ChatSession(BaseModel):
     __tablename__ = "chat_sessions"
+    __table_args__ = (
+        # Keyset pagination: WHERE sandbox_id = :s AND (created_at, id) < (...)
+        Index("ix_chat_sessions_sandbox_keyset", "sandbox_id", "created_at", "id"),
+    )
 
     title: Mapped[str] = mapped_column(String(255), default="New Chat", nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -29,23 +33,29 @@ class ChatSession(BaseModel):
     # Relationships
     sandbox: Mapped["Sandbox"] = relationship(back_populates="chat_sessions")
     user: Mapped["User"] = relationship()
-    messages: Mapped[list["ChatMessage"]] = relationship(back_populates="session", order_by="ChatMessage.created_at", cascade="all, delete-orphan")
+    # passive_deletes: the FK's ON DELETE CASCADE removes messages with the
+    # session in one statement, instead of the ORM loading and deleting each
+    messages: Mapped[list["ChatMessage"]] = relationship(back_populates="session", order_by="ChatMessage.created_at", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class ChatMessage(BaseModel):
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Every history read: WHERE session_id = :s ORDER BY created_at
+        Index("ix_chat_messages_session_created", "session_id", "created_at"),
+    )
 
     role: Mapped[str] = mapped_column(SAEnum(MessageRole), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Tool use tracking — stores the tool calls and results as JSON
-    tool_calls: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    tool_calls: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     # Files the AI modified in this message
-    files_modified: Mapped[list | None] = mapped_column(JSON, nullable=True)  # e.g. ["src/main.py", "README.md"]
+    files_modified: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # e.g. ["src/main.py", "README.md"]
 
     # Link to session
-    session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("chat_sessions.id"), nullable=False)
+    session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("chat_sessions.id", ondelete="CASCADE"), nullable=False)
 
     # Relationships
     session: Mapped["ChatSession"] = relationship(back_populates="messages")
@@ -1,11 +1,12 @@
 import uuid
 
-from sqlalchemy import String, Text, ForeignKey, Enum as SAEnum, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Text, ForeignKey, Enum as SAEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum
 
 from apps.api.models.base import BaseModel
+from apps.api.models.types import HexBytes
 
 
 class DeploymentStatus(str, Enum):
@@ -23,14 +24,14 @@ class Deployment(BaseModel):
     environment: Mapped[str] = mapped_column(String(50), default="staging", nullable=False)  # staging, production
     deploy_url: Mapped[str | None] = mapped_column(String(500), nullable=True)  # e.g. https://my-app.comio.dev
     image_tag: Mapped[str | None] = mapped_column(String(255), nullable=True)  # Docker image tag
-    commit_sha: Mapped[str | None] = mapped_column(String(40), nullable=True)  # Git commit deployed
+    commit_sha: Mapped[str | None] = mapped_column(HexBytes, index=True, nullable=True)  # Git commit deployed (hex in Python, 20 bytes in Postgres)
 
     # Build and deploy logs
     build_logs: Mapped[str | None] = mapped_column(Text, nullable=True)
     deploy_logs: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Resource usage snapshot
-    resource_usage: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    resource_usage: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     # Project link
     project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
@@ -1,10 +1,10 @@
 """Embedding model — stores text chunks and their vector embeddings."""
 
 import uuid
-from sqlalchemy import String, Text, ForeignKey
+from sqlalchemy import String, Text, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 
 from apps.api.models.base import BaseModel
 
@@ -16,6 +16,29 @@ class Embedding(BaseModel):
     their vector representations for similarity search.
     """
     __tablename__ = "embeddings"
+    __table_args__ = (
+        Index("ix_embeddings_content_type", "content_type"),
+        Index("ix_embeddings_project_id", "project_id"),
+        # HNSW ANN index over every chunk (build params: see vector_tuning.py)
+        Index(
+            "embeddings_embedding_idx",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+        # RCA searches only runbooks + past incidents. A filter on the full
+        # index is applied after the ANN scan, so code/docs neighbours crowd
+        # out the matches; this partial index keeps that search inside the ANN.
+        Index(
+            "ix_embeddings_knowledge_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+            postgresql_where=text("content_type IN ('runbook', 'incident')"),
+        ),
+    )
 
     # Content
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -23,8 +46,12 @@ class Embedding(BaseModel):
     source: Mapped[str] = mapped_column(String(500), nullable=False)  # File path or incident ID
     chunk_metadata: Mapped[dict | None] = mapped_column("metadata", JSONB, nullable=True)  # Additional context
     
-    # Vector embedding (1536 dimensions for OpenAI text-embedding-3-small)
-    embedding: Mapped[list[float]] = mapped_column(Vector(1536), nullable=False)
+    # Vector embedding (1536 dimensions for OpenAI text-embedding-3-small).
+    # Stored as halfvec (FP16). The column type downcasts to FP16 client-side
+    # (pgvector's HalfVector) before the value is sent, for writes and for
+    # query vectors alike, so ingestion/retrieval code keeps passing plain
+    # float lists and no separate numpy conversion is needed.
+    embedding: Mapped[list[float]] = mapped_column(HALFVEC(1536), nullable=False)
     
     # Optional foreign keys
     project_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -1,7 +1,7 @@
 import uuid
 
-from sqlalchemy import String, Text, Float, ForeignKey, Enum as SAEnum, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Text, Float, ForeignKey, Enum as SAEnum, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum
 
@@ -27,6 +27,17 @@ class IncidentStatus(str, Enum):
 
 class Incident(BaseModel):
     __tablename__ = "incidents"
+    __table_args__ = (
+        # Containment lookups on the raw alert (alert_data @> '{"labels": {...}}')
+        Index(
+            "ix_incidents_alert_gin",
+            "alert_data",
+            postgresql_using="gin",
+            postgresql_ops={"alert_data": "jsonb_path_ops"},
+        ),
+        # Keyset pagination: WHERE project_id = :p AND (created_at, id) < (...)
+        Index("ix_incidents_project_keyset", "project_id", "created_at", "id"),
+    )
 
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -35,7 +46,7 @@ class Incident(BaseModel):
     source: Mapped[str] = mapped_column(String(100), nullable=False)  # "anomaly_detector", "alertmanager", "manual"
 
     # Alert data — raw data from the observability pipeline
-    alert_data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    alert_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     # Project link
     project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
@@ -54,9 +65,9 @@ class Diagnosis(BaseModel):
     confidence: Mapped[float] = mapped_column(Float, nullable=False)
     explanation: Mapped[str] = mapped_column(Text, nullable=False)  # Detailed markdown explanation
 
-    evidence: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # Supporting data points
-    affected_components: Mapped[list | None] = mapped_column(JSON, nullable=True)
-    suggested_actions: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    evidence: Mapped[dict | None] = mapped_column(JSONB, nullable=True)  # Supporting data points
+    affected_components: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    suggested_actions: Mapped[list | None] = mapped_column(JSONB, nullable=True)
 
     # LLM metadata — which model produced this diagnosis
     llm_provider: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -82,10 +93,21 @@ class RemediationStatus(str, Enum):
 
 class Remediation(BaseModel):
     __tablename__ = "remediations"
+    __table_args__ = (
+        # Keyset pagination of the pending queue, newest first. Partial: the
+        # pending list is the only status-filtered query, and pending rows
+        # are a small, churning slice of the table.
+        Index(
+            "ix_remediations_pending_keyset",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
 
     fix_type: Mapped[str] = mapped_column(String(50), nullable=False)  # code_change, config_change, rollback, scale
     diff: Mapped[str] = mapped_column(Text, nullable=False)  # Unified diff format
-    files_changed: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    files_changed: Mapped[list | None] = mapped_column(JSONB, nullable=True)
     explanation: Mapped[str] = mapped_column(Text, nullable=False)
     risk_level: Mapped[str] = mapped_column(String(20), nullable=False)  # low, medium, high
     status: Mapped[str] = mapped_column(SAEnum(RemediationStatus), default=RemediationStatus.PENDING, nullable=False)
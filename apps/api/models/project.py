@@ -1,7 +1,7 @@
 import uuid
 
-from sqlalchemy import String, Text, ForeignKey, Enum as SAEnum, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Text, ForeignKey, Enum as SAEnum, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum
 
@@ -26,6 +26,10 @@ class ProjectType(str, Enum):
 
 class Project(BaseModel):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset pagination: WHERE owner_id = :o AND (created_at, id) < (...)
+        Index("ix_projects_owner_keyset", "owner_id", "created_at", "id"),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -37,7 +41,7 @@ class Project(BaseModel):
     repo_full_name: Mapped[str | None] = mapped_column(String(255), nullable=True)  # e.g. "user/repo"
     default_branch: Mapped[str] = mapped_column(String(100), default="main", nullable=False)
     # Monitoring config — what metrics to watch (stored as JSON)
-    monitoring_config: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    monitoring_config: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     # Owner
     owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -48,3 +52,4 @@ class Project(BaseModel):
     incidents: Mapped[list["Incident"]] = relationship(back_populates="project", cascade="all, delete-orphan")
     deployments: Mapped[list["Deployment"]] = relationship(back_populates="project", cascade="all, delete-orphan")
     embeddings: Mapped[list["Embedding"]] = relationship("Embedding", back_populates="project", cascade="all, delete-orphan")
+
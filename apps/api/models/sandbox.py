@@ -6,6 +6,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum
 
 from apps.api.models.base import BaseModel
+from apps.api.models.types import HexBytes
 
 
 class SandboxStatus(str, Enum):
@@ -20,7 +21,7 @@ class SandboxStatus(str, Enum):
 class Sandbox(BaseModel):
     __tablename__ = "sandboxes"
 
-    container_id: Mapped[str | None] = mapped_column(String(100), nullable=True)  # Docker container ID
+    container_id: Mapped[str | None] = mapped_column(HexBytes, nullable=True)  # Docker container ID (hex in Python, 32 bytes in Postgres)
     status: Mapped[str] = mapped_column(SAEnum(SandboxStatus), default=SandboxStatus.CREATING, nullable=False)
     git_branch: Mapped[str] = mapped_column(String(100), default="main", nullable=False)
     volume_name: Mapped[str | None] = mapped_column(String(255), nullable=True)  # Docker volume name
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Enum as SAEnum, DateTime, Text
+from sqlalchemy import String, Enum as SAEnum, DateTime, Text, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum
@@ -30,6 +30,9 @@ class User(BaseModel):
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(SAEnum(UserRole), default=UserRole.VIEWER, nullable=False)
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
+    # Embedded in every JWT as "rev" — bump it on role change or deactivation
+    # to invalidate all previously issued tokens
+    token_revision: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
 
     # GitHub OAuth — populated when user connects their GitHub account
     github_id: Mapped[str | None] = mapped_column(String(100), unique=True, nullable=True)
@@ -0,0 +1,43 @@
+"""Keyset (cursor) pagination helpers.
+
+List endpoints page by the last row seen instead of by OFFSET: the client
+passes back an opaque `cursor` and the query continues with
+`WHERE (created_at, id) < (:ts, :id)`, so page N costs the same as page 1.
+
+The cursor is the last row's (created_at, id), base64-encoded so clients
+treat it as opaque.
+"""
+
+import base64
+import uuid
+from datetime import datetime
+
+from apps.api.exceptions import ComioException
+
+# (created_at, id) of the last row on the previous page
+Cursor = tuple[datetime, uuid.UUID]
+
+
+def encode_cursor(created_at: datetime, id: uuid.UUID) -> str:
+    """Serialize a row's sort key into an opaque cursor string."""
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str | None) -> Cursor | None:
+    """Parse a cursor from the client. Raises a 400 if it's malformed."""
+    if not cursor:
+        return None
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(id)
+    except ValueError:
+        raise ComioException(message="Invalid pagination cursor", status_code=400)
+
+
+def next_cursor(items: list, limit: int) -> str | None:
+    """Cursor for the page after `items`, or None if this was the last page."""
+    if len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
@@ -5,6 +5,7 @@ from apps.api.repositories.incident import IncidentRepository, incident_repo
 from apps.api.repositories.sandbox import SandboxRepository, sandbox_repo
 from apps.api.repositories.chat import ChatSessionRepository, ChatMessageRepository, chat_session_repo, chat_message_repo
 from apps.api.repositories.remediation import RemediationRepository, remediation_repo
+from apps.api.repositories.audit_log import AuditLogRepository, audit_log_repo
 # and add "RemediationRepository", "remediation_repo" to __all__
 __all__ = [
     "BaseRepository",
@@ -14,4 +15,5 @@ __all__ = [
     "SandboxRepository", "sandbox_repo",
     "ChatSessionRepository", "ChatMessageRepository", "chat_session_repo", "chat_message_repo",
     "RemediationRepository", "remediation_repo",
+    "AuditLogRepository", "audit_log_repo",
 ]
\ No newline at end of file
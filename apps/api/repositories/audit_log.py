@@ -0,0 +1,27 @@
+"""Audit log repository — database operations for audit log entries."""
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api.models.audit_log import AuditLog
+from apps.api.repositories.base import BaseRepository
+
+
+class AuditLogRepository(BaseRepository[AuditLog]):
+    def __init__(self):
+        super().__init__(AuditLog)
+
+    async def bulk_log(self, db: AsyncSession, entries: list[dict]) -> None:
+        """Insert many audit entries in one batched INSERT. Caller must commit.
+
+        Each entry is a dict of AuditLog columns (action, resource_type,
+        resource_id, user_id, details). A list of parameter sets makes
+        SQLAlchemy use its "insertmanyvalues" path: multi-row
+        INSERT ... VALUES statements instead of one round-trip per row.
+        """
+        if entries:
+            await db.execute(insert(AuditLog), entries)
+
+
+# Singleton instance — import and use this directly
+audit_log_repo = AuditLogRepository()
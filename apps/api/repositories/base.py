@@ -7,16 +7,28 @@ You get create, get, list, update, delete for free.
 import uuid
 from typing import Generic, TypeVar, Type
 
-from sqlalchemy import select, func
+from sqlalchemy import Select, delete, insert, inspect, select, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.models.base import BaseModel
+from apps.api.pagination import Cursor
 
 # TypeVar lets us write one class that works for User, Project, Incident, etc.
 # "ModelType" is a placeholder that gets replaced with the actual model class.
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
 
+def _is_loaded(instance, path: str) -> bool:
+    """Whether every relationship along a dotted path is already loaded."""
+    for attr in path.split("."):
+        if instance is None:
+            return True
+        if attr in inspect(instance).unloaded:
+            return False
+        instance = getattr(instance, attr)
+    return True
+
+
 class BaseRepository(Generic[ModelType]):
     """Generic repository providing CRUD operations for any model.
 
@@ -33,48 +45,142 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
 
     async def get_by_id(self, db: AsyncSession, id: uuid.UUID) -> ModelType | None:
-        """Get a single record by its UUID. Returns None if not found."""
-        result = await db.execute(select(self.model).where(self.model.id == id))
-        return result.scalar_one_or_none()
+        """Get a single record by its UUID. Returns None if not found.
+
+        Session.get() checks the session's identity map first, so a row
+        this request already loaded comes back with no SQL at all.
+        """
+        return await db.get(self.model, id)
+
+    async def _get_with(
+        self, db: AsyncSession, id: uuid.UUID, options: list, loaded: tuple[str, ...]
+    ) -> ModelType | None:
+        """Primary-key lookup with eager-load options, via the identity map.
+
+        Session.get() ignores `options` when the row is already in the
+        identity map, so if any relationship path in `loaded` (e.g.
+        "incident.project") isn't loaded on that instance, re-fetch it
+        with populate_existing to apply them.
+
+        Callers end `options` with raiseload("*"), so code touching a
+        relationship they didn't ask for fails loudly instead of quietly
+        issuing one more query per row.
+        """
+        instance = await db.get(self.model, id, options=options)
+        if instance is not None and not all(_is_loaded(instance, path) for path in loaded):
+            instance = await db.get(self.model, id, options=options, populate_existing=True)
+        return instance
+
+    def _newest_first(
+        self, stmt: Select, *, skip: int = 0, limit: int = 100, after: Cursor | None = None
+    ) -> Select:
+        """Order a select newest first and page it.
+
+        With `after` (the last row's created_at + id), uses keyset
+        pagination — `WHERE (created_at, id) < (:ts, :id)` — which stays
+        O(limit) on deep pages; otherwise falls back to OFFSET `skip`.
+        The id tiebreaker keeps the order stable for equal timestamps.
+        """
+        model = self.model
+        if after is not None:
+            stmt = stmt.where(tuple_(model.created_at, model.id) < tuple_(*after))
+        elif skip:
+            stmt = stmt.offset(skip)
+        return stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit)
 
     async def get_all(
         self,
         db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
     ) -> list[ModelType]:
-        """Get a paginated list of records.
+        """Get a paginated list of records, newest first.
 
         Args:
             skip: Number of records to skip (for pagination offset)
             limit: Maximum number of records to return
+            after: Keyset cursor — (created_at, id) of the last record seen
         """
         result = await db.execute(
-            select(self.model)
-            .offset(skip)
-            .limit(limit)
-            .order_by(self.model.created_at.desc())  # Newest first
+            self._newest_first(select(self.model), skip=skip, limit=limit, after=after)
         )
         return list(result.scalars().all())
 
+    async def list_with_total(
+        self,
+        db: AsyncSession,
+        stmt: Select,
+        skip: int = 0,
+        limit: int = 100,
+        after: Cursor | None = None,
+    ) -> tuple[list[ModelType], int | None]:
+        """Run a paginated list query and count its matches in one round trip.
+
+        Adds `COUNT(*) OVER()` to `stmt` — the window is evaluated before
+        LIMIT/OFFSET, so every row carries the full match count and the
+        planner answers both from one scan.
+
+        Keyset pages (`after` set) don't need a total to find the next
+        page, so they skip the count and return None for it.
+        """
+        if after is not None:
+            result = await db.execute(self._newest_first(stmt, limit=limit, after=after))
+            return list(result.scalars().all()), None
+
+        result = await db.execute(
+            self._newest_first(
+                stmt.add_columns(func.count().over().label("total")), skip=skip, limit=limit
+            )
+        )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if not skip:
+            return [], 0
+        # Paged past the end: no row left to carry the window count
+        total = await db.execute(select(func.count()).select_from(stmt.subquery()))
+        return [], total.scalar_one()
+
     async def count(self, db: AsyncSession) -> int:
         """Get total count of records."""
         result = await db.execute(select(func.count()).select_from(self.model))
         return result.scalar_one()
 
-    async def create(self, db: AsyncSession, **kwargs) -> ModelType:
+    async def create(self, db: AsyncSession, *, commit: bool = True, **kwargs) -> ModelType:
         """Create a new record.
 
         Usage: user = await user_repo.create(db, email="bob@test.com", full_name="Bob")
+
+        id, created_at and updated_at come back on the INSERT's RETURNING
+        clause (see BaseModel.__mapper_args__), so there's no reload query.
+        Pass commit=False to only flush, leaving the commit to the caller —
+        useful when one request writes several rows.
         """
         instance = self.model(**kwargs)
         db.add(instance)
-        await db.commit()
-        await db.refresh(instance)  # Reload from DB to get id, created_at, etc.
+        await self._save(db, commit)
         return instance
 
+    async def bulk_create(
+        self, db: AsyncSession, rows: list[dict], *, commit: bool = True
+    ) -> list[uuid.UUID]:
+        """Insert many records in one batched INSERT and return their ids.
+
+        Each dict holds model columns. Rows aren't loaded back as objects —
+        use get_by_id if you need them.
+        """
+        if not rows:
+            return []
+        result = await db.execute(
+            insert(self.model).returning(self.model.id, sort_by_parameter_order=True), rows
+        )
+        ids = list(result.scalars().all())
+        await self._save(db, commit)
+        return ids
+
     async def update(
-        self, db: AsyncSession, instance: ModelType, **kwargs
+        self, db: AsyncSession, instance: ModelType, *, commit: bool = True, **kwargs
     ) -> ModelType:
         """Update an existing record.
 
@@ -83,11 +189,34 @@ class BaseRepository(Generic[ModelType]):
         for key, value in kwargs.items():
             if hasattr(instance, key):
                 setattr(instance, key, value)
-        await db.commit()
-        await db.refresh(instance)
+        await self._save(db, commit)
         return instance
 
-    async def delete(self, db: AsyncSession, instance: ModelType) -> None:
+    async def delete(self, db: AsyncSession, instance: ModelType, *, commit: bool = True) -> None:
         """Delete a record from the database."""
         await db.delete(instance)
-        await db.commit()
\ No newline at end of file
+        await self._save(db, commit)
+
+    async def delete_by_id(self, db: AsyncSession, id: uuid.UUID, *, commit: bool = True) -> bool:
+        """Delete a record with a single DELETE, without loading it first.
+
+        Unlike delete(), the ORM doesn't walk relationships, so child rows
+        must be covered by an ON DELETE CASCADE foreign key. Instances of
+        this row already in the session aren't updated. Returns whether a
+        row was deleted.
+        """
+        result = await db.execute(
+            delete(self.model)
+            .where(self.model.id == id)
+            .execution_options(synchronize_session=False)
+        )
+        await self._save(db, commit)
+        return result.rowcount > 0
+
+    @staticmethod
+    async def _save(db: AsyncSession, commit: bool) -> None:
+        """Commit the session, or just flush it when the caller owns the commit."""
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
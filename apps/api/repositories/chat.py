@@ -2,13 +2,72 @@
 
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import Row, Text, bindparam, case, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from apps.api.models.chat import ChatSession, ChatMessage, MessageRole
+from apps.api.pagination import Cursor
 from apps.api.repositories.base import BaseRepository
 
+# Statements built once at import, reused by every call
+_SESSIONS_BY_SANDBOX = (
+    select(ChatSession)
+    .where(ChatSession.sandbox_id == bindparam("sandbox_id"))
+    .order_by(ChatSession.created_at.desc())
+)
+_MESSAGES_BY_SESSION = (
+    select(ChatMessage)
+    .where(ChatMessage.session_id == bindparam("session_id"))
+    .order_by(ChatMessage.created_at.asc())
+)
+_HISTORY_BY_SESSION = (
+    select(ChatMessage.role, ChatMessage.content)
+    .where(ChatMessage.session_id == bindparam("session_id"))
+    .order_by(ChatMessage.created_at.asc())
+)
+
+# created_at rendered in UTC the way orjson's OPT_UTC_Z writes it for the
+# other endpoints: "...T08:30:00.123456Z", or "...T08:30:00Z" on a whole second.
+# (json_build_object would write the session time zone's "+00:00" offset.)
+_CREATED_AT_UTC = func.timezone("UTC", ChatMessage.created_at)
+_CREATED_AT_JSON = func.concat(
+    func.to_char(_CREATED_AT_UTC, 'YYYY-MM-DD"T"HH24:MI:SS'),
+    case(
+        (func.date_trunc("second", _CREATED_AT_UTC) == _CREATED_AT_UTC, ""),
+        else_=func.to_char(_CREATED_AT_UTC, ".US"),
+    ),
+    "Z",
+)
+
+# A session's whole message list as one JSON array, built by Postgres.
+# Enum columns store the member name (USER); the API exposes the value (user).
+# The array is cast to text: the asyncpg dialect decodes json values with
+# json.loads, and we want the encoded string to send as-is.
+_MESSAGES_JSON = select(
+    cast(
+        func.coalesce(
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(
+                        literal_column("'id'"), ChatMessage.id,
+                        literal_column("'role'"), func.lower(cast(ChatMessage.role, Text)),
+                        literal_column("'content'"), ChatMessage.content,
+                        literal_column("'tool_calls'"), ChatMessage.tool_calls,
+                        literal_column("'files_modified'"), ChatMessage.files_modified,
+                        literal_column("'created_at'"), _CREATED_AT_JSON,
+                    ),
+                    ChatMessage.created_at.asc(),
+                )
+            ),
+            literal_column("'[]'::json"),
+        ),
+        Text,
+    ),
+    func.count(),
+).where(ChatMessage.session_id == bindparam("session_id"))
+
 
 class ChatSessionRepository(BaseRepository[ChatSession]):
     def __init__(self):
@@ -18,23 +77,47 @@ class ChatSessionRepository(BaseRepository[ChatSession]):
         self, db: AsyncSession, sandbox_id: uuid.UUID
     ) -> list[ChatSession]:
         """Get all chat sessions for a sandbox, newest first."""
+        result = await db.execute(_SESSIONS_BY_SANDBOX, {"sandbox_id": sandbox_id})
+        return list(result.scalars().all())
+
+    async def get_by_sandbox_summary(
+        self,
+        db: AsyncSession,
+        sandbox_id: uuid.UUID,
+        after: Cursor | None = None,
+        limit: int = 50,
+    ) -> tuple[list[Row], int | None]:
+        """Get (id, title, is_active, created_at) rows for a sandbox, newest first, plus the total.
+
+        The session list shows only these columns, so skip loading full
+        ChatSession objects. Pages by keyset: pass the last row's
+        (created_at, id) as `after`. Like list_with_total, the first page
+        counts all matches with `COUNT(*) OVER()` in the same query, and
+        keyset pages return None for the total.
+        """
+        stmt = select(
+            ChatSession.id, ChatSession.title, ChatSession.is_active, ChatSession.created_at
+        ).where(ChatSession.sandbox_id == sandbox_id)
+        if after is not None:
+            result = await db.execute(self._newest_first(stmt, limit=limit, after=after))
+            return list(result.all()), None
+
         result = await db.execute(
-            select(ChatSession)
-            .where(ChatSession.sandbox_id == sandbox_id)
-            .order_by(ChatSession.created_at.desc())
+            self._newest_first(stmt.add_columns(func.count().over().label("total")), limit=limit)
         )
-        return list(result.scalars().all())
+        rows = list(result.all())
+        return rows, rows[0].total if rows else 0
 
     async def get_with_messages(
         self, db: AsyncSession, session_id: uuid.UUID
     ) -> ChatSession | None:
         """Get a chat session with all its messages eagerly loaded."""
-        result = await db.execute(
-            select(ChatSession)
-            .where(ChatSession.id == session_id)
-            .options(selectinload(ChatSession.messages))
+        return await self._get_with(
+            db,
+            session_id,
+            options=[selectinload(ChatSession.messages), raiseload("*")],
+            loaded=("messages",),
         )
-        return result.scalar_one_or_none()
 
 
 class ChatMessageRepository(BaseRepository[ChatMessage]):
@@ -45,13 +128,36 @@ class ChatMessageRepository(BaseRepository[ChatMessage]):
         self, db: AsyncSession, session_id: uuid.UUID
     ) -> list[ChatMessage]:
         """Get all messages for a session, ordered by creation time."""
-        result = await db.execute(
-            select(ChatMessage)
-            .where(ChatMessage.session_id == session_id)
-            .order_by(ChatMessage.created_at.asc())
-        )
+        result = await db.execute(_MESSAGES_BY_SESSION, {"session_id": session_id})
         return list(result.scalars().all())
 
+    async def get_history(
+        self, db: AsyncSession, session_id: uuid.UUID
+    ) -> list[Row]:
+        """Get (role, content) rows for a session, ordered by creation time.
+
+        For building LLM context, which needs only these two columns: plain
+        rows skip the per-message ORM object construction, identity-map
+        bookkeeping and the unused JSON columns that get_by_session pays for.
+        """
+        result = await db.execute(_HISTORY_BY_SESSION, {"session_id": session_id})
+        return list(result.all())
+
+    async def messages_as_json(
+        self, db: AsyncSession, session_id: uuid.UUID
+    ) -> tuple[bytes, int]:
+        """Get a session's messages as a ready-to-send JSON array, plus the count.
+
+        Postgres builds the array (json_agg over json_build_object), so a
+        long history costs one round trip and no ORM objects, dicts or
+        Python-side serialization — the bytes go straight into the response.
+        Each element has the same shape as get_by_session's API output,
+        timestamps included (see _CREATED_AT_JSON).
+        """
+        result = await db.execute(_MESSAGES_JSON, {"session_id": session_id})
+        payload, total = result.one()
+        return payload.encode(), total
+
     async def add_message(
         self,
         db: AsyncSession,
@@ -60,19 +166,30 @@ class ChatMessageRepository(BaseRepository[ChatMessage]):
         content: str,
         tool_calls: dict | None = None,
         files_modified: list[str] | None = None,
+        *,
+        commit: bool = True,
     ) -> ChatMessage:
-        """Add a message to a chat session."""
-        message = ChatMessage(
+        """Add a message to a chat session (commit=False to only flush)."""
+        return await self.create(
+            db,
+            commit=commit,
             session_id=session_id,
             role=role,
             content=content,
             tool_calls=tool_calls,
             files_modified=files_modified,
         )
-        db.add(message)
-        await db.commit()
-        await db.refresh(message)
-        return message
+
+    async def bulk_save(
+        self, db: AsyncSession, messages: list[dict], *, commit: bool = True
+    ) -> list[uuid.UUID]:
+        """Add many messages in one batched INSERT and return their ids.
+
+        Each dict holds ChatMessage columns (session_id, role, content, and
+        optionally tool_calls / files_modified). Unlike add_message, the rows
+        aren't loaded back — use get_by_session if you need them.
+        """
+        return await self.bulk_create(db, messages, commit=commit)
 
 
 # Singletons
@@ -2,46 +2,106 @@
 
 import uuid
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
 
 from apps.api.models.incident import Incident, Remediation
+from apps.api.models.project import Project
+from apps.api.pagination import Cursor
 from apps.api.repositories.base import BaseRepository
 
 
+# Incident + diagnosis + remediation (both one-to-one, so joined rather
+# than selectin'd) + the owning project's owner_id, in a single SELECT
+_WITH_DETAILS_AND_OWNER = (
+    select(Incident, Project.owner_id)
+    .join(Project, Project.id == Incident.project_id)
+    .options(joinedload(Incident.diagnosis), joinedload(Incident.remediation), raiseload("*"))
+    .where(Incident.id == bindparam("incident_id"))
+)
+
+# List pages only read the scalar columns IncidentResponse exposes; skip
+# the rest (alert_data is a whole JSONB alert payload per row)
+_LIST_COLUMNS = load_only(
+    Incident.id,
+    Incident.created_at,
+    Incident.updated_at,
+    Incident.title,
+    Incident.description,
+    Incident.severity,
+    Incident.status,
+    Incident.source,
+    Incident.project_id,
+)
+
+
 class IncidentRepository(BaseRepository[Incident]):
     def __init__(self):
         super().__init__(Incident)
 
     async def get_by_project(
-        self, db: AsyncSession, project_id: uuid.UUID, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        project_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        after: Cursor | None = None,
     ) -> list[Incident]:
         """Get all incidents for a specific project, newest first."""
         result = await db.execute(
-            select(Incident)
-            .where(Incident.project_id == project_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(Incident.created_at.desc())
+            self._newest_first(
+                select(Incident).options(_LIST_COLUMNS).where(Incident.project_id == project_id),
+                skip=skip, limit=limit, after=after,
+            )
         )
         return list(result.scalars().all())
 
+    async def list_by_project(
+        self,
+        db: AsyncSession,
+        project_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        after: Cursor | None = None,
+    ) -> tuple[list[Incident], int | None]:
+        """Get a page of a project's incidents plus the total, in one query."""
+        return await self.list_with_total(
+            db,
+            select(Incident).options(_LIST_COLUMNS).where(Incident.project_id == project_id),
+            skip=skip, limit=limit, after=after,
+        )
+
     async def get_with_details(self, db: AsyncSession, incident_id: uuid.UUID) -> Incident | None:
         """Get an incident with its diagnosis and remediation eagerly loaded.
 
         Without selectinload, accessing incident.diagnosis would trigger
         a separate database query. This loads everything in one go.
         """
-        result = await db.execute(
-            select(Incident)
-            .where(Incident.id == incident_id)
-            .options(
+        return await self._get_with(
+            db,
+            incident_id,
+            options=[
                 selectinload(Incident.diagnosis),
                 selectinload(Incident.remediation),
-            )
+                raiseload("*"),
+            ],
+            loaded=("diagnosis", "remediation"),
         )
-        return result.scalar_one_or_none()
+
+    async def get_with_details_and_owner(
+        self, db: AsyncSession, incident_id: uuid.UUID
+    ) -> tuple[Incident, uuid.UUID] | None:
+        """Get (incident with diagnosis + remediation, project owner_id) in one query.
+
+        For routes that check ownership before using the incident: the
+        owner comes back on the same row, so a missing incident (404) and
+        someone else's incident (403) stay distinguishable without a
+        separate projects lookup.
+        """
+        result = await db.execute(_WITH_DETAILS_AND_OWNER, {"incident_id": incident_id})
+        row = result.first()
+        return (row.Incident, row.owner_id) if row is not None else None
 
     async def count_by_project(self, db: AsyncSession, project_id: uuid.UUID) -> int:
         """Count incidents for a specific project."""
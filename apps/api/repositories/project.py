@@ -2,31 +2,91 @@
 
 import uuid
 
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from apps.api.models.project import Project
+from apps.api.models.sandbox import Sandbox
+from apps.api.pagination import Cursor
 from apps.api.repositories.base import BaseRepository
 
+_OWNER_OF = select(Project.owner_id).where(Project.id == bindparam("project_id"))
+
+# project_id → owner_id. Projects never change owner, so the only way an
+# entry goes stale is deletion — which evicts it on this worker; other
+# workers hold it for at most the TTL.
+_owner_cache: TTLCache[uuid.UUID, uuid.UUID] = TTLCache(maxsize=50_000, ttl=60)
+
+# Project + its sandbox (if any) in one round trip, for the chat/sandbox routes
+_WITH_SANDBOX_ROW = (
+    select(Project, Sandbox)
+    .outerjoin(Sandbox, Sandbox.project_id == Project.id)
+    .where(Project.id == bindparam("project_id"))
+)
+
 
 class ProjectRepository(BaseRepository[Project]):
     def __init__(self):
         super().__init__(Project)
 
     async def get_by_owner(
-        self, db: AsyncSession, owner_id: uuid.UUID, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        owner_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        after: Cursor | None = None,
     ) -> list[Project]:
-        """Get all projects owned by a specific user."""
+        """Get all projects owned by a specific user, newest first."""
         result = await db.execute(
-            select(Project)
-            .where(Project.owner_id == owner_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(Project.created_at.desc())
+            self._newest_first(
+                select(Project).where(Project.owner_id == owner_id),
+                skip=skip, limit=limit, after=after,
+            )
         )
         return list(result.scalars().all())
 
+    async def list_by_owner(
+        self,
+        db: AsyncSession,
+        owner_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        after: Cursor | None = None,
+    ) -> tuple[list[Project], int | None]:
+        """Get a page of a user's projects plus the total, in one query."""
+        return await self.list_with_total(
+            db,
+            select(Project).where(Project.owner_id == owner_id),
+            skip=skip, limit=limit, after=after,
+        )
+
+    async def get_owner_id(self, db: AsyncSession, project_id: uuid.UUID) -> uuid.UUID | None:
+        """Get a project's owner_id (None if there's no such project), cached.
+
+        For ownership checks that don't need the project itself: repeat
+        checks on the same project are answered from memory.
+        """
+        owner_id = _owner_cache.get(project_id)
+        if owner_id is None:
+            result = await db.execute(_OWNER_OF, {"project_id": project_id})
+            owner_id = result.scalar_one_or_none()
+            if owner_id is not None:
+                _owner_cache[project_id] = owner_id
+        return owner_id
+
+    async def delete(self, db: AsyncSession, instance: Project, *, commit: bool = True) -> None:
+        """Delete a project, evicting its cached owner."""
+        _owner_cache.pop(instance.id, None)
+        await super().delete(db, instance, commit=commit)
+
+    async def delete_by_id(self, db: AsyncSession, id: uuid.UUID, *, commit: bool = True) -> bool:
+        """Delete a project by id with a single DELETE, evicting its cached owner."""
+        _owner_cache.pop(id, None)
+        return await super().delete_by_id(db, id, commit=commit)
+
     async def get_with_sandbox(self, db: AsyncSession, project_id: uuid.UUID) -> Project | None:
         """Get a project with its sandbox eagerly loaded.
 
@@ -34,12 +94,29 @@ class ProjectRepository(BaseRepository[Project]):
         a separate database query (lazy loading). With it, both are
         fetched in one query — more efficient.
         """
-        result = await db.execute(
-            select(Project)
-            .where(Project.id == project_id)
-            .options(selectinload(Project.sandbox))
+        return await self._get_with(
+            db, project_id, options=[selectinload(Project.sandbox), raiseload("*")], loaded=("sandbox",)
         )
-        return result.scalar_one_or_none()
+
+    async def get_project_and_sandbox(
+        self, db: AsyncSession, project_id: uuid.UUID
+    ) -> tuple[Project, Sandbox | None] | None:
+        """Get a project and its sandbox with a single JOIN.
+
+        Returns None if the project doesn't exist; the sandbox half is None
+        if the project has none. Ownership is left to the caller so it can
+        still tell "not found" from "not yours".
+        """
+        result = await db.execute(_WITH_SANDBOX_ROW, {"project_id": project_id})
+        row = result.first()
+        return (row.Project, row.Sandbox) if row is not None else None
+
+    async def existing_ids(self, db: AsyncSession, ids: set[uuid.UUID]) -> set[uuid.UUID]:
+        """The subset of `ids` that belong to existing projects, in one query."""
+        if not ids:
+            return set()
+        result = await db.execute(select(Project.id).where(Project.id.in_(ids)))
+        return set(result.scalars().all())
 
     async def count_by_owner(self, db: AsyncSession, owner_id: uuid.UUID) -> int:
         """Count projects owned by a user."""
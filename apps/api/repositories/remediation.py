@@ -5,12 +5,37 @@ from datetime import datetime, timezone, timedelta
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, load_only, raiseload, selectinload
 
 from apps.api.models.incident import Incident, Remediation, RemediationStatus
 from apps.api.models.project import Project
+from apps.api.pagination import Cursor
 from apps.api.repositories.base import BaseRepository
 
+# Everything the pending list reads: RemediationResponse's columns, plus
+# just the keys of the incident and project it's joined through
+_PENDING_LIST_OPTIONS = (
+    load_only(
+        Remediation.id,
+        Remediation.created_at,
+        Remediation.updated_at,
+        Remediation.fix_type,
+        Remediation.diff,
+        Remediation.files_changed,
+        Remediation.explanation,
+        Remediation.risk_level,
+        Remediation.status,
+        Remediation.pr_url,
+        Remediation.pr_number,
+        Remediation.reviewed_by,
+        Remediation.review_comment,
+    ),
+    contains_eager(Remediation.incident).options(
+        load_only(Incident.id, Incident.project_id),
+        contains_eager(Incident.project).load_only(Project.id, Project.owner_id),
+    ),
+)
+
 
 class RemediationRepository(BaseRepository[Remediation]):
     def __init__(self):
@@ -20,14 +45,15 @@ class RemediationRepository(BaseRepository[Remediation]):
         self, db: AsyncSession, remediation_id: uuid.UUID
     ) -> Remediation | None:
         """Load remediation with incident, project, and sandbox (for apply and ownership checks)."""
-        result = await db.execute(
-            select(Remediation)
-            .where(Remediation.id == remediation_id)
-            .options(
+        return await self._get_with(
+            db,
+            remediation_id,
+            options=[
                 selectinload(Remediation.incident).selectinload(Incident.project).selectinload(Project.sandbox),
-            )
+                raiseload("*"),
+            ],
+            loaded=("incident.project.sandbox",),
         )
-        return result.scalar_one_or_none()
 
     async def list_pending_for_user(
         self,
@@ -37,9 +63,11 @@ class RemediationRepository(BaseRepository[Remediation]):
         skip: int = 0,
         limit: int = 50,
         include_expired: bool = False,
+        after: Cursor | None = None,
     ) -> list[Remediation]:
         """List remediations with status=pending for projects owned by owner_id.
         Optionally exclude remediations older than 24h (expired).
+        Pass `after` (last row's created_at + id) for keyset pagination.
         """
         cutoff = (datetime.now(timezone.utc) - timedelta(hours=24)) if not include_expired else None
         q = (
@@ -51,9 +79,16 @@ class RemediationRepository(BaseRepository[Remediation]):
         )
         if cutoff is not None:
             q = q.where(Remediation.created_at >= cutoff)
-        q = q.order_by(Remediation.created_at.desc()).offset(skip).limit(limit)
-        result = await db.execute(q.options(selectinload(Remediation.incident).selectinload(Incident.project)))
-        return list(result.scalars().unique().all())
+        q = self._newest_first(q, skip=skip, limit=limit, after=after)
+        # The WHERE clause already joins incident and project, so populate
+        # remediation.incident.project from those columns — one query
+        # instead of two extra selectin round trips. Both joins are
+        # many-to-one, so each remediation is still exactly one row: no
+        # DISTINCT or Python-side .unique() pass needed, and LIMIT can
+        # stop the scan early.
+        # Only the key columns of those two are selected (_PENDING_LIST_OPTIONS).
+        result = await db.execute(q.options(*_PENDING_LIST_OPTIONS))
+        return list(result.scalars().all())
 
 
 remediation_repo = RemediationRepository()
\ No newline at end of file
@@ -1,13 +1,45 @@
 """Sandbox repository with sandbox-specific database operations."""
 
+import asyncio
 import uuid
+from dataclasses import dataclass
 
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.api.models.project import Project
 from apps.api.models.sandbox import Sandbox, SandboxStatus
 from apps.api.repositories.base import BaseRepository
 
+# Built once at import: every sandbox/chat route resolves the sandbox this way
+_GET_BY_PROJECT = select(Sandbox).where(Sandbox.project_id == bindparam("project_id"))
+
+
+@dataclass(frozen=True, slots=True)
+class SandboxRef:
+    """What the read-only sandbox routes need: the owner and where the container is."""
+
+    owner_id: uuid.UUID
+    sandbox_id: uuid.UUID | None    # None if the project has no sandbox
+    container_id: str | None
+    status: SandboxStatus | None
+    git_branch: str | None
+
+
+_REF_OF = (
+    select(Project.owner_id, Sandbox.id, Sandbox.container_id, Sandbox.status, Sandbox.git_branch)
+    .select_from(Project)
+    .outerjoin(Sandbox, Sandbox.project_id == Project.id)
+    .where(Project.id == bindparam("project_id"))
+)
+
+# project_id → SandboxRef. Writes through this repository evict the entry
+# on this worker; other workers hold it for at most the (short) TTL.
+_ref_cache: TTLCache[uuid.UUID, SandboxRef] = TTLCache(maxsize=10_000, ttl=5)
+# project_id → lock held while one request fills the cache for it
+_ref_locks: dict[uuid.UUID, asyncio.Lock] = {}
+
 
 class SandboxRepository(BaseRepository[Sandbox]):
     def __init__(self):
@@ -18,19 +50,60 @@ class SandboxRepository(BaseRepository[Sandbox]):
 
         Each project has at most one sandbox (one-to-one relationship).
         """
-        result = await db.execute(
-            select(Sandbox).where(Sandbox.project_id == project_id)
-        )
+        result = await db.execute(_GET_BY_PROJECT, {"project_id": project_id})
         return result.scalar_one_or_none()
 
+    async def get_ref(self, db: AsyncSession, project_id: uuid.UUID) -> SandboxRef | None:
+        """Get a project's owner and sandbox location (None if there's no such project), cached.
+
+        For routes that only read from the container (file browsing, git
+        status/diff): repeat calls within the TTL make no query, and
+        concurrent misses for the same project share one.
+        """
+        ref = _ref_cache.get(project_id)
+        if ref is not None:
+            return ref
+
+        lock = _ref_locks.setdefault(project_id, asyncio.Lock())
+        try:
+            async with lock:
+                ref = _ref_cache.get(project_id)
+                if ref is None:
+                    result = await db.execute(_REF_OF, {"project_id": project_id})
+                    row = result.first()
+                    if row is None:
+                        return None
+                    ref = SandboxRef(*row)
+                    # A missing sandbox is about to be created; don't pin that
+                    if ref.sandbox_id is not None:
+                        _ref_cache[project_id] = ref
+                return ref
+        finally:
+            if not lock.locked() and _ref_locks.get(project_id) is lock:
+                del _ref_locks[project_id]
+
+    def invalidate_ref(self, project_id: uuid.UUID) -> None:
+        """Drop a project's cached SandboxRef (call after changing its sandbox row)."""
+        _ref_cache.pop(project_id, None)
+
+    async def update(
+        self, db: AsyncSession, instance: Sandbox, *, commit: bool = True, **kwargs
+    ) -> Sandbox:
+        """Update a sandbox, evicting its cached SandboxRef."""
+        instance = await super().update(db, instance, commit=commit, **kwargs)
+        self.invalidate_ref(instance.project_id)
+        return instance
+
+    async def delete(self, db: AsyncSession, instance: Sandbox, *, commit: bool = True) -> None:
+        """Delete a sandbox, evicting its cached SandboxRef."""
+        self.invalidate_ref(instance.project_id)
+        await super().delete(db, instance, commit=commit)
+
     async def update_status(
-        self, db: AsyncSession, sandbox: Sandbox, status: SandboxStatus
+        self, db: AsyncSession, sandbox: Sandbox, status: SandboxStatus, *, commit: bool = True
     ) -> Sandbox:
         """Update a sandbox's status."""
-        sandbox.status = status
-        await db.commit()
-        await db.refresh(sandbox)
-        return sandbox
+        return await self.update(db, sandbox, commit=commit, status=status)
 
 
 # Singleton instance
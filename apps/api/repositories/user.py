@@ -1,11 +1,15 @@
 """User repository with user-specific database operations."""
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.models.user import User
 from apps.api.repositories.base import BaseRepository
 
+# Login and OAuth look users up on every attempt — build the statements once
+_GET_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_GET_BY_GITHUB_ID = select(User).where(User.github_id == bindparam("github_id"))
+
 
 class UserRepository(BaseRepository[User]):
     def __init__(self):
@@ -13,12 +17,12 @@ class UserRepository(BaseRepository[User]):
 
     async def get_by_email(self, db: AsyncSession, email: str) -> User | None:
         """Find a user by email address. Used during login."""
-        result = await db.execute(select(User).where(User.email == email))
+        result = await db.execute(_GET_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
     async def get_by_github_id(self, db: AsyncSession, github_id: str) -> User | None:
         """Find a user by their GitHub ID. Used during OAuth login."""
-        result = await db.execute(select(User).where(User.github_id == github_id))
+        result = await db.execute(_GET_BY_GITHUB_ID, {"github_id": github_id})
         return result.scalar_one_or_none()
 
 
@@ -0,0 +1,82 @@
+"""Response classes for the Comio API.
+
+ORJSONResponse serializes with orjson (a Rust extension) instead of the
+stdlib json module — several times faster, and it encodes datetime, UUID
+and Enum values natively so most payloads never hit a fallback encoder.
+
+It's the app's default_response_class (see main.py), so routes don't
+need to reference it unless they build a response by hand — as the
+incident, project and remediation routes do. They return plain dicts and
+declare no response_model, so FastAPI neither re-validates the payload
+nor runs it through jsonable_encoder. The schema is still published in
+OpenAPI via `responses={200: {"model": ...}}`.
+
+List responses are encoded in one orjson call rather than streamed.
+Pages are capped at 100 rows, so the buffered body is small. Streaming
+rows would also need a server-side cursor. asyncpg only opens those
+inside a transaction, and GET routes run on autocommit sessions
+(see get_db). The session would also have to outlive the
+handler.
+"""
+
+import hashlib
+from collections.abc import Callable, Iterable
+from operator import attrgetter
+from typing import Any
+
+import orjson
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        # OPT_NON_STR_KEYS matches json.dumps, which coerces int/UUID keys to strings;
+        # OPT_UTC_Z writes UTC datetimes as "...Z", like Pydantic's JSON mode
+        return orjson.dumps(content, option=_OPTIONS)
+
+
+def attrs_to_dict(fields: Iterable[str]) -> Callable[[Any], dict[str, Any]]:
+    """Build a function that copies the named attributes of an object into a dict.
+
+    The response helpers map ORM rows to schema-shaped dicts field by
+    field; attrgetter does all the attribute reads in one C call, which
+    beats a Python-level dict literal on list endpoints. Pass the schema's
+    own field names (e.g. tuple(ProjectResponse.model_fields)) so the dict
+    can't drift from the schema.
+    """
+    fields = tuple(fields)
+    getter = attrgetter(*fields)
+    if len(fields) == 1:
+        return lambda obj: {fields[0]: getter(obj)}
+    return lambda obj: dict(zip(fields, getter(obj)))
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header value covers `etag` (weak comparison)."""
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def etag_response(request: Request, content: Any) -> Response:
+    """A JSON response with an ETag, or an empty 304 if the client already has it.
+
+    For endpoints the frontend polls whose payload rarely changes (file
+    trees, git status): the body is encoded once and hashed, and a client
+    that sends the same tag back in If-None-Match gets no body at all.
+    blake2b is in the stdlib and fast enough at these sizes.
+    """
+    body = orjson.dumps(content, option=_OPTIONS)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=ORJSONResponse.media_type, headers=headers)
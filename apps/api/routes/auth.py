@@ -5,18 +5,22 @@ These endpoints handle:
 - Logging in (returns a JWT token)
 - Refreshing an expiring token (get a new one without re-entering password)
 - Getting the currently logged-in user's profile
+- Flushing the auth caches (admins only)
 """
 
 from fastapi import APIRouter, Depends
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-import httpx
 
-from apps.api.auth import hash_password, verify_password, create_access_token, get_current_user
+from apps.api.auth import hash_password, verify_password, create_access_token, get_current_user, require_role
+from apps.api.auth.jwt import clear_token_cache
+from apps.api.auth.user_loader import clear_user_cache, invalidate_user
 from apps.api.database import get_db
 from apps.api.exceptions import ComioException, UnauthorizedException
-from apps.api.models.user import User
+from apps.api.models.user import User, UserRole
 from apps.api.repositories import user_repo
+from apps.api.responses import attrs_to_dict
+from apps.api.services.http_client import get_http_client
 from apps.api.schemas.user import (
     UserCreate,
     UserResponse,
@@ -27,26 +31,27 @@ from apps.api.schemas.user import (
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# A real 12-round bcrypt hash of a throwaway password. Logins for unknown
+# emails verify against it so they take as long as a wrong password —
+# response time doesn't reveal which emails have accounts.
+_DUMMY_HASH = "$2b$12$FUASI/T5EEj1VrEqsPxRceYOAAcPuPTilg4fQKAIhEIcDeZf9GzTu"
+
 
 # ── Helper ────────────────────────────────────────────
 
+# UserResponse's fields, read off a User in one attrgetter call. The
+# schema excludes password and tokens, so this can't leak them.
+_user_fields = attrs_to_dict(UserResponse.model_fields)
+
+
 def _user_to_response(user: User) -> UserResponse:
     """Convert a User model to a UserResponse schema.
 
-    Avoids repeating the same field mapping in every route.
+    Avoids repeating the same field mapping in every route. The User row
+    is already trusted data, so model_construct skips validating it here;
+    FastAPI still checks the route's response_model on the way out.
     """
-    return UserResponse(
-        id=user.id,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-        email=user.email,
-        full_name=user.full_name,
-        role=user.role,
-        is_active=user.is_active,
-        github_username=user.github_username,
-        avatar_url=user.avatar_url,
-        llm_provider=user.llm_provider,
-    )
+    return UserResponse.model_construct(**_user_fields(user))
 
 
 @router.post("/register", response_model=TokenResponse, status_code=201)
@@ -74,12 +79,12 @@ async def register(
     user = await user_repo.create(
         db,
         email=body.email,
-        hashed_password=hash_password(body.password),
+        hashed_password=await hash_password(body.password),
         full_name=body.full_name,
     )
 
     # Generate a JWT token so they're logged in immediately
-    access_token, expires_in = create_access_token(user.id)
+    access_token, expires_in = create_access_token(user)
 
     return TokenResponse(
         access_token=access_token,
@@ -105,10 +110,12 @@ async def login(
     # Look up the user by email (form_data.username contains the email)
     user = await user_repo.get_by_email(db, form_data.username)
     if not user or not user.hashed_password:
+        # Spend the same bcrypt time as a real check before failing
+        await verify_password(form_data.password, _DUMMY_HASH)
         raise UnauthorizedException("Invalid email or password")
 
     # Verify the password against the stored hash
-    if not verify_password(form_data.password, user.hashed_password):
+    if not await verify_password(form_data.password, user.hashed_password):
         raise UnauthorizedException("Invalid email or password")
 
     # Check account is active
@@ -116,7 +123,7 @@ async def login(
         raise UnauthorizedException("Account is deactivated")
 
     # Generate JWT token
-    access_token, expires_in = create_access_token(user.id)
+    access_token, expires_in = create_access_token(user)
 
     return TokenResponse(
         access_token=access_token,
@@ -140,7 +147,7 @@ async def refresh_token(current_user: User = Depends(get_current_user)):
     If the old token has already expired, this returns 401
     and the user must log in again.
     """
-    access_token, expires_in = create_access_token(current_user.id)
+    access_token, expires_in = create_access_token(current_user)
 
     return TokenResponse(
         access_token=access_token,
@@ -171,8 +178,8 @@ async def update_llm_settings(
     current_user.llm_api_key = body.llm_api_key
 
     db.add(current_user)
-    await db.commit()
-    await db.refresh(current_user)
+    await db.commit()  # updated_at comes back on the UPDATE's RETURNING; no refresh needed
+    invalidate_user(current_user.id)
 
     return _user_to_response(current_user)
 
@@ -191,15 +198,14 @@ async def connect_github(
     - avatar_url
     - github_access_token
     """
-    async with httpx.AsyncClient() as client:
-      resp = await client.get(
-          "https://api.github.com/user",
-          headers={
-              "Authorization": f"token {body.personal_access_token}",
-              "Accept": "application/vnd.github+json",
-          },
-          timeout=10.0,
-      )
+    resp = await get_http_client().get(
+        "https://api.github.com/user",
+        headers={
+            "Authorization": f"token {body.personal_access_token}",
+            "Accept": "application/vnd.github+json",
+        },
+        timeout=10.0,
+    )
     if resp.status_code != 200:
         raise ComioException(
             message="Failed to verify GitHub token; check that it is valid and has appropriate scopes.",
@@ -213,7 +219,20 @@ async def connect_github(
     current_user.avatar_url = data.get("avatar_url")
 
     db.add(current_user)
-    await db.commit()
-    await db.refresh(current_user)
+    await db.commit()  # updated_at comes back on the UPDATE's RETURNING; no refresh needed
+    invalidate_user(current_user.id)
 
-    return _user_to_response(current_user)
\ No newline at end of file
+    return _user_to_response(current_user)
+
+
+@router.post("/cache/clear", status_code=204, dependencies=[Depends(require_role(UserRole.ADMIN))])
+async def clear_auth_caches():
+    """Flush the in-process token-decode and user caches (admins only).
+
+    Both expire on their own within a minute; this is for when a change
+    made outside the API (e.g. deactivating a user directly in the
+    database) must take effect at once. Only this worker's caches are
+    cleared.
+    """
+    clear_token_cache()
+    clear_user_cache()
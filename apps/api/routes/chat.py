@@ -11,14 +11,17 @@ For now, we use REST — the response includes all events at once.
 
 import uuid
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.auth import get_current_user
 from apps.api.database import get_db
 from apps.api.exceptions import NotFoundException, ForbiddenException, ComioException
 from apps.api.models.user import User
-from apps.api.repositories import project_repo, sandbox_repo
+from apps.api.pagination import decode_cursor, next_cursor
+from apps.api.repositories import project_repo
+from apps.api.responses import ORJSONResponse
 from apps.api.schemas.chat import ChatSessionCreate, ChatMessageSend
 from apps.api.services.chat_service import chat_service
 
@@ -33,19 +36,32 @@ async def _get_sandbox_for_chat(
     db: AsyncSession,
 ):
     """Verify project ownership and get the sandbox."""
-    project = await project_repo.get_by_id(db, project_id)
-    if not project:
+    row = await project_repo.get_project_and_sandbox(db, project_id)
+    if not row:
         raise NotFoundException("Project", str(project_id))
+    project, sandbox = row
     if project.owner_id != current_user.id:
         raise ForbiddenException("You don't have access to this project")
 
-    sandbox = await sandbox_repo.get_by_project(db, project_id)
     if not sandbox:
         raise ComioException("No sandbox exists for this project", status_code=404)
 
     return project, sandbox
 
 
+def _json_with_messages(head: dict, messages_json: bytes) -> Response:
+    """Respond with `head` plus a "messages" key holding pre-built JSON.
+
+    The messages array comes from Postgres already encoded (see
+    ChatMessageRepository.messages_as_json), so it's spliced in as bytes
+    rather than decoded and re-serialized.
+    """
+    return Response(
+        content=orjson.dumps(head)[:-1] + b',"messages":' + messages_json + b"}",
+        media_type="application/json",
+    )
+
+
 # ── Session Routes ────────────────────────────────────
 
 @router.post("/sessions", status_code=201)
@@ -65,39 +81,49 @@ async def create_session(
         title=body.title,
     )
 
+    # UUIDs and datetimes are encoded natively by the default ORJSONResponse
     return {
-        "id": str(session.id),
+        "id": session.id,
         "title": session.title,
         "is_active": session.is_active,
-        "sandbox_id": str(session.sandbox_id),
-        "user_id": str(session.user_id),
-        "created_at": session.created_at.isoformat(),
+        "sandbox_id": session.sandbox_id,
+        "user_id": session.user_id,
+        "created_at": session.created_at,
     }
 
 
 @router.get("/sessions")
 async def list_sessions(
     project_id: uuid.UUID,
+    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all chat sessions for this project's sandbox."""
+    """List chat sessions for this project's sandbox, newest first.
+
+    Pass the response's next_cursor as `cursor` to fetch the next page.
+    `total` counts all of the sandbox's sessions; it is null on cursor pages.
+    """
     project, sandbox = await _get_sandbox_for_chat(project_id, current_user, db)
 
-    sessions = await chat_service.list_sessions(db, sandbox.id)
+    sessions, total = await chat_service.list_session_summaries(
+        db, sandbox.id, after=decode_cursor(cursor), limit=limit
+    )
 
-    return {
+    return ORJSONResponse({
         "sessions": [
             {
-                "id": str(s.id),
+                "id": s.id,
                 "title": s.title,
                 "is_active": s.is_active,
-                "created_at": s.created_at.isoformat(),
+                "created_at": s.created_at,
             }
             for s in sessions
         ],
-        "total": len(sessions),
-    }
+        "total": total,
+        "next_cursor": next_cursor(sessions, limit),
+    })
 
 
 @router.get("/sessions/{session_id}")
@@ -110,30 +136,24 @@ async def get_session(
     """Get a chat session with all its messages."""
     project, sandbox = await _get_sandbox_for_chat(project_id, current_user, db)
 
-    session = await chat_service.get_session_with_messages(db, session_id)
+    session = await chat_service.get_session(db, session_id)
     if not session:
         raise NotFoundException("ChatSession", str(session_id))
     if session.sandbox_id != sandbox.id:
         raise ForbiddenException("Session does not belong to this sandbox")
 
-    return {
-        "id": str(session.id),
-        "title": session.title,
-        "is_active": session.is_active,
-        "sandbox_id": str(session.sandbox_id),
-        "created_at": session.created_at.isoformat(),
-        "messages": [
-            {
-                "id": str(m.id),
-                "role": m.role.value if hasattr(m.role, 'value') else m.role,
-                "content": m.content,
-                "tool_calls": m.tool_calls,
-                "files_modified": m.files_modified,
-                "created_at": m.created_at.isoformat(),
-            }
-            for m in session.messages
-        ],
-    }
+    messages_json, _ = await chat_service.get_messages_json(db, session_id)
+
+    return _json_with_messages(
+        {
+            "id": session.id,
+            "title": session.title,
+            "is_active": session.is_active,
+            "sandbox_id": session.sandbox_id,
+            "created_at": session.created_at,
+        },
+        messages_json,
+    )
 
 
 @router.delete("/sessions/{session_id}", status_code=204)
@@ -173,22 +193,9 @@ async def get_messages(
     if session.sandbox_id != sandbox.id:
         raise ForbiddenException("Session does not belong to this sandbox")
 
-    messages = await chat_service.get_messages(db, session_id)
+    messages_json, total = await chat_service.get_messages_json(db, session_id)
 
-    return {
-        "messages": [
-            {
-                "id": str(m.id),
-                "role": m.role.value if hasattr(m.role, 'value') else m.role,
-                "content": m.content,
-                "tool_calls": m.tool_calls,
-                "files_modified": m.files_modified,
-                "created_at": m.created_at.isoformat(),
-            }
-            for m in messages
-        ],
-        "total": len(messages),
-    }
+    return _json_with_messages({"total": total}, messages_json)
 
 
 @router.post("/sessions/{session_id}/messages")
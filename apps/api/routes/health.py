@@ -1,18 +1,41 @@
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import Response
 
 from apps.api.config import settings
+from apps.api.database import engine
 
 router = APIRouter()
 
+# The health payload never changes for the life of the process, so it's
+# serialized once — liveness/readiness probes just get the cached bytes.
+_HEALTH_BYTES = orjson.dumps({
+    "status": "ok",
+    "name": settings.app_name,
+    "version": settings.app_version,
+})
+
 @router.get("/health")
-async def health_check():
+async def health_check() -> Response:
     """ Health check endpoint 
 
     Returns service status, name and version.
     Used by Docker, Kubernetes, and load balancers to verify the service is alive.
     """
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+@router.get("/health/db")
+async def db_pool_health():
+    """Connection pool stats for this worker (no query is run).
+
+    checked_out near pool_size + max_overflow means requests are about
+    to start waiting on pool_timeout.
+    """
+    pool = engine.pool
     return {
-        "status": "ok",
-        "name": settings.app_name,
-        "version": settings.app_version,
-    }
\ No newline at end of file
+        "pool_size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "status": pool.status(),
+    }
@@ -11,15 +11,19 @@ import logging
 import uuid
 
 from fastapi import APIRouter, Body, Depends, Query
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from apps.api.auth import get_current_user
 from apps.api.database import get_db
 from apps.api.exceptions import NotFoundException, ForbiddenException, ComioException
-from apps.api.models.incident import Incident, IncidentStatus
+from apps.api.models.incident import Diagnosis, Incident, IncidentStatus
 from apps.api.models.user import User
+from apps.api.pagination import decode_cursor, next_cursor
 from apps.api.repositories import project_repo
 from apps.api.repositories.incident import incident_repo
+from apps.api.responses import ORJSONResponse, attrs_to_dict
 from apps.api.services.rca_service import rca_service
 from apps.api.services.approval_service import approve as approval_approve, reject as approval_reject
 from apps.api.schemas.incident import (
@@ -38,93 +42,95 @@ router = APIRouter(prefix="/incidents", tags=["incidents"])
 
 # ── Helpers ───────────────────────────────────────────
 
-def _diagnosis_to_response(diagnosis) -> DiagnosisResponse | None:
-    """Convert a Diagnosis model to its response schema."""
+# Column fields of each response schema (relations are filled in separately)
+_diagnosis_fields = attrs_to_dict(DiagnosisResponse.model_fields)
+_remediation_fields = attrs_to_dict(RemediationResponse.model_fields)
+_incident_fields = attrs_to_dict(
+    name for name in IncidentResponse.model_fields if name not in ("diagnosis", "remediation")
+)
+
+
+# Diagnosis columns filled from an RCA result (everything but identity/timestamps)
+_DIAGNOSIS_RESULT_COLUMNS = tuple(
+    attr.key
+    for attr in inspect(Diagnosis).column_attrs
+    if attr.key not in ("id", "created_at", "updated_at", "incident_id")
+)
+
+
+def _diagnosis_to_dict(diagnosis) -> dict | None:
+    """A Diagnosis as a DiagnosisResponse-shaped dict."""
     if not diagnosis:
         return None
-    return DiagnosisResponse(
-        id=diagnosis.id,
-        created_at=diagnosis.created_at,
-        updated_at=diagnosis.updated_at,
-        root_cause=diagnosis.root_cause,
-        category=diagnosis.category,
-        confidence=diagnosis.confidence,
-        explanation=diagnosis.explanation,
-        evidence=diagnosis.evidence,
-        affected_components=diagnosis.affected_components,
-        suggested_actions=diagnosis.suggested_actions,
-        llm_provider=diagnosis.llm_provider,
-        llm_model=diagnosis.llm_model,
-    )
+    return _diagnosis_fields(diagnosis)
 
 
-def _remediation_to_response(remediation) -> RemediationResponse | None:
-    """Convert a Remediation model to its response schema."""
+def _remediation_to_dict(remediation) -> dict | None:
+    """A Remediation as a RemediationResponse-shaped dict."""
     if not remediation:
         return None
-    return RemediationResponse(
-        id=remediation.id,
-        created_at=remediation.created_at,
-        updated_at=remediation.updated_at,
-        fix_type=remediation.fix_type,
-        diff=remediation.diff,
-        files_changed=remediation.files_changed,
-        explanation=remediation.explanation,
-        risk_level=remediation.risk_level,
-        status=remediation.status,
-        pr_url=remediation.pr_url,
-        pr_number=remediation.pr_number,
-        reviewed_by=remediation.reviewed_by,
-        review_comment=remediation.review_comment,
-    )
+    return _remediation_fields(remediation)
+
 
+def _incident_to_dict(incident: Incident, include_relations: bool = False) -> dict:
+    """An incident as an IncidentResponse-shaped dict.
 
-def _incident_to_response(incident: Incident, include_relations: bool = False) -> IncidentResponse:
-    """Convert an Incident model to its response schema.
+    Routes hand this straight to ORJSONResponse, which encodes the UUIDs,
+    datetimes and enums itself. The rows are trusted data, so there's no
+    Pydantic instance to build and no response_model pass to re-validate
+    and dump it; the schema is still documented via `responses=`.
 
     Args:
         include_relations: If True, include diagnosis and remediation.
             Only set this when the incident was loaded with selectinload
-            (e.g. via get_with_details). For freshly created incidents
+            (e.g. via _get_owned_incident). For freshly created incidents
             or list queries, set to False to avoid lazy loading errors.
     """
-    diagnosis = None
-    remediation = None
-
+    d = _incident_fields(incident)
     if include_relations:
         # Safe to access — these were eagerly loaded
-        diagnosis = _diagnosis_to_response(incident.diagnosis)
-        remediation = _remediation_to_response(incident.remediation)
-
-    return IncidentResponse(
-        id=incident.id,
-        created_at=incident.created_at,
-        updated_at=incident.updated_at,
-        title=incident.title,
-        description=incident.description,
-        severity=incident.severity,
-        status=incident.status,
-        source=incident.source,
-        project_id=incident.project_id,
-        diagnosis=diagnosis,
-        remediation=remediation,
-    )
+        d["diagnosis"] = _diagnosis_to_dict(incident.diagnosis)
+        d["remediation"] = _remediation_to_dict(incident.remediation)
+    else:
+        d["diagnosis"] = d["remediation"] = None
+    return d
 
 
 async def _verify_project_ownership(
     project_id: uuid.UUID, current_user: User, db: AsyncSession
 ) -> None:
-    """Verify the user owns the project this incident belongs to."""
-    project = await project_repo.get_by_id(db, project_id)
-    if not project:
+    """Verify the user owns the project this incident belongs to.
+
+    Reads only the (cached) owner_id, not the project row.
+    """
+    owner_id = await project_repo.get_owner_id(db, project_id)
+    if owner_id is None:
         raise NotFoundException("Project", str(project_id))
-    if project.owner_id != current_user.id:
+    if owner_id != current_user.id:
         raise ForbiddenException("You don't have access to this project's incidents")
 
 
+async def _get_owned_incident(
+    incident_id: uuid.UUID, current_user: User, db: AsyncSession
+) -> Incident:
+    """Fetch an incident with its diagnosis and remediation, checking ownership.
+
+    One query returns the incident and its project's owner together.
+    """
+    row = await incident_repo.get_with_details_and_owner(db, incident_id)
+    if not row:
+        raise NotFoundException("Incident", str(incident_id))
+    incident, owner_id = row
+    if owner_id != current_user.id:
+        raise ForbiddenException("You don't have access to this project's incidents")
+    return incident
+
+
 # ── Routes ────────────────────────────────────────────
 
-@router.post("", response_model=IncidentResponse, status_code=201)
+@router.post(
+    "", status_code=201, response_model=None, responses={201: {"model": IncidentResponse}}
+)
 async def create_incident(
     body: IncidentCreate,
     current_user: User = Depends(get_current_user),
@@ -147,14 +153,15 @@ async def create_incident(
         project_id=body.project_id,
     )
 
-    return _incident_to_response(incident)
+    return ORJSONResponse(_incident_to_dict(incident), status_code=201)
 
 
-@router.get("", response_model=IncidentListResponse)
+@router.get("", response_model=None, responses={200: {"model": IncidentListResponse}})
 async def list_incidents(
     project_id: uuid.UUID = Query(description="Filter incidents by project ID"),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -162,35 +169,36 @@ async def list_incidents(
 
     Requires project_id as a query parameter:
         GET /incidents?project_id=<uuid>
+    Pass the response's next_cursor as `cursor` to fetch the next page.
     """
     await _verify_project_ownership(project_id, current_user, db)
 
-    incidents = await incident_repo.get_by_project(db, project_id, skip=skip, limit=limit)
-    total = await incident_repo.count_by_project(db, project_id)
-
-    return IncidentListResponse(
-        incidents=[_incident_to_response(i) for i in incidents],
-        total=total,
+    incidents, total = await incident_repo.list_by_project(
+        db, project_id, skip=skip, limit=limit, after=decode_cursor(cursor)
     )
 
+    return ORJSONResponse({
+        "incidents": list(map(_incident_to_dict, incidents)),
+        "total": total,
+        "next_cursor": next_cursor(incidents, limit),
+    })
 
-@router.get("/{incident_id}", response_model=IncidentResponse)
+
+@router.get("/{incident_id}", response_model=None, responses={200: {"model": IncidentResponse}})
 async def get_incident(
     incident_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get incident details including diagnosis and remediation (if available)."""
-    incident = await incident_repo.get_with_details(db, incident_id)
-    if not incident:
-        raise NotFoundException("Incident", str(incident_id))
+    incident = await _get_owned_incident(incident_id, current_user, db)
 
-    await _verify_project_ownership(incident.project_id, current_user, db)
+    return ORJSONResponse(_incident_to_dict(incident, include_relations=True))
 
-    return _incident_to_response(incident, include_relations=True)
 
-
-@router.get("/{incident_id}/diagnosis", response_model=DiagnosisResponse)
+@router.get(
+    "/{incident_id}/diagnosis", response_model=None, responses={200: {"model": DiagnosisResponse}}
+)
 async def get_diagnosis(
     incident_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -201,19 +209,17 @@ async def get_diagnosis(
     Returns the AI-generated root cause analysis, affected components,
     and suggested actions.
     """
-    incident = await incident_repo.get_with_details(db, incident_id)
-    if not incident:
-        raise NotFoundException("Incident", str(incident_id))
-
-    await _verify_project_ownership(incident.project_id, current_user, db)
+    incident = await _get_owned_incident(incident_id, current_user, db)
 
     if not incident.diagnosis:
         raise NotFoundException("Diagnosis", "No diagnosis available for this incident")
 
-    return _diagnosis_to_response(incident.diagnosis)
+    return ORJSONResponse(_diagnosis_to_dict(incident.diagnosis))
 
 
-@router.post("/{incident_id}/diagnose", response_model=IncidentResponse)
+@router.post(
+    "/{incident_id}/diagnose", response_model=None, responses={200: {"model": IncidentResponse}}
+)
 async def trigger_diagnosis(
     incident_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -228,17 +234,7 @@ async def trigger_diagnosis(
     
     Note: This will replace any existing diagnosis.
     """
-    incident = await incident_repo.get_with_details(db, incident_id)
-    if not incident:
-        raise NotFoundException("Incident", str(incident_id))
-
-    await _verify_project_ownership(incident.project_id, current_user, db)
-
-    # If diagnosis exists, delete it first
-    if incident.diagnosis:
-        await db.delete(incident.diagnosis)
-        await db.commit()
-        await db.refresh(incident)
+    incident = await _get_owned_incident(incident_id, current_user, db)
 
     # Run RCA
     logger = logging.getLogger(__name__)
@@ -246,32 +242,28 @@ async def trigger_diagnosis(
     
     diagnosis_result = await rca_service.rca_engine.diagnose(db, incident)
 
-    # Create database Diagnosis model
-    from apps.api.models.incident import Diagnosis as DiagnosisModel
-    from apps.api.config import settings
-    
-    diagnosis_model = DiagnosisModel(
-        incident_id=incident.id,
-        root_cause=diagnosis_result.root_cause,
-        category=diagnosis_result.category.value,
-        confidence=diagnosis_result.confidence,
-        explanation=diagnosis_result.reasoning,
-        evidence=[e.__dict__ for e in diagnosis_result.evidence],
-        affected_components=diagnosis_result.affected_components,
-        suggested_actions=[a.__dict__ for a in diagnosis_result.suggested_actions],
-        llm_provider=settings.default_llm_provider,
-        llm_model=settings.default_llm_model,
-    )
-    
-    db.add(diagnosis_model)
+    # Create database Diagnosis model. An existing diagnosis is overwritten
+    # in place — one UPDATE, rather than a DELETE flushed ahead of an INSERT
+    # (diagnoses.incident_id is unique). Either way it's written only after
+    # RCA succeeded, so a failed run leaves the old diagnosis intact.
+    diagnosis_model = rca_service.to_model(incident.id, diagnosis_result)
+    if incident.diagnosis:
+        for key in _DIAGNOSIS_RESULT_COLUMNS:
+            setattr(incident.diagnosis, key, getattr(diagnosis_model, key))
+        diagnosis_model = incident.diagnosis
+    else:
+        db.add(diagnosis_model)
     incident.status = IncidentStatus.DIAGNOSED
     await db.commit()
-    await db.refresh(incident)
 
-    return _incident_to_response(incident, include_relations=True)
+    # Point the loaded incident at the new diagnosis instead of reloading it
+    set_committed_value(incident, "diagnosis", diagnosis_model)
+    return ORJSONResponse(_incident_to_dict(incident, include_relations=True))
 
 
-@router.post("/{incident_id}/generate-fix", response_model=IncidentResponse)
+@router.post(
+    "/{incident_id}/generate-fix", response_model=None, responses={200: {"model": IncidentResponse}}
+)
 async def generate_fix(
     incident_id: uuid.UUID,
     body: GenerateFixRequest = Body(default_factory=GenerateFixRequest),
@@ -284,26 +276,24 @@ async def generate_fix(
     Optionally pass code_context (file path -> content) from the project sandbox
     so the LLM can propose concrete code changes.
     """
-    incident = await incident_repo.get_with_details(db, incident_id)
-    if not incident:
-        raise NotFoundException("Incident", str(incident_id))
-
-    await _verify_project_ownership(incident.project_id, current_user, db)
+    incident = await _get_owned_incident(incident_id, current_user, db)
 
     try:
         from apps.api.services.fix_service import generate_fix_for_incident
 
-        await generate_fix_for_incident(db, incident_id, code_context=body.code_context or None)
+        remediation = await generate_fix_for_incident(db, incident_id, code_context=body.code_context or None)
         await db.commit()
     except ValueError as e:
         raise ComioException(str(e), status_code=400)
 
-    await db.refresh(incident)
-    incident = await incident_repo.get_with_details(db, incident_id)
-    return _incident_to_response(incident, include_relations=True)
+    # The incident is already loaded; attach the new remediation rather than reloading
+    set_committed_value(incident, "remediation", remediation)
+    return ORJSONResponse(_incident_to_dict(incident, include_relations=True))
 
 
-@router.post("/{incident_id}/approve", response_model=IncidentResponse)
+@router.post(
+    "/{incident_id}/approve", response_model=None, responses={200: {"model": IncidentResponse}}
+)
 async def approve_remediation(
     incident_id: uuid.UUID,
     body: RemediationApprove,
@@ -315,21 +305,19 @@ async def approve_remediation(
     After approval, use POST /remediations/{id}/apply to create the PR.
     Only operators and admins can approve. Pending remediations expire after 24h.
     """
-    incident = await incident_repo.get_with_details(db, incident_id)
-    if not incident:
-        raise NotFoundException("Incident", str(incident_id))
-
-    await _verify_project_ownership(incident.project_id, current_user, db)
+    incident = await _get_owned_incident(incident_id, current_user, db)
 
     if not incident.remediation:
         raise ComioException("No remediation proposed for this incident", status_code=400)
 
+    # approve() updates the same (identity-mapped) Remediation incident.remediation points at
     await approval_approve(db, incident.remediation.id, current_user, comment=body.comment)
-    incident = await incident_repo.get_with_details(db, incident_id)
-    return _incident_to_response(incident, include_relations=True)
+    return ORJSONResponse(_incident_to_dict(incident, include_relations=True))
 
 
-@router.post("/{incident_id}/reject", response_model=IncidentResponse)
+@router.post(
+    "/{incident_id}/reject", response_model=None, responses={200: {"model": IncidentResponse}}
+)
 async def reject_remediation(
     incident_id: uuid.UUID,
     body: RemediationReject,
@@ -337,15 +325,11 @@ async def reject_remediation(
     db: AsyncSession = Depends(get_db),
 ):
     """Reject a proposed remediation with a reason. Only operators and admins can reject."""
-    incident = await incident_repo.get_with_details(db, incident_id)
-    if not incident:
-        raise NotFoundException("Incident", str(incident_id))
-
-    await _verify_project_ownership(incident.project_id, current_user, db)
+    incident = await _get_owned_incident(incident_id, current_user, db)
 
     if not incident.remediation:
         raise ComioException("No remediation proposed for this incident", status_code=400)
 
+    # reject() updates the same (identity-mapped) Remediation incident.remediation points at
     await approval_reject(db, incident.remediation.id, current_user, reason=body.reason)
-    incident = await incident_repo.get_with_details(db, incident_id)
-    return _incident_to_response(incident, include_relations=True)
\ No newline at end of file
+    return ORJSONResponse(_incident_to_dict(incident, include_relations=True))
\ No newline at end of file
@@ -4,17 +4,21 @@ All routes are protected — require a valid JWT token.
 Users can only access their OWN projects.
 """
 
+import re
 import uuid
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from logging import getLogger
 from apps.api.auth import get_current_user
 from apps.api.database import get_db
-from apps.api.exceptions import NotFoundException, ForbiddenException
+from apps.api.exceptions import ComioException, NotFoundException, ForbiddenException
 from apps.api.models.project import Project, ProjectOrigin, ProjectType
+from apps.api.models.sandbox import Sandbox, SandboxStatus
 from apps.api.models.user import User
+from apps.api.pagination import decode_cursor, next_cursor
 from apps.api.repositories import project_repo, sandbox_repo
+from apps.api.responses import ORJSONResponse, attrs_to_dict
 from apps.api.services.sandbox_manager import sandbox_manager
 from apps.api.schemas.project import (
     ProjectImport,
@@ -27,27 +31,24 @@ from apps.api.schemas.project import (
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 logger = getLogger(__name__)
+
+# "https://github.com/user/my-api" → owner "user", repo "my-api"
+_REPO_URL_RE = re.compile(r"^https?://[^/]+/(?P<owner>[^/]+)/(?P<repo>[^/]+?)/?$")
+
 # ── Helper ────────────────────────────────────────────
 
-def _project_to_response(project: Project) -> ProjectResponse:
-    """Convert a Project model to a ProjectResponse schema.
+_project_fields = attrs_to_dict(ProjectResponse.model_fields)
+
 
-    This avoids repeating the same field mapping in every route.
+def _project_to_dict(project: Project) -> dict:
+    """A Project as a ProjectResponse-shaped dict.
+
+    Routes return it through ORJSONResponse, which encodes the UUIDs,
+    datetimes and enums directly. The row is already trusted data, so no
+    ProjectResponse is built or re-validated on the way out; the schema
+    is documented via `responses=` instead of response_model.
     """
-    return ProjectResponse(
-        id=project.id,
-        created_at=project.created_at,
-        updated_at=project.updated_at,
-        name=project.name,
-        description=project.description,
-        origin=project.origin,
-        project_type=project.project_type,
-        repo_url=project.repo_url,
-        repo_full_name=project.repo_full_name,
-        default_branch=project.default_branch,
-        owner_id=project.owner_id,
-        monitoring_config=project.monitoring_config,
-    )
+    return _project_fields(project)
 
 
 async def _get_user_project(
@@ -68,11 +69,31 @@ async def _get_user_project(
     return project
 
 
+async def _queue_sandbox(db: AsyncSession, project: Project, background: BackgroundTasks) -> None:
+    """Record a CREATING sandbox for a new project and provision it after the response.
+
+    Cloning a repo or starting a container takes seconds; the project row
+    and its placeholder sandbox are committed together, and the Docker work
+    runs as a background task. Clients poll GET /projects/{id}/sandbox for
+    RUNNING (or ERROR).
+    """
+    await sandbox_repo.create(
+        db,
+        project_id=project.id,
+        git_branch=project.default_branch,
+        status=SandboxStatus.CREATING,
+    )
+    background.add_task(sandbox_manager.provision_sandbox, project.id)
+
+
 # ── Routes ────────────────────────────────────────────
 
-@router.post("/import", response_model=ProjectResponse, status_code=201)
+@router.post(
+    "/import", status_code=201, response_model=None, responses={201: {"model": ProjectResponse}}
+)
 async def import_project(
     body: ProjectImport,
+    background: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -81,20 +102,23 @@ async def import_project(
     What happens:
     1. Parse the repo URL to extract owner/repo name
     2. Create a Project record with origin="cloned"
-    3. (Future: Day 5) SandboxManager will clone the repo into a Docker container
+    3. After responding, SandboxManager clones the repo into a Docker container
+       (the sandbox's status goes from "creating" to "running", or "error")
 
     Example:
         POST /projects/import
         { "repo_url": "https://github.com/user/my-api" }
     """
-    # Extract repo name from URL if name not provided
-    # "https://github.com/user/my-api" → "my-api"
-    repo_name = body.repo_url.rstrip("/").split("/")[-1]
-    # "https://github.com/user/my-api" → "user/my-api"
-    repo_full_name = "/".join(body.repo_url.rstrip("/").split("/")[-2:])
+    # "https://github.com/user/my-api" → "my-api" (default name) and "user/my-api"
+    match = _REPO_URL_RE.match(body.repo_url)
+    if not match:
+        raise ComioException("Invalid repo URL; expected https://<host>/<owner>/<repo>", status_code=400)
+    repo_name = match["repo"]
+    repo_full_name = f"{match['owner']}/{repo_name}"
 
     project = await project_repo.create(
         db,
+        commit=False,
         name=body.name or repo_name,
         description=body.description,
         origin=ProjectOrigin.CLONED,
@@ -104,18 +128,18 @@ async def import_project(
         owner_id=current_user.id,
     )
 
-    # Clone the repo into a sandbox container
-    try:
-        await sandbox_manager.create_sandbox(db, project)
-    except Exception as e:
-        logger.warning("Sandbox creation failed (will retry later): %s", e)
+    # Clone the repo into a sandbox container after responding
+    await _queue_sandbox(db, project, background)
 
-    return _project_to_response(project)
+    return ORJSONResponse(_project_to_dict(project), status_code=201)
 
 
-@router.post("/create", response_model=ProjectResponse, status_code=201)
+@router.post(
+    "/create", status_code=201, response_model=None, responses={201: {"model": ProjectResponse}}
+)
 async def create_project(
     body: ProjectCreate,
+    background: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -123,7 +147,8 @@ async def create_project(
 
     What happens:
     1. Create a Project record with origin="created"
-    2. (Future: Day 5) SandboxManager will create a blank sandbox with git init
+    2. After responding, SandboxManager creates a blank sandbox with git init
+       (the sandbox's status goes from "creating" to "running", or "error")
     3. (Future: Day 7) The AI chat agent will scaffold the project
 
     Example:
@@ -132,6 +157,7 @@ async def create_project(
     """
     project = await project_repo.create(
         db,
+        commit=False,
         name=body.name,
         description=body.description,
         origin=ProjectOrigin.CREATED,
@@ -139,38 +165,39 @@ async def create_project(
         owner_id=current_user.id,
     )
 
-    # Create a blank sandbox container (AI will scaffold files later)
-    try:
-        await sandbox_manager.create_blank_sandbox(db, project)
-    except Exception as e:
-        logger.warning("Sandbox creation failed (will retry later): %s", e)
+    # Create a blank sandbox container after responding (AI will scaffold files later)
+    await _queue_sandbox(db, project, background)
 
-    return _project_to_response(project)
+    return ORJSONResponse(_project_to_dict(project), status_code=201)
 
 
-@router.get("", response_model=ProjectListResponse)
+@router.get("", response_model=None, responses={200: {"model": ProjectListResponse}})
 async def list_projects(
     skip: int = Query(default=0, ge=0, description="Number of projects to skip"),
     limit: int = Query(default=20, ge=1, le=100, description="Max projects to return"),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """List all projects owned by the current user.
 
     Supports pagination:
-        GET /projects?skip=0&limit=20   → first 20 projects
-        GET /projects?skip=20&limit=20  → next 20 projects
+        GET /projects?limit=20                → first 20 projects
+        GET /projects?limit=20&cursor=<next>  → next 20 projects
+    (skip=N still works, but cursors stay fast on deep pages.)
     """
-    projects = await project_repo.get_by_owner(db, current_user.id, skip=skip, limit=limit)
-    total = await project_repo.count_by_owner(db, current_user.id)
-
-    return ProjectListResponse(
-        projects=[_project_to_response(p) for p in projects],
-        total=total,
+    projects, total = await project_repo.list_by_owner(
+        db, current_user.id, skip=skip, limit=limit, after=decode_cursor(cursor)
     )
 
+    return ORJSONResponse({
+        "projects": [_project_to_dict(p) for p in projects],
+        "total": total,
+        "next_cursor": next_cursor(projects, limit),
+    })
+
 
-@router.get("/{project_id}", response_model=ProjectResponse)
+@router.get("/{project_id}", response_model=None, responses={200: {"model": ProjectResponse}})
 async def get_project(
     project_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -181,10 +208,10 @@ async def get_project(
     Returns 404 if not found, 403 if you don't own it.
     """
     project = await _get_user_project(project_id, current_user, db)
-    return _project_to_response(project)
+    return ORJSONResponse(_project_to_dict(project))
 
 
-@router.put("/{project_id}", response_model=ProjectResponse)
+@router.put("/{project_id}", response_model=None, responses={200: {"model": ProjectResponse}})
 async def update_project(
     project_id: uuid.UUID,
     body: ProjectUpdate,
@@ -202,7 +229,7 @@ async def update_project(
     if update_data:
         project = await project_repo.update(db, project, **update_data)
 
-    return _project_to_response(project)
+    return ORJSONResponse(_project_to_dict(project))
 
 
 @router.delete("/{project_id}", status_code=204)
@@ -217,10 +244,21 @@ async def delete_project(
 
     Destroys the sandbox container + volume, then removes all DB records.
     """
-    project = await _get_user_project(project_id, current_user, db)
+    # Project and its sandbox in one round trip
+    row = await project_repo.get_project_and_sandbox(db, project_id)
+    if not row:
+        raise NotFoundException("Project", str(project_id))
+    project, sandbox = row
+    if project.owner_id != current_user.id:
+        raise ForbiddenException("You don't have access to this project")
+
+    # A sandbox with no container yet may still be provisioning. Lock its row:
+    # provision_sandbox then either committed its container id first (seen by
+    # this re-read) or finds the row gone and removes the container itself.
+    if sandbox and not sandbox.container_id:
+        sandbox = await db.get(Sandbox, sandbox.id, with_for_update=True, populate_existing=True)
 
     # Destroy sandbox container + volume before removing DB record
-    sandbox = await sandbox_repo.get_by_project(db, project_id)
     if sandbox:
         if sandbox.container_id:
             try:
@@ -231,7 +269,6 @@ async def delete_project(
             except Exception as e:
                 logger.warning("Failed to destroy sandbox for project %s: %s", project_id, e)
         
-        await db.delete(sandbox)
-        await db.flush()
+        await sandbox_repo.delete(db, sandbox, commit=False)
 
     await project_repo.delete(db, project)
\ No newline at end of file
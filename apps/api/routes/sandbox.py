@@ -10,6 +10,7 @@ These endpoints let users:
 import uuid
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.auth import get_current_user
@@ -18,6 +19,8 @@ from apps.api.exceptions import NotFoundException, ForbiddenException, ComioExce
 from apps.api.models.user import User
 from apps.api.models.sandbox import SandboxStatus
 from apps.api.repositories import project_repo, sandbox_repo
+from apps.api.repositories.sandbox import SandboxRef
+from apps.api.responses import etag_response
 from apps.api.schemas.sandbox import (
     ExecCommandRequest, FileWriteRequest, SearchRequest,
     GitCommitRequest, GitBranchRequest, GitPRRequest,
@@ -36,19 +39,41 @@ async def _get_project_sandbox(
     db: AsyncSession,
 ):
     """Fetch a project's sandbox after verifying ownership."""
-    project = await project_repo.get_by_id(db, project_id)
-    if not project:
+    row = await project_repo.get_project_and_sandbox(db, project_id)
+    if not row:
         raise NotFoundException("Project", str(project_id))
+    project, sandbox = row
     if project.owner_id != current_user.id:
         raise ForbiddenException("You don't have access to this project")
 
-    sandbox = await sandbox_repo.get_by_project(db, project_id)
     if not sandbox:
         raise ComioException("No sandbox exists for this project", status_code=404)
 
     return project, sandbox
 
 
+async def _get_sandbox_ref(
+    project_id: uuid.UUID,
+    current_user: User,
+    db: AsyncSession,
+) -> SandboxRef:
+    """Like _get_project_sandbox, for routes that only read from the container.
+
+    Returns a cached SandboxRef instead of the rows, so repeat reads of a
+    project's files and git state make no query.
+    """
+    ref = await sandbox_repo.get_ref(db, project_id)
+    if ref is None:
+        raise NotFoundException("Project", str(project_id))
+    if ref.owner_id != current_user.id:
+        raise ForbiddenException("You don't have access to this project")
+
+    if ref.sandbox_id is None:
+        raise ComioException("No sandbox exists for this project", status_code=404)
+
+    return ref
+
+
 def _require_running(sandbox):
     """Ensure the sandbox container is running before file/git operations."""
     if not sandbox.container_id:
@@ -68,15 +93,15 @@ async def get_sandbox_status(
     """Get the sandbox status for a project."""
     project, sandbox = await _get_project_sandbox(project_id, current_user, db)
 
-    container_status = {}
+    container_status = "unknown"
     if sandbox.container_id:
-        container_status = await sandbox_manager.get_status(sandbox.container_id)
+        container_status = await sandbox_manager.get_container_status(sandbox.container_id)
 
     return {
         "id": str(sandbox.id),
         "status": sandbox.status,
         "container_id": sandbox.container_id,
-        "container_status": container_status.get("status", "unknown"),
+        "container_status": container_status,
         "git_branch": sandbox.git_branch,
         "volume_name": sandbox.volume_name,
         "cpu_limit": sandbox.cpu_limit,
@@ -171,6 +196,7 @@ async def exec_command(
 
 @router.get("/files")
 async def list_files(
+    request: Request,
     project_id: uuid.UUID,
     path: str = Query(default=".", description="Directory path relative to workspace"),
     recursive: bool = Query(default=False, description="List recursively"),
@@ -179,9 +205,10 @@ async def list_files(
 ):
     """List files and directories inside the sandbox.
 
-    Used by the frontend file browser tree view.
+    Used by the frontend file browser tree view. Sends an ETag; a poll
+    with a matching If-None-Match gets 304 Not Modified.
     """
-    project, sandbox = await _get_project_sandbox(project_id, current_user, db)
+    sandbox = await _get_sandbox_ref(project_id, current_user, db)
     _require_running(sandbox)
 
     try:
@@ -189,13 +216,14 @@ async def list_files(
     except ValueError as e:
         raise ComioException(str(e), status_code=400)
 
-    return {"path": path, "entries": entries}
+    return etag_response(request, {"path": path, "entries": entries})
 
 
 @router.get("/files/{file_path:path}")
 async def read_file(
     project_id: uuid.UUID,
     file_path: str,
+    raw: bool = Query(default=False, description="Stream the raw bytes instead of JSON"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -203,10 +231,23 @@ async def read_file(
 
     The {file_path:path} syntax allows slashes in the URL:
         GET /projects/123/sandbox/files/src/main.py
+
+    By default the file comes back as JSON (text files up to 1MB). With
+    ?raw=true its bytes are streamed straight from the container instead,
+    with no size limit and binary files allowed.
     """
-    project, sandbox = await _get_project_sandbox(project_id, current_user, db)
+    sandbox = await _get_sandbox_ref(project_id, current_user, db)
     _require_running(sandbox)
 
+    if raw:
+        try:
+            chunks = await file_ops.stream_file(sandbox.container_id, file_path)
+        except FileNotFoundError:
+            raise ComioException(f"File not found: {file_path}", status_code=404)
+        except ValueError as e:
+            raise ComioException(str(e), status_code=400)
+        return StreamingResponse(chunks, media_type="application/octet-stream")
+
     try:
         content = await file_ops.read_file(sandbox.container_id, file_path)
     except FileNotFoundError:
@@ -282,16 +323,20 @@ async def search_files(
 
 @router.get("/git/status")
 async def git_status(
+    request: Request,
     project_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get git status of the sandbox (branch, modified, staged, untracked)."""
-    project, sandbox = await _get_project_sandbox(project_id, current_user, db)
+    """Get git status of the sandbox (branch, modified, staged, untracked).
+
+    Sends an ETag; a poll with a matching If-None-Match gets 304 Not Modified.
+    """
+    sandbox = await _get_sandbox_ref(project_id, current_user, db)
     _require_running(sandbox)
 
     status = await file_ops.git_status(sandbox.container_id)
-    return status
+    return etag_response(request, status)
 
 
 @router.get("/git/diff")
@@ -302,7 +347,7 @@ async def git_diff(
     db: AsyncSession = Depends(get_db),
 ):
     """Get git diff of changes in the sandbox."""
-    project, sandbox = await _get_project_sandbox(project_id, current_user, db)
+    sandbox = await _get_sandbox_ref(project_id, current_user, db)
     _require_running(sandbox)
 
     diff_text = await file_ops.git_diff(sandbox.container_id, file)
@@ -328,9 +373,7 @@ async def create_branch(
         raise ComioException(str(e), status_code=400)
 
     # Update the sandbox's tracked branch
-    await sandbox_repo.update_status(db, sandbox, sandbox.status)
-    sandbox.git_branch = body.branch_name
-    await db.commit()
+    await sandbox_repo.update(db, sandbox, git_branch=body.branch_name)
 
     return {"status": "created", "branch": body.branch_name}
 
@@ -588,7 +631,7 @@ async def _get_proxy_user(
 ) -> User:
     from apps.api.exceptions import UnauthorizedException
     from apps.api.auth.jwt import decode_access_token
-    from apps.api.repositories import user_repo
+    from apps.api.auth.user_loader import UserLoader
 
     if not token:
         auth = request.headers.get("Authorization")
@@ -598,13 +641,15 @@ async def _get_proxy_user(
     if not token:
         raise UnauthorizedException("No token provided via header or query ?token=")
 
-    user_id = decode_access_token(token)
-    if not user_id:
+    claims = decode_access_token(token)
+    if not claims:
         raise UnauthorizedException("Invalid or expired token")
 
-    user = await user_repo.get_by_id(db, user_id)
+    user = await UserLoader.for_session(db).load(claims.user_id)
     if not user or not user.is_active:
         raise UnauthorizedException("User not found or inactive")
+    if user.token_revision != claims.revision:
+        raise UnauthorizedException("Token has been revoked")
 
     return user
 
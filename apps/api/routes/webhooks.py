@@ -11,7 +11,9 @@ When an alert arrives:
 """
 
 import logging
+from datetime import datetime, timezone
 
+import orjson
 from fastapi import APIRouter, Request, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
@@ -53,51 +55,59 @@ async def receive_alert(
             ]
         }
 
-    We extract the first alert and create an incident.
-    In production, you'd process all alerts in the batch.
+    Every alert in the batch becomes an incident (minus duplicates), all
+    written with a single INSERT.
     """
-    body = await request.json()
+    # orjson rather than request.json()'s stdlib parser — Alertmanager
+    # batches can carry hundreds of alerts, each with its own labels
+    body = orjson.loads(await request.body())
 
     # Extract alerts from Alertmanager format
     alerts = body.get("alerts", [])
     if not alerts:
         return {"status": "ignored", "reason": "No alerts in payload"}
 
-    # Process the first alert (in production, loop through all)
-    alert_data = alerts[0]
-    labels = alert_data.get("labels", {})
-    annotations = alert_data.get("annotations", {})
-
-    # Extract project ID from labels (Alertmanager rule must set this)
-    project_id = labels.get("comio_project_id", "")
-    if not project_id:
-        logger.warning("Alert missing comio_project_id label — cannot route to project")
+    # The whole batch arrived together: stamp every event with one timestamp
+    # instead of a clock read + isoformat() per alert
+    received_at = datetime.now(timezone.utc).isoformat()
+
+    alert_events = []
+    for alert_data in alerts:
+        labels = alert_data.get("labels", {})
+
+        # Extract project ID from labels (Alertmanager rule must set this)
+        project_id = labels.get("comio_project_id", "")
+        if not project_id:
+            logger.warning("Alert missing comio_project_id label — cannot route to project")
+            continue
+
+        alert_events.append(AlertEvent(
+            source="alertmanager",
+            alert_name=labels.get("alertname", "UnknownAlert"),
+            severity=labels.get("severity", "medium"),
+            labels=labels,
+            annotations=alert_data.get("annotations", {}),
+            project_id=project_id,
+            fingerprint=alert_data.get("fingerprint", ""),
+            timestamp=received_at,
+        ))
+
+    if not alert_events:
         return {"status": "ignored", "reason": "Missing comio_project_id label"}
 
-    # Build AlertEvent
-    alert_event = AlertEvent(
-        source="alertmanager",
-        alert_name=labels.get("alertname", "UnknownAlert"),
-        severity=labels.get("severity", "medium"),
-        labels=labels,
-        annotations=annotations,
-        project_id=project_id,
-        fingerprint=alert_data.get("fingerprint", ""),
-    )
+    # Handle the batch (creates incidents, publishes to event bus)
+    incident_ids = await event_service.handle_alerts_bulk(db, alert_events)
 
-    # Handle the alert (creates incident, publishes to event bus)
-    incident = await event_service.handle_alert(db, alert_event)
-
-    if incident:
+    if incident_ids:
         return {
             "status": "processed",
-            "incident_id": str(incident.id),
-            "message": f"Incident created: {incident.title}",
+            "incident_ids": [str(incident_id) for incident_id in incident_ids],
+            "message": f"{len(incident_ids)} incident(s) created",
         }
     else:
         return {
             "status": "duplicate",
-            "message": "Alert already processed recently",
+            "message": "Alerts already processed recently",
         }
 
 
@@ -118,8 +128,8 @@ async def test_alert(
     # Parse optional body
     body = {}
     try:
-        body = await request.json()
-    except:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
         pass
 
     project_id = body.get("project_id")
@@ -77,4 +77,5 @@ class IncidentResponse(BaseResponse):
 class IncidentListResponse(BaseModel):
     """Paginated list of incidents."""
     incidents: list[IncidentResponse]
-    total: int
\ No newline at end of file
+    total: int | None  # None on cursor pages, which skip the COUNT
+    next_cursor: str | None = None  # pass back as ?cursor= for the next page
\ No newline at end of file
@@ -48,4 +48,5 @@ class ProjectResponse(BaseResponse):
 class ProjectListResponse(BaseModel):
     """Paginated list of projects."""
     projects: list[ProjectResponse]
-    total: int
+    total: int | None  # None on cursor pages, which skip the COUNT
+    next_cursor: str | None = None  # pass back as ?cursor= for the next page
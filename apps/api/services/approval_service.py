@@ -71,7 +71,6 @@ async def approve(
         remediation.review_comment = "Auto-rejected: approval window expired (24h)"
         await _log_audit(db, "remediation.expired", "remediation", str(remediation_id), user.id, {"reason": "24h expiry"})
         await db.commit()
-        await db.refresh(remediation)
         raise ComioException("This remediation has expired (24h). It was auto-rejected.", status_code=400)
 
     remediation.status = RemediationStatus.APPROVED
@@ -79,7 +78,6 @@ async def approve(
     remediation.review_comment = comment
     await _log_audit(db, "remediation.approved", "remediation", str(remediation_id), user.id, {"comment": comment})
     await db.commit()
-    await db.refresh(remediation)
     return remediation
 
 
@@ -103,7 +101,6 @@ async def reject(
     remediation.review_comment = reason
     await _log_audit(db, "remediation.rejected", "remediation", str(remediation_id), user.id, {"reason": reason})
     await db.commit()
-    await db.refresh(remediation)
     return remediation
 
 
@@ -144,7 +141,6 @@ async def apply(
         remediation.status = RemediationStatus.FAILED
         await _log_audit(db, "remediation.apply_failed", "remediation", str(remediation_id), user.id, {"stderr": result.stderr})
         await db.commit()
-        await db.refresh(remediation)
         raise ComioException(f"Failed to apply patch: {result.stderr or result.stdout}", status_code=500)
 
     # 3) Commit and push (branch created by caller or use a default)
@@ -170,5 +166,4 @@ async def apply(
     remediation.pr_number = pr_number
     await _log_audit(db, "remediation.applied", "remediation", str(remediation_id), user.id, {"pr_url": pr_url})
     await db.commit()
-    await db.refresh(remediation)
     return remediation
\ No newline at end of file
@@ -17,12 +17,14 @@ Architecture:
 import logging
 import uuid
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.config import settings
 from apps.api.models.chat import ChatSession, ChatMessage, MessageRole
 from apps.api.models.sandbox import Sandbox
 from apps.api.models.user import User
+from apps.api.pagination import Cursor
 from apps.api.repositories.chat import chat_session_repo, chat_message_repo
 
 # Lazy imports to avoid circular dependencies at module level
@@ -30,6 +32,9 @@ from apps.api.repositories.chat import chat_session_repo, chat_message_repo
 
 logger = logging.getLogger(__name__)
 
+# MessageRole → its API/LLM string, resolved once instead of per message
+_ROLE_VALUES = {role: role.value for role in MessageRole}
+
 
 class ChatService:
     """Manages chat sessions and routes messages to the AI agent."""
@@ -71,11 +76,24 @@ class ChatService:
         """List all chat sessions for a sandbox."""
         return await chat_session_repo.get_by_sandbox(db, sandbox_id)
 
+    async def list_session_summaries(
+        self,
+        db: AsyncSession,
+        sandbox_id: uuid.UUID,
+        after: Cursor | None = None,
+        limit: int = 50,
+    ) -> tuple[list[Row], int | None]:
+        """A page of (id, title, is_active, created_at) rows for a sandbox's sessions, plus the total."""
+        return await chat_session_repo.get_by_sandbox_summary(db, sandbox_id, after=after, limit=limit)
+
     async def delete_session(
         self, db: AsyncSession, session: ChatSession
     ) -> None:
-        """Delete a chat session and all its messages."""
-        await chat_session_repo.delete(db, session)
+        """Delete a chat session and all its messages.
+
+        One DELETE: the database cascades it to the session's messages.
+        """
+        await chat_session_repo.delete_by_id(db, session.id)
 
     async def get_messages(
         self, db: AsyncSession, session_id: uuid.UUID
@@ -83,6 +101,12 @@ class ChatService:
         """Get all messages for a session."""
         return await chat_message_repo.get_by_session(db, session_id)
 
+    async def get_messages_json(
+        self, db: AsyncSession, session_id: uuid.UUID
+    ) -> tuple[bytes, int]:
+        """Get all messages for a session as a JSON array (bytes) and their count."""
+        return await chat_message_repo.messages_as_json(db, session_id)
+
     # ── Message Processing ────────────────────────────
 
     async def send_message(
@@ -109,17 +133,22 @@ class ChatService:
         Returns:
             List of ChatEvent dicts for the frontend
         """
-        # Step 1: Persist user message
+        # Step 1: Persist user message (flushed; committed with the history read)
         await chat_message_repo.add_message(
-            db, session.id, MessageRole.USER, user_message
+            db, session.id, MessageRole.USER, user_message, commit=False
         )
 
         # Step 2: Load conversation history
-        db_messages = await chat_message_repo.get_by_session(db, session.id)
+        db_messages = await chat_message_repo.get_history(db, session.id)
         conversation_history = self._db_messages_to_llm_messages(db_messages[:-1])
         # We exclude the last message (the one we just added) because
         # the agent adds it separately as the current user_message
 
+        # Commit before the agent runs: the user message survives agent
+        # failures, and the pooled connection isn't held idle in a
+        # transaction for the (possibly 30s) LLM loop.
+        await db.commit()
+
         # Step 3: Create agent with LLM adapter, using per-user LLM settings when available
         agent = self._create_agent(
             provider_override=user.llm_provider,
@@ -227,22 +256,20 @@ class ChatService:
         else:
             return ""  # Ollama doesn't need an API key
 
-    def _db_messages_to_llm_messages(self, db_messages: list[ChatMessage]) -> list:
-        """Convert database ChatMessage objects to LLM Message format.
+    def _db_messages_to_llm_messages(self, db_messages: list) -> list:
+        """Convert database messages (anything with .role/.content) to LLM Message format.
 
         The agent expects adapters.base.Message objects.
-        The DB stores ChatMessage objects.
+        The DB stores ChatMessage rows.
         This bridges the two.
         """
         from adapters.base import Message
 
-        messages = []
-        for msg in db_messages:
-            messages.append(Message(
-                role=msg.role.value if hasattr(msg.role, 'value') else msg.role,
-                content=msg.content,
-            ))
-        return messages
+        role_values = _ROLE_VALUES
+        return [
+            Message(role=role_values.get(msg.role, msg.role), content=msg.content)
+            for msg in db_messages
+        ]
 
 
 # Singleton
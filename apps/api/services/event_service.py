@@ -16,6 +16,7 @@ Architecture:
          → RCA Engine (subscriber) picks it up and starts diagnosis
 """
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -27,7 +28,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.config import settings
 from apps.api.models.incident import Incident, Severity, IncidentStatus
-from apps.api.repositories import incident_repo
+from apps.api.repositories import incident_repo, project_repo
 
 # Lazy imports for event schemas
 from events.schemas import AlertEvent, IncidentEvent, EventType
@@ -37,6 +38,34 @@ logger = logging.getLogger(__name__)
 # Deduplication window — ignore duplicate alerts within this time
 DEDUP_WINDOW_SECONDS = 300  # 5 minutes
 
+# Alert severity label → incident severity (anything else is MEDIUM)
+_SEVERITY_MAP = {
+    "critical": Severity.CRITICAL,
+    "high": Severity.HIGH,
+    "medium": Severity.MEDIUM,
+    "low": Severity.LOW,
+    "info": Severity.INFO,
+}
+
+
+def _incident_row(alert_event: AlertEvent) -> dict | None:
+    """Incident columns for an alert, or None if its project_id isn't a UUID."""
+    try:
+        project_uuid = uuid.UUID(alert_event.project_id)
+    except (ValueError, AttributeError):
+        logger.error("Invalid project_id in alert: %s", alert_event.project_id)
+        return None
+
+    return {
+        "title": alert_event.alert_name,
+        "description": alert_event.annotations.get("description", ""),
+        "severity": _SEVERITY_MAP.get(alert_event.severity.lower(), Severity.MEDIUM),
+        "status": IncidentStatus.OPEN,
+        "source": alert_event.source,
+        "alert_data": alert_event.to_dict(),
+        "project_id": project_uuid,
+    }
+
 
 class EventService:
     """Manages event lifecycle, deduplication, and routing."""
@@ -103,6 +132,36 @@ class EventService:
         # If was_set is True, we just created it → new alert
         return was_set is None
 
+    async def _filter_new(self, alert_events: list[AlertEvent]) -> list[AlertEvent]:
+        """Drop alerts seen within the dedup window, checking the whole batch at once.
+
+        Same SET NX EX as _is_duplicate, but pipelined: one Redis round trip
+        for the batch. Repeats of a fingerprint within the batch count as
+        duplicates too.
+        """
+        fingerprinted = [e for e in alert_events if e.fingerprint]
+        if not fingerprinted:
+            return list(alert_events)
+
+        redis_client = await self._get_redis()
+        pipe = redis_client.pipeline(transaction=False)
+        for event in fingerprinted:
+            pipe.set(f"alert:dedup:{event.fingerprint}", "1", nx=True, ex=DEDUP_WINDOW_SECONDS)
+        # Replies come back in the order the SETs were queued
+        was_set = iter(await pipe.execute())
+
+        return [e for e in alert_events if not e.fingerprint or next(was_set) is not None]
+
+    async def _forget(self, alert_events: list[AlertEvent]) -> None:
+        """Clear the dedup keys of alerts that were let through but not recorded.
+
+        So a retry of the same alerts isn't mistaken for a duplicate.
+        """
+        keys = [f"alert:dedup:{e.fingerprint}" for e in alert_events if e.fingerprint]
+        if keys:
+            redis_client = await self._get_redis()
+            await redis_client.delete(*keys)
+
     # ── Alert Handling ────────────────────────────────────
 
     async def handle_alert(
@@ -130,33 +189,12 @@ class EventService:
 
         logger.info("New alert: %s (severity: %s)", alert_event.alert_name, alert_event.severity)
 
-        # Step 2: Map alert severity to incident severity
-        severity_map = {
-            "critical": Severity.CRITICAL,
-            "high": Severity.HIGH,
-            "medium": Severity.MEDIUM,
-            "low": Severity.LOW,
-            "info": Severity.INFO,
-        }
-        severity = severity_map.get(alert_event.severity.lower(), Severity.MEDIUM)
-
-        # Step 3: Create incident
-        try:
-            project_uuid = uuid.UUID(alert_event.project_id)
-        except (ValueError, AttributeError):
-            logger.error("Invalid project_id in alert: %s", alert_event.project_id)
+        # Step 2-3: Map the alert to incident columns and create the incident
+        row = _incident_row(alert_event)
+        if row is None:
             return None
 
-        incident = await incident_repo.create(
-            db,
-            title=alert_event.alert_name,
-            description=alert_event.annotations.get("description", ""),
-            severity=severity,
-            status=IncidentStatus.OPEN,
-            source=alert_event.source,
-            alert_data=alert_event.to_dict(),
-            project_id=project_uuid,
-        )
+        incident = await incident_repo.create(db, **row)
 
         logger.info("Incident created: %s (severity: %s)", incident.id, incident.severity.value)
 
@@ -176,6 +214,59 @@ class EventService:
 
         return incident
 
+    async def handle_alerts_bulk(
+        self, db: AsyncSession, alert_events: list[AlertEvent]
+    ) -> list[uuid.UUID]:
+        """Process a batch of alerts (e.g. one Alertmanager webhook) together.
+
+        Same steps as handle_alert, batched: one pipelined Redis dedup
+        check, one INSERT for every new incident, and the IncidentEvents
+        published concurrently.
+
+        Returns:
+            The ids of the created incidents (duplicates and alerts with
+            an invalid or unknown project_id are skipped)
+        """
+        new_events = await self._filter_new(alert_events)
+        if len(new_events) < len(alert_events):
+            logger.info("Ignored %d duplicate alert(s)", len(alert_events) - len(new_events))
+
+        rows = [row for row in map(_incident_row, new_events) if row is not None]
+
+        # One unknown project would fail the whole INSERT on its foreign key
+        known = await project_repo.existing_ids(db, {row["project_id"] for row in rows})
+        for project_id in {row["project_id"] for row in rows} - known:
+            logger.error("Alert for unknown project ignored: %s", project_id)
+        rows = [row for row in rows if row["project_id"] in known]
+        if not rows:
+            return []
+
+        try:
+            incident_ids = await incident_repo.bulk_create(db, rows)
+        except Exception:
+            await self._forget(new_events)
+            raise
+        logger.info("Created %d incident(s) from %d alert(s)", len(incident_ids), len(alert_events))
+
+        if self._event_bus:
+            await asyncio.gather(*(
+                self._event_bus.publish(
+                    "incident.created",
+                    IncidentEvent(
+                        event_type=EventType.INCIDENT_CREATED,
+                        source="event_service",
+                        incident_id=str(incident_id),
+                        project_id=str(row["project_id"]),
+                        title=row["title"],
+                        severity=row["severity"].value,
+                        status=row["status"].value,
+                    ),
+                )
+                for incident_id, row in zip(incident_ids, rows)
+            ))
+
+        return incident_ids
+
     # ── Cleanup ───────────────────────────────────────────
 
     async def close(self):
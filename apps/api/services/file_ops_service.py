@@ -15,9 +15,10 @@ import base64
 import json
 import logging
 import posixpath
-import httpx
+from collections.abc import AsyncIterator
 
 from apps.api.config import settings
+from apps.api.services.http_client import get_http_client
 from apps.api.services.sandbox_manager import sandbox_manager, ExecResult
 
 logger = logging.getLogger(__name__)
@@ -158,6 +159,22 @@ class FileOpsService:
 
         return {"path": path, "content": content, "size": size, "lines": lines}
 
+    async def stream_file(self, container_id: str, path: str) -> AsyncIterator[bytes]:
+        """Stream a file's raw bytes out of the sandbox.
+
+        Unlike read_file there's no size cap or text check: the bytes are
+        passed on as Docker produces them, never held whole in memory.
+        The existence check runs here, before any response is started, so
+        a missing file can still become a 404.
+        """
+        safe = self._safe_path(path)
+
+        test_result = await sandbox_manager.exec_command(container_id, ["test", "-f", safe])
+        if test_result.exit_code != 0:
+            raise FileNotFoundError(f"File not found: {path}")
+
+        return sandbox_manager.stream_command(container_id, ["cat", safe])
+
     async def write_file(self, container_id: str, path: str, content: str) -> None:
         """Write content to a file in the sandbox.
 
@@ -458,15 +475,14 @@ class FileOpsService:
         if not token_to_use:
             raise NotImplementedError("GitHub token required (GITHUB_TOKEN or connect GitHub OAuth)")
 
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
-                f"https://api.github.com/repos/{owner}/{repo_name}/pulls",
-                headers={"Authorization": f"token {token_to_use}", "Accept": "application/vnd.github.v3+json"},
-                json={"title": title, "body": body, "head": branch, "base": base},
-            )
-            r.raise_for_status()
-            data = r.json()
-            return data.get("html_url", "")
+        r = await get_http_client().post(
+            f"https://api.github.com/repos/{owner}/{repo_name}/pulls",
+            headers={"Authorization": f"token {token_to_use}", "Accept": "application/vnd.github.v3+json"},
+            json={"title": title, "body": body, "head": branch, "base": base},
+        )
+        r.raise_for_status()
+        data = r.json()
+        return data.get("html_url", "")
 
 
 # Singleton instance
@@ -0,0 +1,32 @@
+"""Shared outbound HTTP client.
+
+Creating an httpx.AsyncClient per call means a fresh connection pool —
+and a new TCP + TLS handshake to api.github.com — every time. One client
+per process keeps connections alive and reuses them across requests.
+
+The client is created lazily (so scripts and tests work without the app
+lifespan), warmed on startup and closed on shutdown by main.lifespan.
+"""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The process-wide AsyncClient (created on first use)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            timeout=10.0,
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -94,20 +94,7 @@ class RCAService:
                 diagnosis_result = await self.rca_engine.diagnose(db, incident)
 
                 # Create database Diagnosis model from dataclass
-                diagnosis_model = DiagnosisModel(
-                    incident_id=incident.id,
-                    root_cause=diagnosis_result.root_cause,
-                    category=diagnosis_result.category.value,
-                    confidence=diagnosis_result.confidence,
-                    explanation=diagnosis_result.reasoning,
-                    evidence=[e.__dict__ for e in diagnosis_result.evidence],  # Convert Evidence dataclasses to dicts
-                    affected_components=diagnosis_result.affected_components,
-                    suggested_actions=[a.__dict__ for a in diagnosis_result.suggested_actions],  # Convert Action dataclasses to dicts
-                    llm_provider=settings.default_llm_provider,
-                    llm_model=settings.default_llm_model,
-                )
-                
-                db.add(diagnosis_model)
+                db.add(self.to_model(incident.id, diagnosis_result))
                 
                 # Update incident status
                 incident.status = IncidentStatus.DIAGNOSED
@@ -126,6 +113,28 @@ class RCAService:
         except Exception as e:
             logger.error("Error handling incident.created event: %s", e, exc_info=True)
 
+    @staticmethod
+    def to_model(incident_id, diagnosis_result) -> DiagnosisModel:
+        """Build the database Diagnosis row for an RCA engine result.
+
+        Evidence and suggested actions go through the result's own
+        to_dict(), which copies exactly the dataclass fields into fresh
+        JSON-ready dicts (rather than sharing each dataclass's __dict__).
+        """
+        data = diagnosis_result.to_dict()
+        return DiagnosisModel(
+            incident_id=incident_id,
+            root_cause=data["root_cause"],
+            category=data["category"],
+            confidence=data["confidence"],
+            explanation=data["reasoning"],
+            evidence=data["evidence"],
+            affected_components=data["affected_components"],
+            suggested_actions=data["suggested_actions"],
+            llm_provider=settings.default_llm_provider,
+            llm_model=settings.default_llm_model,
+        )
+
     async def close(self):
         """Cleanup resources."""
         logger.info("Closing RCA service...")
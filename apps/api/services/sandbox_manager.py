@@ -20,9 +20,11 @@ Architecture:
 import asyncio
 import logging
 import uuid
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 import docker
+from cachetools import TTLCache
 from docker.errors import NotFound, APIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -32,6 +34,12 @@ from apps.api.models.project import Project
 
 logger = logging.getLogger(__name__)
 
+# container_id → state ("running", "exited", ..., or "not_found"). The
+# status endpoint is polled every few seconds per open project; this caps
+# Docker inspects at one per container per TTL. Lifecycle calls below
+# evict the entry so a start/stop shows up on the next poll.
+_status_cache: TTLCache[str, str] = TTLCache(maxsize=10_000, ttl=2)
+
 
 @dataclass
 class ExecResult:
@@ -67,27 +75,9 @@ class SandboxManager:
         3. Clone the project's GitHub repo into /workspace
         4. Save sandbox metadata to the database
         """
-        volume_name = f"comio-sandbox-{project.id}"
-        container_name = f"comio-sandbox-{str(project.id)[:8]}"
-
         logger.info("Creating sandbox for project %s (cloned)", project.name)
+        container, volume_name = await self._start_cloned(project)
 
-        # Step 1: Create volume + container (blocking Docker calls → run in thread)
-        container = await asyncio.to_thread(
-            self._create_container, volume_name, container_name
-        )
-
-        # Step 2: Clone the repo if URL exists
-        if project.repo_url:
-            clone_result = await self.exec_command(
-                container.id,
-                ["git", "clone", project.repo_url, "."],
-                timeout=120,  # Cloning can take a while
-            )
-            if clone_result.exit_code != 0:
-                logger.error("Git clone failed: %s", clone_result.stderr)
-
-        # Step 3: Save to database
         sandbox = Sandbox(
             container_id=container.id,
             status=SandboxStatus.RUNNING,
@@ -96,8 +86,7 @@ class SandboxManager:
             project_id=project.id,
         )
         db.add(sandbox)
-        await db.commit()
-        await db.refresh(sandbox)
+        await db.commit()  # id and timestamps come back on the INSERT's RETURNING
 
         logger.info("Sandbox created: %s (container: %s)", sandbox.id, container.short_id)
         return sandbox
@@ -111,17 +100,8 @@ class SandboxManager:
         3. Initialize git repo (no clone — AI will create files)
         4. Save to database
         """
-        volume_name = f"comio-sandbox-{project.id}"
-        container_name = f"comio-sandbox-{str(project.id)[:8]}"
-
         logger.info("Creating blank sandbox for project %s", project.name)
-
-        container = await asyncio.to_thread(
-            self._create_container, volume_name, container_name
-        )
-
-        # Initialize git repo with a proper initial commit so `git diff` works
-        await self._init_git_repo(container.id)
+        container, volume_name = await self._start_blank(project)
 
         sandbox = Sandbox(
             container_id=container.id,
@@ -131,12 +111,109 @@ class SandboxManager:
             project_id=project.id,
         )
         db.add(sandbox)
-        await db.commit()
-        await db.refresh(sandbox)
+        await db.commit()  # id and timestamps come back on the INSERT's RETURNING
 
         logger.info("Blank sandbox created: %s (container: %s)", sandbox.id, container.short_id)
         return sandbox
 
+    async def provision_sandbox(self, project_id: uuid.UUID) -> None:
+        """Bring up the container for a project's CREATING sandbox row.
+
+        Runs as a background task after the create/import request has
+        returned, so it opens its own sessions rather than borrowing the
+        (already closed) request one. The outcome is recorded on the row —
+        RUNNING with the container id, or ERROR — which is what clients
+        poll via GET /projects/{id}/sandbox.
+
+        The rows are read on an autocommit session that is closed before
+        the Docker work starts, so a slow clone doesn't pin a pooled
+        connection idle in transaction. The result is written from a
+        second session that first re-reads the sandbox row under
+        FOR UPDATE: if the project was deleted meanwhile, delete_project
+        had no container id to destroy, so the new container and volume
+        are removed here instead.
+        """
+        from apps.api.database import async_session_factory, readonly_session_factory
+        from apps.api.models.project import ProjectOrigin
+        from apps.api.repositories import project_repo, sandbox_repo
+
+        async with readonly_session_factory() as db:
+            row = await project_repo.get_project_and_sandbox(db, project_id)
+        if not row or row[1] is None:
+            logger.warning("No sandbox row to provision for project %s", project_id)
+            return
+        project, sandbox = row
+        sandbox_id = sandbox.id
+
+        try:
+            if project.origin == ProjectOrigin.CLONED:
+                container, volume_name = await self._start_cloned(project)
+            else:
+                container, volume_name = await self._start_blank(project)
+        except Exception:
+            logger.exception("Sandbox provisioning failed for project %s", project_id)
+            async with async_session_factory() as db:
+                sandbox = await db.get(Sandbox, sandbox_id, with_for_update=True)
+                if sandbox is not None:
+                    await sandbox_repo.update_status(db, sandbox, SandboxStatus.ERROR)
+            return
+
+        async with async_session_factory() as db:
+            sandbox = await db.get(Sandbox, sandbox_id, with_for_update=True)
+            if sandbox is None:
+                logger.info(
+                    "Project %s was deleted during provisioning; removing container %s",
+                    project_id,
+                    container.short_id,
+                )
+                await db.rollback()
+                await self.destroy_sandbox(container.id, volume_name)
+                return
+
+            await sandbox_repo.update(
+                db,
+                sandbox,
+                container_id=container.id,
+                volume_name=volume_name,
+                status=SandboxStatus.RUNNING,
+            )
+        logger.info("Sandbox provisioned: %s (container: %s)", sandbox_id, container.short_id)
+
+    async def _start_cloned(self, project: Project):
+        """Create the volume + container and clone the project's repo into it."""
+        volume_name = f"comio-sandbox-{project.id}"
+        container_name = f"comio-sandbox-{str(project.id)[:8]}"
+
+        # Blocking Docker calls → run in thread
+        container = await asyncio.to_thread(
+            self._create_container, volume_name, container_name
+        )
+
+        if project.repo_url:
+            clone_result = await self.exec_command(
+                container.id,
+                ["git", "clone", project.repo_url, "."],
+                timeout=120,  # Cloning can take a while
+            )
+            if clone_result.exit_code != 0:
+                logger.error("Git clone failed: %s", clone_result.stderr)
+
+        return container, volume_name
+
+    async def _start_blank(self, project: Project):
+        """Create the volume + container and initialize an empty git repo in it."""
+        volume_name = f"comio-sandbox-{project.id}"
+        container_name = f"comio-sandbox-{str(project.id)[:8]}"
+
+        container = await asyncio.to_thread(
+            self._create_container, volume_name, container_name
+        )
+
+        # Initialize git repo with a proper initial commit so `git diff` works
+        await self._init_git_repo(container.id)
+
+        return container, volume_name
+
     async def _init_git_repo(self, container_id: str) -> None:
         """Initialize a git repo in /workspace with a proper initial commit.
 
@@ -188,11 +265,13 @@ class SandboxManager:
         """Start a stopped sandbox container."""
         logger.info("Starting sandbox container: %s", container_id[:12])
         await asyncio.to_thread(self._start_container, container_id)
+        _status_cache.pop(container_id, None)
 
     async def stop_sandbox(self, container_id: str) -> None:
         """Stop a running sandbox (preserves files on the volume)."""
         logger.info("Stopping sandbox container: %s", container_id[:12])
         await asyncio.to_thread(self._stop_container, container_id)
+        _status_cache.pop(container_id, None)
 
     async def destroy_sandbox(self, container_id: str, volume_name: str | None = None) -> None:
         """Remove a container and optionally its volume.
@@ -202,6 +281,7 @@ class SandboxManager:
         """
         logger.info("Destroying sandbox container: %s", container_id[:12])
         await asyncio.to_thread(self._destroy_container, container_id, volume_name)
+        _status_cache.pop(container_id, None)
 
     # ── Command Execution ─────────────────────────────
 
@@ -245,6 +325,30 @@ class SandboxManager:
                 stderr=f"Command timed out after {timeout} seconds",
             )
 
+    async def stream_command(
+        self,
+        container_id: str,
+        cmd: list[str],
+        workdir: str = "/workspace",
+    ) -> AsyncIterator[bytes]:
+        """Execute a command and yield its stdout as it arrives (stderr is discarded).
+
+        For large outputs, e.g. raw file downloads, that exec_command would
+        buffer and decode whole. Each chunk is read off the exec socket in
+        a worker thread, so the event loop never blocks on Docker.
+
+        The exec socket is closed however the stream ends — including when
+        the consumer stops early, e.g. an HTTP client that disconnects
+        mid-download.
+        """
+        chunks = await asyncio.to_thread(self._stream_in_container, container_id, cmd, workdir)
+        try:
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                yield chunk
+        finally:
+            # Shuts the socket down, which also unblocks a read still in its thread
+            chunks.close()
+
     async def get_status(self, container_id: str) -> dict:
         """Get the current status of a sandbox container."""
         try:
@@ -259,6 +363,19 @@ class SandboxManager:
         except NotFound:
             return {"status": "not_found"}
 
+    async def get_container_status(self, container_id: str) -> str:
+        """Just the container's state — "running", "exited", ... or "not_found".
+
+        Cheaper than get_status for polling: reads State.Status off the
+        low-level inspect instead of building a Container object, and is
+        cached for a couple of seconds.
+        """
+        status = _status_cache.get(container_id)
+        if status is None:
+            status = await asyncio.to_thread(self._inspect_status, container_id)
+            _status_cache[container_id] = status
+        return status
+
     async def sync_repo(self, container_id: str, branch: str = "main") -> ExecResult:
         """Git pull latest changes into the sandbox."""
         return await self.exec_command(
@@ -383,6 +500,29 @@ class SandboxManager:
             stderr=stderr,
         )
 
+    def _stream_in_container(self, container_id: str, cmd: list[str], workdir: str):
+        """Start a command inside a container, returning its stdout stream (blocking).
+
+        A docker CancellableStream: iterate it for byte chunks, close() it
+        to close the exec socket.
+        """
+        container = self._client.containers.get(container_id)
+        exec_result = container.exec_run(
+            cmd=cmd,
+            workdir=workdir,
+            stdout=True,
+            stderr=False,
+            stream=True,  # output is a generator of byte chunks
+        )
+        return exec_result.output
+
+    def _inspect_status(self, container_id: str) -> str:
+        """Read a container's State.Status (blocking)."""
+        try:
+            return self._client.api.inspect_container(container_id)["State"]["Status"]
+        except NotFound:
+            return "not_found"
+
     def _ensure_network(self) -> None:
         """Create the sandbox Docker network if it doesn't exist."""
         try:
@@ -0,0 +1,73 @@
+"""HNSW tuning for the pgvector embeddings index.
+
+pgvector's HNSW index has three knobs:
+- m:               graph connectivity (build time, baked into the index)
+- ef_construction: candidate list size while building (build time)
+- ef_search:       candidate list size while querying (per session/transaction)
+
+Good values depend on corpus size — a 10K-chunk runbook corpus and a
+10M-chunk code corpus need different trade-offs. The build-time values
+are applied when the index is (re)built; ef_search is applied per query
+by the retriever via apply_ef_search().
+"""
+
+import logging
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api.models.embedding import Embedding
+
+logger = logging.getLogger(__name__)
+
+# (upper bound on vector count, params) — first tier whose bound exceeds n wins
+HNSW_TIERS: list[tuple[float, dict[str, int]]] = [
+    (100_000, {"m": 16, "ef_construction": 64, "ef_search": 40}),
+    (1_000_000, {"m": 24, "ef_construction": 100, "ef_search": 100}),
+    (float("inf"), {"m": 32, "ef_construction": 128, "ef_search": 200}),
+]
+
+# Current params — refreshed on startup from the real corpus size
+_current_params: dict[str, int] = dict(HNSW_TIERS[0][1])
+
+
+def configure_hnsw_params(vector_count: int) -> dict[str, int]:
+    """Pick HNSW parameters for a corpus of `vector_count` embeddings.
+
+    Returns a dict with keys: m, ef_construction, ef_search.
+    """
+    for upper_bound, params in HNSW_TIERS:
+        if vector_count < upper_bound:
+            return dict(params)
+    return dict(HNSW_TIERS[-1][1])
+
+
+def current_hnsw_params() -> dict[str, int]:
+    """The HNSW parameters currently in effect for queries."""
+    return dict(_current_params)
+
+
+async def refresh_hnsw_params(db: AsyncSession) -> dict[str, int]:
+    """Re-derive the HNSW parameters from the current embeddings count.
+
+    Called on startup; cheap enough to call again from a periodic job.
+    """
+    result = await db.execute(select(func.count()).select_from(Embedding))
+    vector_count = result.scalar_one()
+
+    _current_params.clear()
+    _current_params.update(configure_hnsw_params(vector_count))
+    logger.info("HNSW params for %d embeddings: %s", vector_count, _current_params)
+    return current_hnsw_params()
+
+
+async def apply_ef_search(db: AsyncSession) -> None:
+    """Set hnsw.ef_search for the current transaction only.
+
+    set_config(..., is_local=true) is the parameterizable form of SET LOCAL,
+    so the setting is dropped automatically when the transaction ends.
+    """
+    await db.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+        {"ef_search": str(_current_params["ef_search"])},
+    )
@@ -73,7 +73,8 @@ export interface Project {
 
 export interface ProjectListResponse {
   projects: Project[];
-  total: number;
+  total: number | null;
+  next_cursor?: string | null;
 }
 
 export interface ProjectCreatePayload {
@@ -108,7 +109,8 @@ export interface ChatSessionSummary {
 
 export interface ChatSessionListResponse {
   sessions: ChatSessionSummary[];
-  total: number;
+  total: number | null;
+  next_cursor?: string | null;
 }
 
 export interface ChatMessage {
@@ -205,7 +207,8 @@ export interface Incident {
 
 export interface IncidentListResponse {
   incidents: Incident[];
-  total: number;
+  total: number | null;
+  next_cursor?: string | null;
 }
 
 export interface IncidentDetail extends Incident {
@@ -402,9 +405,20 @@ export async function searchSandbox(
 export async function listChatSessions(
   projectId: string
 ): Promise<ChatSessionListResponse> {
-  return request<ChatSessionListResponse>(
-    `/projects/${projectId}/sandbox/chat/sessions`
-  );
+  // The endpoint is paged; follow next_cursor so every session is listed.
+  // Only the first page carries the total.
+  const path = `/projects/${projectId}/sandbox/chat/sessions?limit=100`;
+  const first = await request<ChatSessionListResponse>(path);
+  const sessions = [...first.sessions];
+  let cursor = first.next_cursor;
+  while (cursor) {
+    const page = await request<ChatSessionListResponse>(
+      `${path}&cursor=${encodeURIComponent(cursor)}`
+    );
+    sessions.push(...page.sessions);
+    cursor = page.next_cursor;
+  }
+  return { sessions, total: first.total ?? sessions.length, next_cursor: null };
 }
 
 export async function deleteChatSession(
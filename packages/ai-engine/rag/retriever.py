@@ -9,10 +9,11 @@ Uses pgvector for similarity search:
 import logging
 from typing import Literal
 
-from sqlalchemy import select, text
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.models.embedding import Embedding
+from apps.api.services.vector_tuning import apply_ef_search
 from embeddings import EmbeddingFactory
 
 logger = logging.getLogger(__name__)
@@ -73,6 +74,7 @@ class RAGRetriever:
         # - <#> : inner product (dot product)
         # - <=> : cosine distance (what we use)
         
+        distance = Embedding.embedding.cosine_distance(query_embedding)
         query_sql = select(
             Embedding.id,
             Embedding.content,
@@ -82,7 +84,7 @@ class RAGRetriever:
             Embedding.project_id,
             Embedding.incident_id,
             # Compute cosine similarity (1 - cosine_distance)
-            (1 - Embedding.embedding.cosine_distance(query_embedding)).label("similarity"),
+            (1 - distance).label("similarity"),
         )
         
         # Apply filters
@@ -92,10 +94,13 @@ class RAGRetriever:
         if project_id:
             query_sql = query_sql.where(Embedding.project_id == project_id)
         
-        # Order by similarity (highest first) and limit
-        query_sql = query_sql.order_by(text("similarity DESC")).limit(top_k)
+        # Order by distance (closest first) and limit. This must be the raw
+        # `embedding <=> query` ascending — the HNSW index can't serve an
+        # ORDER BY on the derived similarity, which forces a full scan.
+        query_sql = query_sql.order_by(distance).limit(top_k)
         
-        # Step 3: Execute query
+        # Step 3: Execute query (ef_search sized to the corpus, scoped to this transaction)
+        await apply_ef_search(db)
         result = await db.execute(query_sql)
         rows = result.fetchall()
         
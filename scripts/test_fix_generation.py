@@ -31,7 +31,7 @@ async def seed_and_generate():
         if not user:
             user = User(
                 email="fix-test@comio.test",
-                hashed_password=hash_password("FixTestPass123!"),
+                hashed_password=await hash_password("FixTestPass123!"),
                 full_name="Fix Test",
             )
             db.add(user)
@@ -129,6 +129,8 @@ async def test_approve_success(operator_user):
     assert remediation.reviewed_by == operator_user.id
     assert remediation.review_comment == "LGTM"
     db.commit.assert_called_once()
+    # updated_at comes back via RETURNING; no post-commit SELECT
+    db.refresh.assert_not_awaited()
 
 
 # ─── reject (async) ─────────────────────────────────────────────────────────
@@ -0,0 +1,29 @@
+"""Audit log repository — bulk_log batches entries into one INSERT."""
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api.repositories.audit_log import audit_log_repo
+
+
+@pytest.mark.asyncio
+async def test_bulk_log_issues_single_execute():
+    db = MagicMock(spec=AsyncSession)
+    db.execute = AsyncMock()
+    entries = [
+        {"action": "remediation.approved", "resource_type": "remediation", "resource_id": str(uuid4())}
+        for _ in range(3)
+    ]
+    await audit_log_repo.bulk_log(db, entries)
+    db.execute.assert_called_once()
+    assert db.execute.call_args.args[1] == entries
+
+
+@pytest.mark.asyncio
+async def test_bulk_log_skips_empty():
+    db = MagicMock(spec=AsyncSession)
+    db.execute = AsyncMock()
+    await audit_log_repo.bulk_log(db, [])
+    db.execute.assert_not_called()
@@ -0,0 +1,75 @@
+"""Auth dependencies — role checks still honour revocation and deactivation (no real DB)."""
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api.auth.dependencies import require_role
+from apps.api.auth.jwt import TokenClaims
+from apps.api.exceptions import ForbiddenException, UnauthorizedException
+from apps.api.models.user import User, UserRole
+
+
+def _session_returning(user: User) -> AsyncSession:
+    db = AsyncSession()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [user]
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def _admin(**overrides) -> User:
+    fields = {"id": uuid.uuid4(), "email": "a@test.com", "full_name": "A",
+              "role": UserRole.ADMIN, "is_active": True, "token_revision": 0}
+    fields.update(overrides)
+    return User(**fields)
+
+
+def _claims(user: User, role: str | None = "admin", revision: int = 0) -> TokenClaims:
+    return TokenClaims(user_id=user.id, role=role, revision=revision, exp=4102444800.0)
+
+
+@pytest.mark.asyncio
+async def test_require_role_accepts_a_current_admin():
+    user = _admin()
+    claims = _claims(user)
+    assert await require_role(UserRole.ADMIN)(claims, _session_returning(user)) is claims
+
+
+@pytest.mark.asyncio
+async def test_require_role_refuses_other_roles_without_a_query():
+    user = _admin(role=UserRole.VIEWER)
+    db = _session_returning(user)
+    with pytest.raises(ForbiddenException):
+        await require_role(UserRole.ADMIN)(_claims(user, role="viewer"), db)
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("user_overrides", "error"),
+    [
+        ({"token_revision": 1}, UnauthorizedException),   # token revoked by a revision bump
+        ({"is_active": False}, UnauthorizedException),    # account deactivated
+        ({"role": UserRole.VIEWER}, ForbiddenException),  # demoted since the token was issued
+    ],
+)
+async def test_require_role_refuses_admin_tokens_the_user_row_no_longer_backs(user_overrides, error):
+    user = _admin(**user_overrides)
+    with pytest.raises(error):
+        await require_role(UserRole.ADMIN)(_claims(user), _session_returning(user))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("stored_role", "allowed"), [(UserRole.ADMIN, True), (UserRole.VIEWER, False)])
+async def test_require_role_falls_back_to_the_stored_role_for_roleless_tokens(stored_role, allowed):
+    # Tokens issued before roles were embedded carry role=None
+    user = _admin(role=stored_role)
+    claims = _claims(user, role=None)
+    checker = require_role(UserRole.ADMIN)
+    if allowed:
+        assert await checker(claims, _session_returning(user)) is claims
+    else:
+        with pytest.raises(ForbiddenException):
+            await checker(claims, _session_returning(user))
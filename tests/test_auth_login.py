@@ -0,0 +1,44 @@
+"""Auth routes — login timing, user serialization."""
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from apps.api.exceptions import UnauthorizedException
+from apps.api.models.user import User, UserRole
+from apps.api.routes import auth as auth_routes
+
+
+def test_dummy_hash_is_a_real_bcrypt_hash():
+    assert auth_routes._DUMMY_HASH.startswith("$2b$12$")
+    assert len(auth_routes._DUMMY_HASH) == 60
+
+
+async def test_unknown_email_verifies_dummy_hash_every_time():
+    form = SimpleNamespace(username="nobody@example.com", password="secret123")
+    verify = AsyncMock(return_value=False)
+    get_by_email = AsyncMock(return_value=None)
+    with patch.object(auth_routes, "verify_password", verify), \
+            patch.object(auth_routes.user_repo, "get_by_email", get_by_email):
+        for _ in range(2):
+            with pytest.raises(UnauthorizedException):
+                await auth_routes.login(form_data=form, db=MagicMock())
+
+    # Each attempt pays for a bcrypt check and looks the email up afresh, so
+    # an account registered on another worker can log in straight away
+    assert verify.await_count == 2
+    verify.assert_awaited_with("secret123", auth_routes._DUMMY_HASH)
+    assert get_by_email.await_count == 2
+
+
+def test_user_to_response_copies_public_fields_only():
+    user = User(
+        id=uuid.uuid4(), created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc),
+        email="a@example.com", full_name="A", role=UserRole.VIEWER, is_active=True,
+        hashed_password="$2b$12$secret", llm_api_key="sk-secret",
+    )
+    dumped = auth_routes._user_to_response(user).model_dump()
+    assert dumped["email"] == "a@example.com" and dumped["role"] == UserRole.VIEWER
+    assert "hashed_password" not in dumped and "llm_api_key" not in dumped
@@ -0,0 +1,115 @@
+"""Chat repository — deferred commits and batched message inserts."""
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api.models.chat import MessageRole
+from apps.api.repositories.chat import chat_message_repo, chat_session_repo
+
+
+def _session() -> MagicMock:
+    db = MagicMock(spec=AsyncSession)
+    db.execute = AsyncMock()
+    db.commit = AsyncMock()
+    db.flush = AsyncMock()
+    db.refresh = AsyncMock()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_add_message_commits_without_refresh():
+    db = _session()
+    message = await chat_message_repo.add_message(db, uuid4(), MessageRole.USER, "hi")
+    assert message.content == "hi"
+    db.add.assert_called_once_with(message)
+    db.commit.assert_awaited_once()
+    db.refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_add_message_commit_false_only_flushes():
+    db = _session()
+    await chat_message_repo.add_message(db, uuid4(), MessageRole.USER, "hi", commit=False)
+    db.flush.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_returns_ids_from_one_insert():
+    db = _session()
+    ids = [uuid4(), uuid4()]
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = ids
+    db.execute.return_value = result
+    session_id = uuid4()
+    rows = [
+        {"session_id": session_id, "role": MessageRole.USER, "content": "a"},
+        {"session_id": session_id, "role": MessageRole.ASSISTANT, "content": "b"},
+    ]
+    assert await chat_message_repo.bulk_save(db, rows) == ids
+    db.execute.assert_awaited_once()
+    assert db.execute.call_args.args[1] == rows
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_skips_empty():
+    db = _session()
+    assert await chat_message_repo.bulk_save(db, []) == []
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_by_id_issues_one_delete():
+    db = _session()
+    result = MagicMock()
+    result.rowcount = 1
+    db.execute.return_value = result
+    assert await chat_session_repo.delete_by_id(db, uuid4()) is True
+    db.execute.assert_awaited_once()
+    assert str(db.execute.call_args.args[0]).startswith("DELETE FROM chat_sessions")
+    db.delete.assert_not_called()
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_summaries_select_only_listed_columns():
+    db = _session()
+    result = MagicMock()
+    result.all.return_value = []
+    db.execute.return_value = result
+    await chat_session_repo.get_by_sandbox_summary(db, uuid4(), limit=10)
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    columns = sql.split("FROM")[0]
+    assert "chat_sessions.title" in columns
+    assert "chat_sessions.user_id" not in columns
+    assert "ORDER BY chat_sessions.created_at DESC, chat_sessions.id DESC" in sql
+
+
+@pytest.mark.asyncio
+async def test_session_summaries_count_all_matches_on_the_first_page():
+    db = _session()
+    result = MagicMock()
+    result.all.return_value = [MagicMock(total=73)]
+    db.execute.return_value = result
+    rows, total = await chat_session_repo.get_by_sandbox_summary(db, uuid4(), limit=1)
+    assert len(rows) == 1
+    assert total == 73
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "count(*) OVER ()" in sql
+
+
+@pytest.mark.asyncio
+async def test_session_summaries_skip_the_count_on_cursor_pages():
+    db = _session()
+    result = MagicMock()
+    result.all.return_value = []
+    db.execute.return_value = result
+    after = (datetime(2026, 10, 16, tzinfo=timezone.utc), uuid4())
+    assert await chat_session_repo.get_by_sandbox_summary(db, uuid4(), after=after) == ([], None)
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "OVER" not in sql
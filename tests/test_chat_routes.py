@@ -0,0 +1,61 @@
+"""Chat routes — message history served as Postgres-built JSON."""
+import json
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import Text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api.repositories.chat import _MESSAGES_JSON, chat_message_repo
+from apps.api.routes.chat import _json_with_messages
+
+
+def test_messages_are_spliced_into_the_response_body():
+    session_id = uuid.uuid4()
+    created_at = datetime(2026, 10, 16, 8, 30, tzinfo=timezone.utc)
+    messages = b'[{"id":"x","role":"user","content":"hi"}]'
+    response = _json_with_messages({"id": session_id, "created_at": created_at}, messages)
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {
+        "id": str(session_id),
+        "created_at": created_at.isoformat(),
+        "messages": [{"id": "x", "role": "user", "content": "hi"}],
+    }
+
+
+def test_messages_json_is_aggregated_in_order_by_postgres():
+    sql = str(_MESSAGES_JSON.compile(dialect=postgresql.dialect()))
+    assert "json_agg(json_build_object(" in sql
+    assert "ORDER BY chat_messages.created_at ASC" in sql
+    # Enum columns hold member names; the API returns the lowercase values
+    assert "lower(CAST(chat_messages.role AS TEXT))" in sql
+
+
+def test_messages_json_is_sent_to_the_driver_as_text():
+    # asyncpg decodes `json` values with json.loads (SQLAlchemy registers the
+    # codec), which would hand back a list; a `text` value arrives as str.
+    array = _MESSAGES_JSON.selected_columns[0]
+    assert isinstance(array.type, Text)
+    sql = str(_MESSAGES_JSON.compile(dialect=asyncpg.dialect()))
+    assert sql.startswith("SELECT CAST(coalesce(json_agg(")
+
+
+def test_messages_json_writes_created_at_like_orjson_utc_z():
+    compiled = _MESSAGES_JSON.compile(dialect=postgresql.dialect())
+    assert "'created_at', concat(to_char(timezone(" in str(compiled)
+    # Whole seconds drop the fraction, as orjson does
+    assert {'YYYY-MM-DD"T"HH24:MI:SS', ".US", "", "Z"} <= set(compiled.params.values())
+
+
+@pytest.mark.asyncio
+async def test_messages_as_json_returns_bytes_and_count():
+    db = MagicMock(spec=AsyncSession)
+    result = MagicMock()
+    # What asyncpg returns for the text-cast array: the encoded string
+    result.one.return_value = ('[{"id": "x"}]', 1)
+    db.execute = AsyncMock(return_value=result)
+    assert await chat_message_repo.messages_as_json(db, uuid.uuid4()) == (b'[{"id": "x"}]', 1)
@@ -0,0 +1,31 @@
+"""Worker pool sizing in the production entry point."""
+import pytest
+
+pytest.importorskip("uvicorn")
+
+from apps.api import __main__ as entrypoint  # noqa: E402
+
+
+@pytest.fixture
+def pool_settings(monkeypatch):
+    def configure(pool_size: int, max_overflow: int, max_connections: int) -> None:
+        monkeypatch.setattr(entrypoint.settings, "db_pool_size", pool_size)
+        monkeypatch.setattr(entrypoint.settings, "db_max_overflow", max_overflow)
+        monkeypatch.setattr(entrypoint.settings, "db_max_connections", max_connections)
+
+    return configure
+
+
+def test_pool_limits_unchanged_when_workers_fit_the_budget(pool_settings):
+    pool_settings(20, 10, 90)
+    assert entrypoint._worker_pool_limits(3) == (20, 10)
+
+
+@pytest.mark.parametrize("workers", [4, 8, 16, 64, 200])
+def test_pool_limits_keep_all_workers_within_the_budget(pool_settings, workers):
+    pool_settings(20, 10, 90)
+    pool_size, max_overflow = entrypoint._worker_pool_limits(workers)
+    assert pool_size >= 1
+    assert max_overflow >= 0
+    if workers <= 90:
+        assert workers * (pool_size + max_overflow) <= 90
@@ -28,3 +28,105 @@ async def test_publish_calls_bus_when_set():
     assert d["event_type"] == "remediations.pending"
     assert d["payload"] == {"remediation_id": "r-1", "incident_id": "i-1"}
     assert "timestamp" in d
+
+
+@pytest.mark.asyncio
+async def test_handle_alerts_bulk_dedups_in_one_pipeline_and_inserts_once():
+    import uuid
+    from unittest.mock import patch
+
+    from apps.api.services import event_service as module
+    from events.schemas import AlertEvent
+
+    project_id = str(uuid.uuid4())
+
+    def alert(name, fingerprint):
+        return AlertEvent(
+            source="alertmanager", alert_name=name, severity="critical", labels={},
+            annotations={}, project_id=project_id, fingerprint=fingerprint,
+        )
+
+    events = [alert("A", "fp-a"), alert("B", "fp-seen"), alert("C", ""), alert("D", "fp-a")]
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True, None, None])  # fp-a new; fp-seen and the 2nd fp-a not
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value = pipe
+    bus = MagicMock()
+    bus.publish = AsyncMock()
+    ids = [uuid.uuid4(), uuid.uuid4()]
+
+    known = {uuid.UUID(project_id)}
+    with patch.object(event_service, "_get_redis", AsyncMock(return_value=redis_client)), \
+            patch.object(module.project_repo, "existing_ids", AsyncMock(return_value=known)), \
+            patch.object(module.incident_repo, "bulk_create", AsyncMock(return_value=ids)) as bulk_create:
+        event_service._event_bus = bus
+        out = await event_service.handle_alerts_bulk(MagicMock(), events)
+
+    assert out == ids
+    assert pipe.set.call_count == 3
+    rows = bulk_create.await_args.args[1]
+    assert [row["title"] for row in rows] == ["A", "C"]
+    assert rows[0]["project_id"] == uuid.UUID(project_id)
+    assert bus.publish.await_count == 2
+    assert bus.publish.await_args_list[1].args[1].incident_id == str(ids[1])
+    event_service._event_bus = None
+
+
+@pytest.mark.asyncio
+async def test_handle_alerts_bulk_skips_alerts_for_unknown_projects():
+    import uuid
+    from unittest.mock import patch
+
+    from apps.api.services import event_service as module
+    from events.schemas import AlertEvent
+
+    known, unknown = uuid.uuid4(), uuid.uuid4()
+    events = [
+        AlertEvent(
+            source="alertmanager", alert_name=name, severity="critical", labels={},
+            annotations={}, project_id=str(project_id), fingerprint="",
+        )
+        for name, project_id in [("A", known), ("B", unknown)]
+    ]
+    ids = [uuid.uuid4()]
+
+    with patch.object(module.project_repo, "existing_ids", AsyncMock(return_value={known})), \
+            patch.object(module.incident_repo, "bulk_create", AsyncMock(return_value=ids)) as bulk_create:
+        out = await event_service.handle_alerts_bulk(MagicMock(), events)
+
+    assert out == ids
+    assert [row["title"] for row in bulk_create.await_args.args[1]] == ["A"]
+
+
+@pytest.mark.asyncio
+async def test_handle_alerts_bulk_clears_dedup_keys_when_the_insert_fails():
+    import uuid
+    from unittest.mock import patch
+
+    from apps.api.services import event_service as module
+    from events.schemas import AlertEvent
+
+    project_id = uuid.uuid4()
+    events = [
+        AlertEvent(
+            source="alertmanager", alert_name=name, severity="critical", labels={},
+            annotations={}, project_id=str(project_id), fingerprint=fingerprint,
+        )
+        for name, fingerprint in [("A", "fp-a"), ("B", "fp-b")]
+    ]
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True, True])
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value = pipe
+    redis_client.delete = AsyncMock()
+
+    with patch.object(event_service, "_get_redis", AsyncMock(return_value=redis_client)), \
+            patch.object(module.project_repo, "existing_ids", AsyncMock(return_value={project_id})), \
+            patch.object(module.incident_repo, "bulk_create", AsyncMock(side_effect=RuntimeError)):
+        with pytest.raises(RuntimeError):
+            await event_service.handle_alerts_bulk(MagicMock(), events)
+
+    # A retry of the same webhook must not be dropped as a duplicate
+    redis_client.delete.assert_awaited_once_with("alert:dedup:fp-a", "alert:dedup:fp-b")
@@ -19,3 +19,10 @@ def test_health_name_and_version(client: TestClient):
     data = client.get("/health").json()
     assert isinstance(data["name"], str)
     assert isinstance(data["version"], str)
+
+
+def test_db_pool_health_reports_pool_stats(client: TestClient):
+    data = client.get("/health/db").json()
+    assert data["pool_size"] > 0
+    assert data["checked_out"] == 0
+    assert "status" in data
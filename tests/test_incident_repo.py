@@ -0,0 +1,81 @@
+"""Incident repository — eager loads and list columns."""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from apps.api.database import Base
+from apps.api.models.incident import Diagnosis, Incident, Remediation
+from apps.api.repositories.incident import incident_repo
+
+
+@pytest.mark.asyncio
+async def test_get_with_details_raises_on_unloaded_relationships():
+    # Real ORM loading against SQLite: only the tables get_with_details reads
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[Incident.__table__, Diagnosis.__table__, Remediation.__table__]
+    )
+    incident_id, now = uuid4(), datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(insert(Incident.__table__).values(
+            id=incident_id, created_at=now, updated_at=now, title="t",
+            severity="MEDIUM", status="OPEN", source="manual", project_id=uuid4(),
+        ))
+
+    with Session(engine) as sync_db:
+        db = MagicMock(spec=AsyncSession)
+        db.get = AsyncMock(side_effect=sync_db.get)
+        incident = await incident_repo.get_with_details(db, incident_id)
+
+        assert incident.diagnosis is None and incident.remediation is None
+        with pytest.raises(InvalidRequestError):
+            incident.project
+
+
+@pytest.mark.asyncio
+async def test_get_with_details_and_owner_single_query():
+    incident, owner_id = object(), uuid4()
+    db = MagicMock(spec=AsyncSession)
+    result = MagicMock()
+    result.first.return_value = SimpleNamespace(Incident=incident, owner_id=owner_id)
+    db.execute = AsyncMock(return_value=result)
+
+    assert await incident_repo.get_with_details_and_owner(db, uuid4()) == (incident, owner_id)
+    db.execute.assert_awaited_once()
+    sql = str(db.execute.call_args.args[0])
+    assert "JOIN projects" in sql
+    assert "LEFT OUTER JOIN diagnoses" in sql and "LEFT OUTER JOIN remediations" in sql
+
+
+@pytest.mark.asyncio
+async def test_get_with_details_and_owner_missing():
+    db = MagicMock(spec=AsyncSession)
+    result = MagicMock()
+    result.first.return_value = None
+    db.execute = AsyncMock(return_value=result)
+    assert await incident_repo.get_with_details_and_owner(db, uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_list_by_project_selects_only_response_columns():
+    from sqlalchemy.dialects import postgresql
+
+    from apps.api.schemas.incident import IncidentResponse
+
+    result = MagicMock()
+    result.all.return_value = []
+    db = MagicMock(spec=AsyncSession)
+    db.execute = AsyncMock(return_value=result)
+    await incident_repo.list_by_project(db, uuid4())
+
+    columns = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect())).split("FROM")[0]
+    for name in IncidentResponse.model_fields.keys() - {"diagnosis", "remediation"}:
+        assert f"incidents.{name}" in columns
+    assert "incidents.alert_data" not in columns
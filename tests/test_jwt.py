@@ -0,0 +1,65 @@
+"""JWT create/decode — round trip, tampering, and the decode cache (no DB)."""
+import dataclasses
+import uuid
+
+import jwt
+
+from apps.api.config import settings
+from apps.api.auth.jwt import _decode_cache, clear_token_cache, create_access_token, decode_access_token
+from apps.api.models.user import User, UserRole
+
+
+def _user(**overrides) -> User:
+    fields = {"id": uuid.uuid4(), "role": UserRole.OPERATOR, "token_revision": 0}
+    fields.update(overrides)
+    return User(**fields)
+
+
+def test_round_trip_returns_claims():
+    user = _user(token_revision=3)
+    token, expires_in = create_access_token(user)
+    assert expires_in > 0
+    claims = decode_access_token(token)
+    assert claims.user_id == user.id
+    assert claims.role == "operator"
+    assert claims.revision == 3
+
+
+def test_invalid_token_returns_none():
+    assert decode_access_token("not.a.token") is None
+
+
+def test_decode_is_cached_by_signature():
+    token, _ = create_access_token(_user())
+    decode_access_token(token)
+    assert token.rsplit(".", 1)[-1] in _decode_cache
+
+
+def test_clear_token_cache():
+    token, _ = create_access_token(_user())
+    decode_access_token(token)
+    clear_token_cache()
+    assert token.rsplit(".", 1)[-1] not in _decode_cache
+    assert decode_access_token(token) is not None  # re-verified, not rejected
+
+
+def test_cached_entry_past_exp_is_rejected():
+    token, _ = create_access_token(_user())
+    claims = decode_access_token(token)
+    signature = token.rsplit(".", 1)[-1]
+    _decode_cache[signature] = dataclasses.replace(claims, exp=0.0)
+    assert decode_access_token(token) is None
+    assert signature not in _decode_cache
+
+
+def test_token_without_exp_is_rejected():
+    token = jwt.encode({"sub": str(uuid.uuid4())}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    assert decode_access_token(token) is None
+
+
+def test_hand_signed_token_verifies_with_pyjwt():
+    user = _user()
+    token, _ = create_access_token(user)
+    assert jwt.get_unverified_header(token) == {"alg": settings.jwt_algorithm, "typ": "JWT"}
+    payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    assert payload["sub"] == str(user.id)
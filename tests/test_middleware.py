@@ -0,0 +1,60 @@
+"""RequestIDMiddleware — request IDs and timing headers (no DB)."""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from apps.api import middleware
+from apps.api.middleware import RequestIDMiddleware, _AccessLogSampler, _IDPool
+
+
+@pytest.fixture
+def mw_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestIDMiddleware)
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_id_pool_hands_out_each_4_byte_slice_and_refills(monkeypatch):
+    batches = []
+
+    def fake_urandom(n: int) -> bytes:
+        # Batch k is the 32-bit counters k*1024 ... k*1024+1023, so IDs are predictable
+        first = len(batches) * (n // 4)
+        batches.append(n)
+        return b"".join((first + j).to_bytes(4, "big") for j in range(n // 4))
+
+    monkeypatch.setattr(middleware.os, "urandom", fake_urandom)
+    pool = _IDPool()
+    ids = [pool.next() for _ in range(3000)]  # > two 4 KB batches
+
+    assert ids == [f"{n:08x}" for n in range(3000)]
+    assert batches == [_IDPool._BATCH_BYTES] * 3
+
+
+def test_generates_request_id_when_missing(mw_client: TestClient):
+    r = mw_client.get("/ping")
+    assert len(r.headers["X-Request-ID"]) == 8
+    assert r.headers["X-Response-Time"].endswith("ms")
+
+
+def test_echoes_client_request_id(mw_client: TestClient):
+    r = mw_client.get("/ping", headers={"X-Request-ID": "trace-123"})
+    assert r.headers["X-Request-ID"] == "trace-123"
+
+
+def test_sampler_always_logs_errors():
+    sampler = _AccessLogSampler(sample_every=100, summary_seconds=30)
+    assert all(sampler.should_log("GET", "/x", 500, 10) for _ in range(50))
+
+
+def test_sampler_logs_warmup_then_one_in_n():
+    sampler = _AccessLogSampler(sample_every=5, summary_seconds=3600)
+    logged = [sampler.should_log("GET", "/x", 200, 10) for _ in range(30)]
+    assert all(logged[: _AccessLogSampler.WARMUP])
+    # After warmup, only every 5th request (by count) is logged
+    assert sum(logged[_AccessLogSampler.WARMUP:]) == 4
@@ -0,0 +1,27 @@
+"""Model column helpers — UUIDv7 primary keys and hex-as-bytes columns (no DB)."""
+import time
+
+from apps.api.models.base import _uuid7
+from apps.api.models.types import HexBytes
+
+
+def test_uuid7_sets_version_and_variant():
+    value = _uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_sorts_by_creation_time():
+    first = _uuid7()
+    time.sleep(0.002)
+    second = _uuid7()
+    assert first < second
+
+
+def test_hex_bytes_round_trips_hex_strings():
+    column_type = HexBytes()
+    sha = "9fceb02d0ae598e95dc970b74767f19372d61af8"
+    stored = column_type.process_bind_param(sha, None)
+    assert stored == bytes.fromhex(sha) and len(stored) == 20
+    assert column_type.process_result_value(stored, None) == sha
+    assert column_type.process_bind_param(None, None) is None
@@ -0,0 +1,109 @@
+"""Keyset pagination — cursor encoding and the (created_at, id) predicate."""
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from apps.api.exceptions import ComioException
+from apps.api.models.incident import Incident
+from apps.api.models.project import Project
+from apps.api.pagination import decode_cursor, encode_cursor, next_cursor
+from apps.api.repositories.incident import incident_repo
+from apps.api.repositories.project import project_repo
+
+
+def test_cursor_round_trips():
+    ts = datetime(2026, 10, 16, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor(ts, row_id)) == (ts, row_id)
+
+
+def test_decode_cursor_none_and_empty():
+    assert decode_cursor(None) is None
+    assert decode_cursor("") is None
+
+
+def test_decode_cursor_rejects_garbage():
+    with pytest.raises(ComioException) as exc:
+        decode_cursor("not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+def test_next_cursor_only_on_full_page():
+    rows = [SimpleNamespace(created_at=datetime.now(timezone.utc), id=uuid.uuid4()) for _ in range(3)]
+    assert next_cursor(rows, limit=5) is None
+    assert decode_cursor(next_cursor(rows, limit=3)) == (rows[-1].created_at, rows[-1].id)
+
+
+def test_newest_first_uses_row_comparison_instead_of_offset():
+    after = (datetime.now(timezone.utc), uuid.uuid4())
+    stmt = project_repo._newest_first(select(Project), skip=40, limit=20, after=after)
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "(projects.created_at, projects.id) < (" in sql
+    assert "ORDER BY projects.created_at DESC, projects.id DESC" in sql
+    assert "OFFSET" not in sql
+
+
+def test_newest_first_falls_back_to_offset():
+    sql = str(project_repo._newest_first(select(Project), skip=40, limit=20).compile(dialect=postgresql.dialect()))
+    assert "OFFSET" in sql
+
+
+@pytest.mark.asyncio
+async def test_list_with_total_reads_window_count_from_rows():
+    p1, p2 = MagicMock(spec=Project), MagicMock(spec=Project)
+    result = MagicMock()
+    result.all.return_value = [_Row(p1, 7), _Row(p2, 7)]
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+
+    items, total = await project_repo.list_by_owner(db, uuid.uuid4(), limit=2)
+    assert items == [p1, p2]
+    assert total == 7
+    db.execute.assert_called_once()
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "count(*) OVER ()" in sql
+
+
+@pytest.mark.asyncio
+async def test_list_by_project_is_one_query():
+    incident = MagicMock(spec=Incident)
+    result = MagicMock()
+    result.all.return_value = [_Row(incident, 1)]
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+
+    assert await incident_repo.list_by_project(db, uuid.uuid4(), limit=20) == ([incident], 1)
+    db.execute.assert_called_once()
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "count(*) OVER ()" in sql and "incidents.project_id" in sql
+
+
+@pytest.mark.asyncio
+async def test_list_with_total_skips_count_on_cursor_pages():
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+
+    items, total = await project_repo.list_by_owner(
+        db, uuid.uuid4(), after=(datetime.now(timezone.utc), uuid.uuid4())
+    )
+    assert (items, total) == ([], None)
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "OVER" not in sql
+
+
+class _Row(tuple):
+    """Stand-in for a Row of (entity, total)."""
+
+    def __new__(cls, entity, total):
+        return super().__new__(cls, (entity, total))
+
+    @property
+    def total(self):
+        return self[1]
@@ -0,0 +1,33 @@
+"""Password hashing — async round trip on the bcrypt pool (no DB)."""
+import asyncio
+
+from apps.api.auth.passwords import hash_password, verify_password
+
+
+async def test_hash_and_verify_round_trip():
+    hashed = await hash_password("MySecret123")
+    assert hashed.startswith("$2b$12$")
+    assert await verify_password("MySecret123", hashed)
+    assert not await verify_password("wrong", hashed)
+
+
+async def test_concurrent_hashes_are_salted():
+    first, second = await asyncio.gather(hash_password("same"), hash_password("same"))
+    assert first != second
+
+
+async def test_hashing_runs_on_the_bcrypt_pool(monkeypatch):
+    import threading
+
+    from apps.api.auth import passwords
+
+    seen = []
+    real = passwords._verify_password_sync
+
+    def spy(plain, hashed):
+        seen.append(threading.current_thread().name)
+        return real(plain, hashed)
+
+    monkeypatch.setattr(passwords, "_verify_password_sync", spy)
+    await verify_password("x", await hash_password("x"))
+    assert seen and seen[0].startswith("bcrypt")
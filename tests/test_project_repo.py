@@ -0,0 +1,79 @@
+"""Project repository — project + sandbox fetched in one JOIN."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import make_transient_to_detached
+
+from apps.api.models.project import Project
+from apps.api.repositories.project import project_repo
+
+
+def _session(row) -> MagicMock:
+    db = MagicMock(spec=AsyncSession)
+    result = MagicMock()
+    result.first.return_value = row
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_get_project_and_sandbox_single_query():
+    project, sandbox = object(), object()
+    db = _session(SimpleNamespace(Project=project, Sandbox=sandbox))
+    assert await project_repo.get_project_and_sandbox(db, uuid4()) == (project, sandbox)
+    db.execute.assert_awaited_once()
+    assert "LEFT OUTER JOIN sandboxes" in str(db.execute.call_args.args[0])
+
+
+@pytest.mark.asyncio
+async def test_get_project_and_sandbox_missing_project():
+    assert await project_repo.get_project_and_sandbox(_session(None), uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_served_from_identity_map():
+    # An engine that can't connect: any SQL would raise
+    engine = create_async_engine("postgresql+asyncpg://nobody@127.0.0.1:1/none")
+    db = AsyncSession(engine)
+    project = Project(id=uuid4(), name="p", owner_id=uuid4())
+    make_transient_to_detached(project)
+    db.add(project)
+
+    assert await project_repo.get_by_id(db, project.id) is project
+    await db.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_owner_id_is_cached_until_delete():
+    project_id, owner_id = uuid4(), uuid4()
+    db = MagicMock(spec=AsyncSession)
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = owner_id
+    result.rowcount = 1
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+
+    assert await project_repo.get_owner_id(db, project_id) == owner_id
+    assert await project_repo.get_owner_id(db, project_id) == owner_id
+    db.execute.assert_awaited_once()
+
+    await project_repo.delete_by_id(db, project_id)
+    await project_repo.get_owner_id(db, project_id)
+    assert db.execute.await_count == 3  # DELETE + a fresh owner lookup
+
+
+@pytest.mark.asyncio
+async def test_get_owner_id_missing_project_not_cached():
+    db = MagicMock(spec=AsyncSession)
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = None
+    db.execute = AsyncMock(return_value=result)
+    project_id = uuid4()
+
+    assert await project_repo.get_owner_id(db, project_id) is None
+    assert await project_repo.get_owner_id(db, project_id) is None
+    assert db.execute.await_count == 2
@@ -0,0 +1,33 @@
+"""RCA service — engine results mapped to Diagnosis rows."""
+import uuid
+
+from rca.schemas import Action, Diagnosis, DiagnosisCategory, Evidence
+
+from apps.api.services.rca_service import rca_service
+
+
+def test_to_model_copies_dataclass_fields_only():
+    evidence = Evidence(type="metric", source="prometheus", description="5xx rate", value=0.65)
+    result = Diagnosis(
+        root_cause="pool exhausted",
+        category=DiagnosisCategory.INFRASTRUCTURE,
+        confidence=0.8,
+        evidence=[evidence],
+        suggested_actions=[Action(description="raise pool size", priority="high")],
+        reasoning="errors track connection waits",
+    )
+    incident_id = uuid.uuid4()
+
+    model = rca_service.to_model(incident_id, result)
+
+    assert model.incident_id == incident_id
+    assert model.category == "infra"
+    assert model.explanation == "errors track connection waits"
+    assert model.evidence == [{
+        "type": "metric", "source": "prometheus", "description": "5xx rate",
+        "value": 0.65, "timestamp": None,
+    }]
+    assert model.evidence[0] is not evidence.__dict__  # a copy, not the dataclass's own dict
+    assert model.suggested_actions == [
+        {"description": "raise pool size", "priority": "high", "automated": False}
+    ]
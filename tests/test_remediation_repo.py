@@ -14,7 +14,7 @@ from apps.api.repositories.remediation import remediation_repo
 async def test_list_pending_for_user_returns_empty_when_none():
     db = MagicMock(spec=AsyncSession)
     result_mock = MagicMock()
-    result_mock.scalars.return_value.unique.return_value.all.return_value = []
+    result_mock.scalars.return_value.all.return_value = []
     db.execute = AsyncMock(return_value=result_mock)
     owner_id = uuid4()
     items = await remediation_repo.list_pending_for_user(db, owner_id, skip=0, limit=20, include_expired=False)
@@ -25,22 +25,68 @@ async def test_list_pending_for_user_returns_empty_when_none():
 @pytest.mark.asyncio
 async def test_get_by_id_with_incident_and_project_returns_none_when_not_found():
     db = MagicMock(spec=AsyncSession)
-    result_mock = MagicMock()
-    result_mock.scalar_one_or_none = MagicMock(return_value=None)
-    db.execute = AsyncMock(return_value=result_mock)
+    db.get = AsyncMock(return_value=None)
     out = await remediation_repo.get_by_id_with_incident_and_project(db, uuid4())
     assert out is None
-    db.execute.assert_called_once()
+    db.get.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_get_by_id_returns_remediation_when_found():
-    remediation = MagicMock(spec=Remediation)
-    remediation.id = uuid4()
+    remediation = Remediation(id=uuid4(), incident=None)
     db = MagicMock(spec=AsyncSession)
-    result_mock = MagicMock()
-    result_mock.scalar_one_or_none = MagicMock(return_value=remediation)
-    db.execute = AsyncMock(return_value=result_mock)
+    db.get = AsyncMock(return_value=remediation)
     out = await remediation_repo.get_by_id_with_incident_and_project(db, remediation.id)
     assert out is remediation
-    db.execute.assert_called_once()
+    db.get.assert_called_once()
+    assert "options" in db.get.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_refetches_when_identity_map_copy_lacks_relations():
+    # In the identity map, but loaded without its incident
+    cached = Remediation(id=uuid4())
+    fresh = Remediation(id=cached.id, incident=None)
+    db = MagicMock(spec=AsyncSession)
+    db.get = AsyncMock(side_effect=[cached, fresh])
+    out = await remediation_repo.get_by_id_with_incident_and_project(db, cached.id)
+    assert out is fresh
+    assert db.get.call_args.kwargs["populate_existing"] is True
+
+
+@pytest.mark.asyncio
+async def test_list_pending_for_user_loads_incident_and_project_from_the_join():
+    from sqlalchemy.dialects import postgresql
+
+    db = MagicMock(spec=AsyncSession)
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.all.return_value = []
+    db.execute = AsyncMock(return_value=result_mock)
+    await remediation_repo.list_pending_for_user(db, uuid4())
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    columns = sql.split("FROM")[0]
+    # Incident and project keys come back in the same SELECT — nothing else of theirs
+    assert "incidents.project_id" in columns
+    assert "projects.owner_id" in columns
+    assert "incidents.title" not in columns
+    assert "remediations.incident_id" not in columns
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("include_expired", [False, True])
+async def test_list_pending_for_user_matches_the_partial_index(include_expired):
+    from sqlalchemy.dialects import postgresql
+
+    db = MagicMock(spec=AsyncSession)
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.all.return_value = []
+    db.execute = AsyncMock(return_value=result_mock)
+    await remediation_repo.list_pending_for_user(db, uuid4(), include_expired=include_expired)
+    compiled = db.execute.call_args.args[0].compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    sql = str(compiled)
+    # Same predicate as ix_remediations_pending_keyset's WHERE (enum names are stored)
+    assert "remediations.status = 'PENDING'" in sql
+    # The 24h cutoff is a range on the index's leading column, only when excluding expired
+    assert ("remediations.created_at >=" in sql) is not include_expired
@@ -68,3 +68,86 @@ def test_remediations_list_query_params(client: TestClient, operator_user: User)
             assert isinstance(r.json(), list)
         finally:
             client.app.dependency_overrides.clear()
+
+
+def test_remediations_approve_rejects_viewer_token_without_loading_user(client: TestClient):
+    from apps.api.auth.jwt import create_access_token
+
+    db = MagicMock()
+    db.execute = AsyncMock()
+
+    async def override_get_db():
+        yield db
+
+    client.app.dependency_overrides[get_db] = override_get_db
+    token, _ = create_access_token(User(id=uuid.uuid4(), role=UserRole.VIEWER, token_revision=0))
+    try:
+        r = client.post(
+            f"/remediations/{uuid.uuid4()}/approve",
+            json={"comment": "ok"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert r.status_code == 403
+        db.execute.assert_not_awaited()
+    finally:
+        client.app.dependency_overrides.clear()
+
+
+def test_auth_dependencies_are_async():
+    # Plain `def` dependencies would be run in FastAPI's threadpool
+    import inspect
+
+    from apps.api.auth import get_current_user, get_token_claims, require_operator_or_admin, require_role
+
+    for dependency in (
+        get_current_user,
+        get_token_claims.__call__,
+        require_operator_or_admin,
+        require_role(UserRole.ADMIN),
+    ):
+        assert inspect.iscoroutinefunction(dependency)
+
+
+@pytest.mark.parametrize(
+    ("action", "service_name", "body"),
+    [
+        ("approve", "approve", {"comment": "ok"}),
+        ("reject", "reject", {"reason": "no"}),
+        ("apply", "apply", None),
+    ],
+)
+def test_remediation_actions_return_the_remediation(
+    client: TestClient, operator_user: User, action, service_name, body
+):
+    from datetime import datetime, timezone
+
+    from apps.api.auth import require_operator_or_admin
+    from apps.api.models.incident import Remediation, RemediationStatus
+    from apps.api.routes import remediations as remediations_module
+
+    now = datetime(2026, 10, 16, tzinfo=timezone.utc)
+    remediation = Remediation(
+        id=uuid.uuid4(), created_at=now, updated_at=now, fix_type="code_change",
+        diff="--- a\n+++ b\n", files_changed=["app.py"], explanation="fix", risk_level="low",
+        status=RemediationStatus.APPLIED, pr_url="https://github.com/o/r/pull/1", pr_number=1,
+        reviewed_by=operator_user.id, review_comment=None,
+    )
+
+    async def override_get_db():
+        yield MagicMock()
+
+    async def override_user():
+        return operator_user
+
+    client.app.dependency_overrides[get_db] = override_get_db
+    client.app.dependency_overrides[require_operator_or_admin] = override_user
+    with patch.object(
+        remediations_module, service_name, new_callable=AsyncMock, return_value=remediation
+    ):
+        try:
+            r = client.post(f"/remediations/{remediation.id}/{action}", json=body)
+            assert r.status_code == 200
+            assert r.json()["id"] == str(remediation.id)
+            assert r.json()["pr_number"] == 1
+        finally:
+            client.app.dependency_overrides.clear()
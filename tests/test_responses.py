@@ -0,0 +1,107 @@
+"""Response helpers — plain-dict payloads match the Pydantic schemas; ETags."""
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import orjson
+
+from apps.api.models.incident import (
+    Incident,
+    IncidentStatus,
+    Remediation,
+    RemediationStatus,
+    Severity,
+)
+from apps.api.responses import ORJSONResponse, attrs_to_dict
+from apps.api.routes.incidents import _incident_to_dict
+from apps.api.routes.remediations import _remediation_to_dict
+from apps.api.schemas.incident import IncidentResponse, RemediationResponse
+
+
+NOW = datetime(2026, 10, 16, 12, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+def _remediation():
+    return Remediation(
+        id=uuid.uuid4(),
+        created_at=NOW,
+        updated_at=NOW,
+        fix_type="code_change",
+        diff="--- a\n+++ b\n",
+        files_changed=["app.py"],
+        explanation="fix",
+        risk_level="low",
+        status=RemediationStatus.PENDING,
+        pr_url=None,
+        pr_number=None,
+        reviewed_by=uuid.uuid4(),
+        review_comment=None,
+    )
+
+
+def test_remediation_dict_renders_like_response_model():
+    remediation = _remediation()
+    rendered = ORJSONResponse(_remediation_to_dict(remediation)).body
+    expected = RemediationResponse.model_validate(remediation).model_dump_json().encode()
+    assert orjson.loads(rendered) == orjson.loads(expected)
+
+
+def test_incident_dict_includes_relations_in_schema_shape():
+    remediation = _remediation()
+    incident = Incident(
+        id=uuid.uuid4(),
+        created_at=NOW,
+        updated_at=NOW,
+        title="5xx spike",
+        description=None,
+        severity=Severity.HIGH,
+        status=IncidentStatus.OPEN,
+        source="manual",
+        project_id=uuid.uuid4(),
+        diagnosis=None,
+        remediation=remediation,
+    )
+
+    rendered = orjson.loads(ORJSONResponse(_incident_to_dict(incident, include_relations=True)).body)
+
+    assert rendered.keys() == IncidentResponse.model_fields.keys()
+    assert rendered["severity"] == "high"
+    assert rendered["diagnosis"] is None
+    assert rendered["remediation"] == orjson.loads(ORJSONResponse(_remediation_to_dict(remediation)).body)
+    assert orjson.loads(ORJSONResponse(_incident_to_dict(incident)).body)["remediation"] is None
+
+
+def test_utc_datetimes_use_z_suffix():
+    now = datetime(2026, 10, 16, tzinfo=timezone.utc)
+    assert ORJSONResponse({"t": now}).body == b'{"t":"2026-10-16T00:00:00Z"}'
+
+
+def test_attrs_to_dict():
+    obj = SimpleNamespace(a=1, b="x", c=None)
+    assert attrs_to_dict(("a", "c"))(obj) == {"a": 1, "c": None}
+    assert attrs_to_dict(["b"])(obj) == {"b": "x"}
+
+
+def test_etag_response_returns_304_when_the_client_has_the_same_body():
+    from starlette.requests import Request
+
+    from apps.api.responses import etag_response
+
+    def request(if_none_match=None):
+        headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+        return Request({"type": "http", "method": "GET", "headers": headers})
+
+    content = {"branch": "main", "modified": ["app.py"]}
+    first = etag_response(request(), content)
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert orjson.loads(first.body) == content
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        cached = etag_response(request(header), content)
+        assert cached.status_code == 304
+        assert cached.body == b""
+
+    changed = etag_response(request(etag), {**content, "modified": []})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
@@ -0,0 +1,107 @@
+"""Sandbox repository — status updates are a single UPDATE ... RETURNING + COMMIT."""
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api.models.base import BaseModel
+from apps.api.models.sandbox import Sandbox, SandboxStatus
+from apps.api.repositories.sandbox import sandbox_repo
+
+
+def test_models_fetch_server_defaults_via_returning():
+    # Lets update()/create() skip the post-commit refresh() SELECT
+    assert BaseModel.__mapper_args__["eager_defaults"] is True
+    assert Sandbox.__mapper__.eager_defaults is True
+
+
+@pytest.mark.asyncio
+async def test_update_status_commits_without_reloading():
+    sandbox = Sandbox(id=uuid4(), project_id=uuid4(), status=SandboxStatus.STOPPED)
+    db = MagicMock(spec=AsyncSession)
+    db.commit = AsyncMock()
+    db.refresh = AsyncMock()
+    db.execute = AsyncMock()
+
+    out = await sandbox_repo.update_status(db, sandbox, SandboxStatus.RUNNING)
+
+    assert out is sandbox
+    assert sandbox.status == SandboxStatus.RUNNING
+    db.commit.assert_awaited_once()
+    db.refresh.assert_not_awaited()
+    db.execute.assert_not_awaited()
+
+
+def _ref_session(row) -> MagicMock:
+    result = MagicMock()
+    result.first.return_value = row
+    db = MagicMock(spec=AsyncSession)
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_get_ref_is_cached_until_the_sandbox_is_updated():
+    project_id, owner_id = uuid4(), uuid4()
+    db = _ref_session((owner_id, uuid4(), "c1", SandboxStatus.RUNNING, "main"))
+
+    ref = await sandbox_repo.get_ref(db, project_id)
+    assert (ref.owner_id, ref.container_id, ref.status) == (owner_id, "c1", SandboxStatus.RUNNING)
+    assert await sandbox_repo.get_ref(db, project_id) is ref
+    db.execute.assert_awaited_once()
+
+    db.commit = AsyncMock()
+    sandbox = Sandbox(id=ref.sandbox_id, project_id=project_id, status=SandboxStatus.RUNNING)
+    await sandbox_repo.update_status(db, sandbox, SandboxStatus.STOPPED)
+    await sandbox_repo.get_ref(db, project_id)
+    assert db.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_ref_misses_share_one_query():
+    import asyncio
+
+    project_id = uuid4()
+    db = _ref_session((uuid4(), uuid4(), "c1", SandboxStatus.RUNNING, "main"))
+    result = db.execute.return_value
+
+    async def slow_execute(*args):
+        await asyncio.sleep(0.01)  # Let the other lookups pile up behind this one
+        return result
+
+    db.execute.side_effect = slow_execute
+
+    refs = await asyncio.gather(*(sandbox_repo.get_ref(db, project_id) for _ in range(5)))
+
+    assert len({id(ref) for ref in refs}) == 1
+    db.execute.assert_awaited_once()
+    sandbox_repo.invalidate_ref(project_id)
+
+
+@pytest.mark.asyncio
+async def test_get_ref_does_not_cache_a_missing_sandbox():
+    project_id = uuid4()
+    db = _ref_session((uuid4(), None, None, None, None))
+
+    assert (await sandbox_repo.get_ref(db, project_id)).sandbox_id is None
+    await sandbox_repo.get_ref(db, project_id)
+    assert db.execute.await_count == 2
+    assert await sandbox_repo.get_ref(_ref_session(None), uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_branch_update_is_one_commit_and_evicts_the_ref():
+    # create_branch records the new branch with this single update
+    project_id = uuid4()
+    db = _ref_session((uuid4(), uuid4(), "c1", SandboxStatus.RUNNING, "main"))
+    await sandbox_repo.get_ref(db, project_id)
+
+    db.commit = AsyncMock()
+    sandbox = Sandbox(id=uuid4(), project_id=project_id, status=SandboxStatus.RUNNING, git_branch="main")
+    await sandbox_repo.update(db, sandbox, git_branch="fix/login")
+
+    assert sandbox.git_branch == "fix/login"
+    db.commit.assert_awaited_once()
+    await sandbox_repo.get_ref(db, project_id)
+    assert db.execute.await_count == 2
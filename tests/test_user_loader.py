@@ -0,0 +1,82 @@
+"""UserLoader — batching and the cross-request user cache (no real DB)."""
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api.auth.user_loader import UserLoader, _user_cache, invalidate_user
+from apps.api.models.user import User, UserRole
+
+
+def _user() -> User:
+    return User(
+        id=uuid.uuid4(),
+        email="a@test.com",
+        full_name="A",
+        role=UserRole.VIEWER,
+        is_active=True,
+    )
+
+
+def _session_returning(users: list[User]) -> AsyncSession:
+    db = AsyncSession()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = users
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_query():
+    u1, u2 = _user(), _user()
+    db = _session_returning([u1, u2])
+    loader = UserLoader(db)
+    got = await asyncio.gather(loader.load(u1.id), loader.load(u2.id), loader.load(u1.id))
+    assert got == [u1, u2, u1]
+    db.execute.assert_awaited_once()
+    invalidate_user(u1.id)
+    invalidate_user(u2.id)
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_query_and_returns_session_copy():
+    user = _user()
+    await UserLoader(_session_returning([user])).load(user.id)
+    assert user.id in _user_cache
+
+    db = _session_returning([])
+    cached = await UserLoader(db).load(user.id)
+    db.execute.assert_not_awaited()
+    assert cached is not user
+    assert cached.id == user.id and cached.email == user.email
+    assert cached in db
+    invalidate_user(user.id)
+
+
+@pytest.mark.asyncio
+async def test_missing_user_returns_none_and_is_not_cached():
+    user_id = uuid.uuid4()
+    assert await UserLoader(_session_returning([])).load(user_id) is None
+    assert user_id not in _user_cache
+
+
+def test_for_session_reuses_one_loader_per_session():
+    db = AsyncSession()
+    loader = UserLoader.for_session(db)
+    assert UserLoader.for_session(db) is loader
+    assert UserLoader.for_session(AsyncSession()) is not loader
+
+
+@pytest.mark.asyncio
+async def test_pending_dispatch_task_is_referenced_until_done():
+    user = _user()
+    loader = UserLoader(_session_returning([user]))
+    load = asyncio.ensure_future(loader.load(user.id))
+    await asyncio.sleep(0)
+    assert len(loader._dispatch_tasks) == 1
+    assert await load is user
+    await asyncio.sleep(0)
+    assert not loader._dispatch_tasks
+    invalidate_user(user.id)
@@ -0,0 +1,21 @@
+"""Vector tuning — HNSW parameter tiers by corpus size (no DB)."""
+from apps.api.services.vector_tuning import configure_hnsw_params
+
+
+def test_small_corpus_uses_pgvector_defaults():
+    assert configure_hnsw_params(0) == {"m": 16, "ef_construction": 64, "ef_search": 40}
+    assert configure_hnsw_params(99_999)["m"] == 16
+
+
+def test_medium_corpus():
+    assert configure_hnsw_params(100_000) == {"m": 24, "ef_construction": 100, "ef_search": 100}
+
+
+def test_large_corpus():
+    assert configure_hnsw_params(5_000_000) == {"m": 32, "ef_construction": 128, "ef_search": 200}
+
+
+def test_returns_a_copy():
+    params = configure_hnsw_params(10)
+    params["m"] = 999
+    assert configure_hnsw_params(10)["m"] == 16
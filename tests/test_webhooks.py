@@ -0,0 +1,51 @@
+"""Alertmanager webhook — whole batches, parsed with orjson; event service mocked."""
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from apps.api.database import get_db
+from apps.api.routes import webhooks
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(webhooks.router)
+
+    async def override_get_db():
+        yield MagicMock()
+
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def test_receive_alert_handles_every_alert_in_the_batch():
+    project_id = str(uuid.uuid4())
+    payload = {
+        "status": "firing",
+        "alerts": [
+            {"labels": {"alertname": "A", "comio_project_id": project_id}, "fingerprint": "a"},
+            {"labels": {"alertname": "NoProject"}, "fingerprint": "n"},
+            {"labels": {"alertname": "B", "comio_project_id": project_id}, "fingerprint": "b"},
+        ],
+    }
+    ids = [uuid.uuid4(), uuid.uuid4()]
+
+    with patch.object(
+        webhooks.event_service, "handle_alerts_bulk", AsyncMock(return_value=ids)
+    ) as handle:
+        r = _client().post("/webhooks/alert", json=payload)
+
+    assert r.status_code == 200
+    assert r.json()["incident_ids"] == [str(i) for i in ids]
+    events = handle.await_args.args[1]
+    assert [e.alert_name for e in events] == ["A", "B"]
+    assert events[0].timestamp == events[1].timestamp
+    assert events[0].id != events[1].id
+
+
+def test_test_alert_tolerates_an_empty_body():
+    r = _client().post("/webhooks/test-alert")
+    assert r.status_code == 200
+    assert r.json()["status"] == "error"